@@ -11,7 +11,7 @@ import os
 from fastapi import Depends
 
 from neuromosaic.results_db.interface import IResultsDB
-from neuromosaic.results_db.db import get_db_instance
+from neuromosaic.results_db.db import close_db_instance, get_db_instance
 from neuromosaic.orchestrator.interface import IOrchestrator
 from neuromosaic.orchestrator.orchestrator import get_orchestrator_instance
 from neuromosaic.arch_space.vector_representation import IArchitectureEncoder
@@ -51,7 +51,7 @@ async def on_shutdown():
     global _db_instance, _orchestrator_instance, _encoder_instance
 
     if _db_instance:
-        # Add cleanup if needed
+        close_db_instance()
         _db_instance = None
 
     if _orchestrator_instance:
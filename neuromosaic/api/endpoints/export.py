@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 import csv
 import io
-import json
+import orjson
 
 from neuromosaic.api.dependencies import get_db
 from neuromosaic.api.schemas import ExportRequest
@@ -101,7 +101,7 @@ async def export_data(
         }
 
         if request.include_config:
-            data["config"] = json.dumps(exp.config)  # Flatten config for CSV
+            data["config"] = orjson.dumps(exp.config).decode()  # Flatten for CSV
 
         if request.include_metrics and exp.metrics:
             for metric_name, metric_value in exp.metrics.items():
@@ -21,7 +21,7 @@ Example:
     >>> new_spec = mutated.decode()
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Callable, List, Optional, Tuple
 import numpy as np
 from dataclasses import dataclass
 import logging
@@ -31,6 +31,67 @@ from ..utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# Compiled decode functions, keyed by the (bounds, categorical_dims) schema
+_DECODERS: Dict[tuple, Callable[[np.ndarray], Dict[str, Any]]] = {}
+
+
+def _decode_choice(one_hot: np.ndarray, param: str, choices: List[str]) -> str:
+    """Map a one-hot slice to its categorical value, defaulting if ambiguous."""
+    # Get the index of the maximum value
+    choice_idx = int(np.argmax(one_hot))  # Convert to int for consistent indexing
+    # Ensure the one-hot encoding is valid (has a clear maximum)
+    if np.sum(one_hot > 0.9) != 1:  # Check if there's exactly one strong activation
+        logger.warning(f"Ambiguous one-hot encoding for {param}: {one_hot}")
+        # Use the first choice as default if encoding is ambiguous
+        choice_idx = 0
+    return choices[choice_idx]
+
+
+def _compile_decoder(
+    bounds: Dict[str, Tuple[float, float]], categorical_dims: Dict[str, List[str]]
+) -> Callable[[np.ndarray], Dict[str, Any]]:
+    """
+    Build a straight-line decode function for one architecture schema.
+
+    The schema loop runs once here, emitting one statement per parameter
+    with its offset and range baked in as literals, so decoding a vector
+    does no schema iteration or per-field branching.
+    """
+    key = (
+        tuple((param, tuple(bound)) for param, bound in bounds.items()),
+        tuple((param, tuple(choices)) for param, choices in categorical_dims.items()),
+    )
+    decoder = _DECODERS.get(key)
+    if decoder is not None:
+        return decoder
+
+    def literal(number: Any) -> str:
+        # repr() of numpy scalars is not valid source; floats round-trip exactly
+        return repr(number) if isinstance(number, int) else repr(float(number))
+
+    lines = ["def _decode(v):", "    spec = {}"]
+    current_idx = 0
+    for param, (min_val, max_val) in bounds.items():
+        value = f"v[{current_idx}] * {literal(max_val - min_val)} + {literal(min_val)}"
+        # Round integer parameters
+        if isinstance(min_val, int) and isinstance(max_val, int):
+            value = f"round({value})"
+        lines.append(f"    spec[{param!r}] = {value}")
+        current_idx += 1
+    for param, choices in categorical_dims.items():
+        end_idx = current_idx + len(choices)
+        lines.append(
+            f"    spec[{param!r}] = _decode_choice("
+            f"v[{current_idx}:{end_idx}], {param!r}, {list(choices)!r})"
+        )
+        current_idx = end_idx
+    lines.append("    return spec")
+
+    namespace = {"_decode_choice": _decode_choice}
+    exec(compile("\n".join(lines), "<arch_decode>", "exec"), namespace)
+    decoder = _DECODERS[key] = namespace["_decode"]
+    return decoder
+
 
 class IArchitectureEncoder(ABC):
     """
@@ -190,6 +251,10 @@ class ArchitectureVector:
         # Initialize vector with zeros
         self.vector = np.zeros(dimensions)
 
+        # Specialized decode function, compiled on first decode()
+        self._decoder: Optional[Callable[[np.ndarray], Dict[str, Any]]] = None
+        self._decoder_schema: Optional[tuple] = None
+
     def encode(self, arch_spec: Dict[str, Any]) -> None:
         """
         Encode an architecture specification into a vector representation.
@@ -249,43 +314,24 @@ class ArchitectureVector:
         2. Converts one-hot encodings back to categorical choices
         3. Ensures all values are valid
 
+        Decoding runs a function generated once per schema, shared by all
+        vectors with the same bounds and categorical dimensions.
+
         Returns:
             Dictionary containing architecture parameters
         """
         if self.vector is None:
             raise ValueError("Vector not initialized. Call encode() first.")
 
-        arch_spec = {}
-        current_idx = 0
-
-        # Handle continuous dimensions
-        for param, (min_val, max_val) in self.bounds.items():
-            # Denormalize from [0, 1]
-            value = self.vector[current_idx] * (max_val - min_val) + min_val
-            # Round integer parameters
-            if isinstance(min_val, int) and isinstance(max_val, int):
-                value = round(value)
-            arch_spec[param] = value
-            current_idx += 1
-
-        # Handle categorical dimensions
-        for param, choices in self.categorical_dims.items():
-            one_hot = self.vector[current_idx : current_idx + len(choices)]
-            # Get the index of the maximum value
-            choice_idx = int(
-                np.argmax(one_hot)
-            )  # Convert to int for consistent indexing
-            # Ensure the one-hot encoding is valid (has a clear maximum)
-            if (
-                np.sum(one_hot > 0.9) != 1
-            ):  # Check if there's exactly one strong activation
-                logger.warning(f"Ambiguous one-hot encoding for {param}: {one_hot}")
-                # Use the first choice as default if encoding is ambiguous
-                choice_idx = 0
-            arch_spec[param] = choices[choice_idx]
-            current_idx += len(choices)
+        # Recompile only if the schema objects were replaced since last decode
+        schema = (self.bounds, self.categorical_dims)
+        if self._decoder_schema is None or any(
+            a is not b for a, b in zip(schema, self._decoder_schema)
+        ):
+            self._decoder = _compile_decoder(self.bounds, self.categorical_dims)
+            self._decoder_schema = schema
 
-        return arch_spec
+        return self._decoder(self.vector)
 
     def mutate(self, mutation_rate: float = 0.1) -> "ArchitectureVector":
         """
@@ -72,7 +72,7 @@ import yaml
 import logging
 import asyncio
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping
 import shutil
 import uvicorn
 import multiprocessing
@@ -286,7 +286,7 @@ async def _run_quickstart(
             best_result = None
             best_accuracy = -1
             for result in results:
-                if result and isinstance(result, dict):
+                if result and isinstance(result, Mapping):
                     metrics = result.get("metrics", {})
                     accuracy = (
                         metrics.get("accuracy", 0) if isinstance(metrics, dict) else 0
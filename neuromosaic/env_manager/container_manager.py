@@ -3,7 +3,7 @@ Container management for isolated experiment execution.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
@@ -64,6 +64,18 @@ class ContainerManager(ABC):
         if "environment" in spec and not isinstance(spec["environment"], dict):
             raise ValueError("Environment in spec must be a dictionary")
 
+    async def prepare_base_image(self, image: Optional[str] = None) -> None:
+        """
+        Make sure the base image is available before a container is created.
+
+        Called while code is still being generated so that slow image pulls
+        overlap with LLM latency. The default implementation does nothing.
+
+        Args:
+            image: Image to prepare, defaults to the configured base image
+        """
+        pass
+
     @abstractmethod
     async def create_container(self, spec: Dict[str, Any]) -> str:
         """
@@ -110,6 +122,41 @@ class ContainerManager(ABC):
         """
         pass
 
+    async def reset_workspace(self, container_id: str, spec: Dict[str, Any]) -> None:
+        """
+        Replace the workspace of a running container with new code.
+
+        Lets a warm container be reused for the next experiment instead of
+        creating a new one.
+
+        Args:
+            container_id: ID of the container to reuse
+            spec: Container specification, as for create_container()
+
+        Raises:
+            NotImplementedError: If this runtime cannot reuse containers
+            RuntimeError: If the workspace cannot be reset
+        """
+        raise NotImplementedError
+
+    async def pause_container(self, container_id: str) -> None:
+        """
+        Freeze an idle container. The default implementation does nothing.
+
+        Args:
+            container_id: ID of the container to pause
+        """
+        pass
+
+    async def unpause_container(self, container_id: str) -> None:
+        """
+        Resume a container frozen by pause_container().
+
+        Args:
+            container_id: ID of the container to resume
+        """
+        pass
+
     @abstractmethod
     async def cleanup_container(self, container_id: str) -> None:
         """
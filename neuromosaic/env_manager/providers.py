@@ -3,6 +3,7 @@ Docker-based container management implementation.
 """
 
 import asyncio
+import functools
 import logging
 from typing import Dict, Any, Optional, List
 import docker
@@ -11,6 +12,7 @@ import psutil
 import time
 
 from .container_manager import ContainerManager
+from ..utils.exceptions import ContainerDaemonError
 from ..utils.logging import setup_logger
 
 logger = setup_logger(__name__)
@@ -64,6 +66,32 @@ class DockerContainerManager(ContainerManager):
             },
         )
 
+    async def prepare_base_image(self, image: Optional[str] = None) -> None:
+        """
+        Pull the base image in a worker thread if it is not present locally.
+
+        Args:
+            image: Image to prepare, defaults to the configured base image
+
+        Raises:
+            RuntimeError: If the image cannot be pulled
+        """
+        image = image or self.image
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._ensure_image, image)
+        except DockerException as e:
+            logger.error(f"Failed to prepare image {image}: {str(e)}")
+            raise RuntimeError(f"Image preparation failed: {str(e)}")
+
+    def _ensure_image(self, image: str) -> None:
+        """Pull an image unless it already exists locally."""
+        try:
+            self.client.images.get(image)
+        except NotFound:
+            logger.info(f"Pulling image {image}")
+            self.client.images.pull(image)
+
     async def create_container(self, spec: Dict[str, Any]) -> str:
         """
         Create a new Docker container for experiment execution.
@@ -82,63 +110,51 @@ class DockerContainerManager(ContainerManager):
         Raises:
             RuntimeError: If container creation fails
         """
+        loop = asyncio.get_running_loop()
         try:
-            # Ensure image exists
-            try:
-                self.client.images.get(self.image)
-            except NotFound:
-                logger.info(f"Pulling image {self.image}")
-                self.client.images.pull(self.image)
-
-            # Merge environment variables
-            env_vars = {**self.environment, **spec.get("environment", {})}
-
-            # Create container config
-            container_config = {
-                "image": self.image,
-                "command": "sleep infinity",  # Keep container running
-                "detach": True,
-                "mem_limit": self.memory_limit,
-                "working_dir": "/workspace",
-                "environment": env_vars,
-                "volumes": {
-                    spec.get("data_path", "/tmp"): {"bind": "/data", "mode": "ro"}
-                },
-                "healthcheck": self.health_check,
-                "network": spec.get("network", self.network),
-            }
-
-            # Add GPU configuration if enabled
-            if self.gpu:
-                container_config["device_requests"] = [
-                    docker.types.DeviceRequest(count=-1, capabilities=[["gpu"]])
-                ]
+            # The Docker SDK blocks, so keep it off the event loop
+            return await loop.run_in_executor(None, self._start_container, spec)
+        except DockerException as e:
+            logger.error(f"Failed to create container: {str(e)}")
+            await loop.run_in_executor(None, self._raise_if_daemon_down, e)
+            raise RuntimeError(f"Container creation failed: {str(e)}")
 
-            # Create and start container
-            container = self.client.containers.run(**container_config)
-            logger.info(f"Created container {container.id[:12]}")
+    def _start_container(self, spec: Dict[str, Any]) -> str:
+        """Create, start and load a container; blocking, see create_container()."""
+        # Ensure image exists
+        self._ensure_image(self.image)
+
+        # Merge environment variables
+        env_vars = {**self.environment, **spec.get("environment", {})}
+
+        # Create container config
+        container_config = {
+            "image": self.image,
+            "command": "sleep infinity",  # Keep container running
+            "detach": True,
+            "mem_limit": self.memory_limit,
+            "working_dir": "/workspace",
+            "environment": env_vars,
+            "volumes": {spec.get("data_path", "/tmp"): {"bind": "/data", "mode": "ro"}},
+            "healthcheck": self.health_check,
+            "network": spec.get("network", self.network),
+        }
 
-            # Wait for container to be healthy
-            self._wait_for_healthy(container)
+        # Add GPU configuration if enabled
+        if self.gpu:
+            container_config["device_requests"] = [
+                docker.types.DeviceRequest(count=-1, capabilities=[["gpu"]])
+            ]
 
-            # Copy code and requirements
-            self._copy_to_container(container.id, spec["code"], "/workspace/main.py")
-            if "requirements" in spec:
-                self._copy_to_container(
-                    container.id, spec["requirements"], "/workspace/requirements.txt"
-                )
-                # Install requirements
-                exit_code, output = container.exec_run(
-                    "pip install -r requirements.txt", workdir="/workspace"
-                )
-                if exit_code != 0:
-                    raise RuntimeError(f"Failed to install requirements: {output}")
+        # Create and start container
+        container = self.client.containers.run(**container_config)
+        logger.info(f"Created container {container.id[:12]}")
 
-            return container.id
+        # Wait for container to be healthy
+        self._wait_for_healthy(container)
 
-        except DockerException as e:
-            logger.error(f"Failed to create container: {str(e)}")
-            raise RuntimeError(f"Container creation failed: {str(e)}")
+        self._load_workspace(container, spec)
+        return container.id
 
     async def run_container(
         self, container_id: str, command: str = "python main.py"
@@ -161,19 +177,31 @@ class DockerContainerManager(ContainerManager):
         Raises:
             RuntimeError: If command execution fails
         """
+        loop = asyncio.get_running_loop()
         try:
-            container = self.client.containers.get(container_id)
+            container = await loop.run_in_executor(
+                None, self.client.containers.get, container_id
+            )
             start_time = time.time()
 
             # Start resource monitoring
-            monitoring_task = asyncio.create_task(self._monitor_container(container))
-
-            # Execute command with timeout
-            exit_code, output = container.exec_run(
-                command, workdir="/workspace", demux=True
+            finished = asyncio.Event()
+            monitoring_task = asyncio.create_task(
+                self._monitor_container(container, finished)
             )
 
-            # Stop monitoring
+            # Execute command in a worker thread so the loop stays free while
+            # it trains, e.g. to suggest the next architecture
+            try:
+                exit_code, output = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        container.exec_run, command, workdir="/workspace", demux=True
+                    ),
+                )
+            finally:
+                # Stop monitoring
+                finished.set()
             metrics = await monitoring_task
 
             execution_time = time.time() - start_time
@@ -198,31 +226,95 @@ class DockerContainerManager(ContainerManager):
 
         except DockerException as e:
             logger.error(f"Failed to run container: {str(e)}")
+            await loop.run_in_executor(None, self._raise_if_daemon_down, e)
             raise RuntimeError(f"Container execution failed: {str(e)}")
 
-    async def cleanup_container(self, container_id: str) -> None:
+    async def reset_workspace(self, container_id: str, spec: Dict[str, Any]) -> None:
         """
-        Clean up a container after experiment completion.
+        Wipe /workspace in a running container and load new code into it.
 
         Args:
-            container_id: ID of container to clean up
+            container_id: ID of the container to reuse
+            spec: Dictionary containing code and optional requirements
 
         Raises:
-            RuntimeError: If cleanup fails
+            RuntimeError: If the workspace cannot be reset
         """
+        self._validate_spec(spec)
+        loop = asyncio.get_running_loop()
         try:
-            container = self.client.containers.get(container_id)
+            await loop.run_in_executor(None, self._reset_workspace, container_id, spec)
+        except DockerException as e:
+            logger.error(f"Failed to reset container workspace: {str(e)}")
+            await loop.run_in_executor(None, self._raise_if_daemon_down, e)
+            raise RuntimeError(f"Workspace reset failed: {str(e)}")
+
+    def _reset_workspace(self, container_id: str, spec: Dict[str, Any]) -> None:
+        """Clear and reload /workspace; blocking, see reset_workspace()."""
+        container = self.client.containers.get(container_id)
+        exit_code, output = container.exec_run(
+            ["sh", "-c", "rm -rf /workspace/* /workspace/.[!.]*"],
+            workdir="/",
+        )
+        if exit_code != 0:
+            raise RuntimeError(f"Failed to clear workspace: {output}")
+        self._load_workspace(container, spec)
 
-            # Get logs before cleanup
-            logs = container.logs()
-            logger.debug(f"Container logs before cleanup: {logs.decode()}")
+    async def pause_container(self, container_id: str) -> None:
+        """
+        Freeze an idle container with docker pause.
 
-            # Stop container gracefully
-            container.stop(timeout=10)
+        Args:
+            container_id: ID of the container to pause
 
-            # Remove container and any associated volumes
-            container.remove(force=True, v=True)
+        Raises:
+            RuntimeError: If the container cannot be paused
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            container = await loop.run_in_executor(
+                None, self.client.containers.get, container_id
+            )
+            await loop.run_in_executor(None, container.pause)
+        except DockerException as e:
+            logger.error(f"Failed to pause container: {str(e)}")
+            await loop.run_in_executor(None, self._raise_if_daemon_down, e)
+            raise RuntimeError(f"Container pause failed: {str(e)}")
+
+    async def unpause_container(self, container_id: str) -> None:
+        """
+        Resume a paused container with docker unpause.
 
+        Args:
+            container_id: ID of the container to resume
+
+        Raises:
+            RuntimeError: If the container cannot be resumed
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            container = await loop.run_in_executor(
+                None, self.client.containers.get, container_id
+            )
+            await loop.run_in_executor(None, container.unpause)
+        except DockerException as e:
+            logger.error(f"Failed to unpause container: {str(e)}")
+            await loop.run_in_executor(None, self._raise_if_daemon_down, e)
+            raise RuntimeError(f"Container unpause failed: {str(e)}")
+
+    async def cleanup_container(self, container_id: str) -> None:
+        """
+        Clean up a container after experiment completion.
+
+        Args:
+            container_id: ID of container to clean up
+
+        Raises:
+            RuntimeError: If cleanup fails
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._remove_container, container_id)
             logger.info(f"Cleaned up container {container_id[:12]}")
 
         except NotFound:
@@ -231,6 +323,57 @@ class DockerContainerManager(ContainerManager):
             logger.error(f"Failed to cleanup container: {str(e)}")
             raise RuntimeError(f"Container cleanup failed: {str(e)}")
 
+    def _remove_container(self, container_id: str) -> None:
+        """Stop and remove a container; blocking, see cleanup_container()."""
+        container = self.client.containers.get(container_id)
+
+        # Get logs before cleanup
+        logs = container.logs()
+        logger.debug(f"Container logs before cleanup: {logs.decode()}")
+
+        # Stop container gracefully
+        container.stop(timeout=10)
+
+        # Remove container and any associated volumes
+        container.remove(force=True, v=True)
+
+    def _raise_if_daemon_down(self, error: DockerException) -> None:
+        """
+        Distinguish a dead Docker daemon from a per-container failure.
+
+        Raises:
+            ContainerDaemonError: If the daemon no longer answers a ping
+        """
+        try:
+            self.client.ping()
+        except DockerException:
+            raise ContainerDaemonError(
+                f"Docker daemon unavailable: {str(error)}"
+            ) from error
+
+    def _load_workspace(self, container, spec: Dict[str, Any]) -> None:
+        """
+        Copy code and requirements into /workspace and install requirements.
+
+        Args:
+            container: Docker container object
+            spec: Dictionary containing code and optional requirements
+
+        Raises:
+            RuntimeError: If requirements fail to install
+        """
+        self._copy_to_container(container.id, spec["code"], "/workspace/main.py")
+        if "requirements" in spec:
+            self._copy_to_container(
+                container.id, spec["requirements"], "/workspace/requirements.txt"
+            )
+            # Install requirements
+            exit_code, output = container.exec_run(
+                "pip install -r requirements.txt", workdir="/workspace"
+            )
+            if exit_code != 0:
+                raise RuntimeError(f"Failed to install requirements: {output}")
+
     def _copy_to_container(
         self, container_id: str, content: str, dest_path: str
     ) -> None:
@@ -297,20 +440,27 @@ class DockerContainerManager(ContainerManager):
             time.sleep(1)
         raise RuntimeError("Container failed to become healthy")
 
-    async def _monitor_container(self, container) -> Dict[str, Any]:
+    async def _monitor_container(
+        self, container, finished: asyncio.Event
+    ) -> Dict[str, Any]:
         """
-        Monitor container resource usage.
+        Monitor container resource usage, sampling once a second.
 
         Args:
             container: Docker container object
+            finished: Set when the monitored command has exited
 
         Returns:
-            Dictionary containing resource usage metrics
+            Dictionary containing resource usage metrics, empty if the
+            command exited before the first sample
         """
+        loop = asyncio.get_running_loop()
         metrics = {"cpu_percent": [], "memory_usage": [], "io_stats": []}
 
-        while container.status == "running":
-            stats = container.stats(stream=False)
+        while not finished.is_set():
+            stats = await loop.run_in_executor(
+                None, functools.partial(container.stats, stream=False)
+            )
 
             # Calculate CPU usage
             cpu_delta = (
@@ -333,8 +483,13 @@ class DockerContainerManager(ContainerManager):
             metrics["memory_usage"].append(memory_usage)
             metrics["io_stats"].append(io_stats)
 
-            await asyncio.sleep(1)
+            try:
+                await asyncio.wait_for(finished.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
 
+        if not metrics["cpu_percent"]:
+            return {}
         return {
             "cpu_percent_avg": sum(metrics["cpu_percent"])
             / len(metrics["cpu_percent"]),
@@ -18,6 +18,7 @@ Example:
 
 from typing import Dict, Any, Optional, List
 from abc import ABC, abstractmethod
+import hashlib
 import logging
 from pathlib import Path
 
@@ -111,6 +112,21 @@ class CodeGenerator(ABC):
         """Initialize the prompt template from configuration."""
         raise NotImplementedError
 
+    @property
+    def template_version(self) -> str:
+        """
+        Short digest identifying this generator and its prompt template.
+
+        Changes whenever the template text changes, so it can be used to
+        invalidate caches of previously generated code.
+        """
+        template = getattr(getattr(self, "prompt_template", None), "template", "")
+        source = f"{self.__class__.__name__}:{template}"
+        return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+
+    async def aclose(self) -> None:
+        """Release network clients held by the generator, if any."""
+
     @abstractmethod
     async def generate_code(
         self, arch_spec: Dict[str, Any], max_retries: int = 3
@@ -7,8 +7,9 @@ import logging
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+import httpx
 import openai
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from ..codegen_interface import CodeGenerator, PromptTemplate
 from ...utils.logging import setup_logger
@@ -62,7 +63,8 @@ class OpenAICodeGenerator(CodeGenerator):
     Code generator implementation using OpenAI's API.
 
     Attributes:
-        client: AsyncOpenAI client instance
+        client: AsyncOpenAI client instance, shared by all requests and
+            limited to config["max_connections"] connections
         model: Name of the OpenAI model to use
         temperature: Sampling temperature for generation
     """
@@ -77,7 +79,18 @@ class OpenAICodeGenerator(CodeGenerator):
                 "OpenAI API key is required. Set it in the config or OPENAI_API_KEY environment variable."
             )
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Every request reuses this client's pooled keep-alive connections
+        max_connections = config.get("max_connections") or 100
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=60,
+                )
+            ),
+        )
         self.model = config.get("model", "gpt-4")
         self.temperature = config.get("temperature", 0.7)
 
@@ -85,6 +98,10 @@ class OpenAICodeGenerator(CodeGenerator):
         """Initialize the OpenAI-specific prompt template."""
         self.prompt_template = OpenAIPromptTemplate()
 
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool."""
+        await self.client.close()
+
     async def generate_code(
         self, arch_spec: Dict[str, Any], max_retries: int = 3
     ) -> str:
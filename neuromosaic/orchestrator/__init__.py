@@ -2,6 +2,6 @@
 Orchestrator module for managing the neural architecture search lifecycle.
 """
 
-from .orchestrator import Orchestrator
+from .orchestrator import CycleResult, Orchestrator
 
-__all__ = ["Orchestrator"]
+__all__ = ["Orchestrator", "CycleResult"]
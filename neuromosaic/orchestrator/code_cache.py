@@ -0,0 +1,283 @@
+"""
+Caches for LLM-generated experiment code.
+
+Code generation is the slowest step of a search cycle, so generated code is
+cached at two levels:
+- SemanticCodeCache: in-memory LRU (L1) keyed by spec digest, with a
+  nearest-neighbour fallback over architecture vectors
+- CodeCacheStore: SQLite table (L2) that survives orchestrator restarts
+
+Example:
+    >>> store = CodeCacheStore("codegen_cache.db")
+    >>> cache = SemanticCodeCache(max_size=1000)
+    >>> for key, value, vector, namespace in store.recent(100):
+    ...     cache.put(key, value, vector, namespace)
+"""
+
+from typing import Any, List, Optional, Tuple
+from collections import OrderedDict
+from pathlib import Path
+import sqlite3
+import time
+
+import numpy as np
+
+from ..utils import sqlite as sqlite_tuning
+
+
+class SemanticCodeCache:
+    """
+    LRU cache of generated code with a nearest-neighbour fallback.
+
+    Entries are keyed by an exact spec digest. On an exact miss, the cached
+    architecture vector with the highest cosine similarity to the query is
+    used if it clears the threshold, so near-duplicate suggestions from the
+    search strategy reuse code instead of calling the LLM again. Only
+    entries in the same namespace (prompt template version) are matched.
+
+    Attributes:
+        max_size (int): Maximum number of entries before LRU eviction
+        threshold (float): Minimum cosine similarity for a semantic hit
+        ttl_seconds (Optional[float]): Entry lifetime, or None for no expiry
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        threshold: float = 0.98,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.max_size = max_size
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, namespace, unit vector or None, insertion time)
+        self._entries: OrderedDict = OrderedDict()
+        self._index: Optional[Tuple[List[bytes], np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, key: bytes, vector: Optional[np.ndarray] = None, namespace: str = ""
+    ) -> Optional[Any]:
+        """
+        Look up a value by exact key, then by vector similarity.
+
+        Args:
+            key: Exact-match key
+            vector: Optional architecture vector for the similarity lookup
+            namespace: Only entries stored under this namespace match
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._expired(entry):
+            self._remove(key)
+        elif entry is not None and entry[1] == namespace:
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        unit = self._unit(vector)
+        if unit is None:
+            return None
+        index = self._build_index(len(unit))
+        if index is None:
+            return None
+        keys, matrix = index
+        similarity = matrix @ unit
+        for i in np.argsort(similarity)[::-1]:
+            if similarity[i] < self.threshold:
+                break
+            entry = self._entries[keys[i]]
+            if entry[1] != namespace:
+                continue
+            if self._expired(entry):
+                self._remove(keys[i])
+                continue
+            self._entries.move_to_end(keys[i])
+            return entry[0]
+        return None
+
+    def put(
+        self,
+        key: bytes,
+        value: Any,
+        vector: Optional[np.ndarray] = None,
+        namespace: str = "",
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Exact-match key
+            value: Value to cache
+            vector: Optional architecture vector used for similarity lookups
+            namespace: Namespace the entry belongs to
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (value, namespace, self._unit(vector), time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self._index = None
+
+    def _expired(self, entry: Tuple[Any, str, Optional[np.ndarray], float]) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and time.monotonic() - entry[3] > self.ttl_seconds
+        )
+
+    def _remove(self, key: bytes) -> None:
+        del self._entries[key]
+        self._index = None
+
+    def _build_index(self, dim: int) -> Optional[Tuple[List[bytes], np.ndarray]]:
+        """Stack the unit vectors of matching dimension into one matrix."""
+        if self._index is None or self._index[1].shape[1] != dim:
+            keys = [
+                k
+                for k, e in self._entries.items()
+                if e[2] is not None and len(e[2]) == dim
+            ]
+            if not keys:
+                return None
+            self._index = (keys, np.stack([self._entries[k][2] for k in keys]))
+        return self._index
+
+    @staticmethod
+    def _unit(vector: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if not isinstance(vector, np.ndarray) or vector.ndim != 1:
+            return None
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+
+class CodeCacheStore:
+    """
+    SQLite-backed store of generated code, shared across sessions.
+
+    Rows are keyed by the spec digest and the namespace (prompt template
+    version) the code was generated under, so a template change never
+    serves stale code.
+
+    Attributes:
+        path (Path): Location of the SQLite database file
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        sqlite_tuning.tune_connection(self._conn)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS codegen_cache ("
+                "hash TEXT NOT NULL, model TEXT NOT NULL, spec BLOB, "
+                "code TEXT NOT NULL, code_version TEXT NOT NULL, vector BLOB, "
+                "created_at INTEGER NOT NULL, PRIMARY KEY (hash, model))"
+            )
+
+    def get(self, key: bytes, namespace: str) -> Optional[Tuple[Tuple[str, str], Any]]:
+        """
+        Look up cached code.
+
+        Args:
+            key: Spec digest
+            namespace: Prompt template version the code must match
+
+        Returns:
+            Tuple of ((code, code_version), vector), or None on a miss
+        """
+        row = self._conn.execute(
+            "SELECT code, code_version, vector FROM codegen_cache "
+            "WHERE hash = ? AND model = ?",
+            (key.hex(), namespace),
+        ).fetchone()
+        if row is None:
+            return None
+        return (row[0], row[1]), self._load_vector(row[2])
+
+    def put(
+        self,
+        key: bytes,
+        value: Tuple[str, str],
+        spec: bytes,
+        vector: Optional[np.ndarray] = None,
+        namespace: str = "",
+    ) -> None:
+        """
+        Write generated code through to disk.
+
+        Args:
+            key: Spec digest
+            value: Tuple of (code, code_version)
+            spec: Canonical spec JSON the digest was computed from
+            vector: Optional architecture vector for similarity lookups
+            namespace: Prompt template version the code was generated under
+        """
+        code, code_version = value
+        blob = (
+            np.asarray(vector, dtype=np.float64).tobytes()
+            if isinstance(vector, np.ndarray)
+            else None
+        )
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO codegen_cache "
+                "(hash, model, spec, code, code_version, vector, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key.hex(),
+                    namespace,
+                    spec,
+                    code,
+                    code_version,
+                    blob,
+                    int(time.time()),
+                ),
+            )
+
+    def recent(
+        self, limit: int, namespace: Optional[str] = None
+    ) -> List[Tuple[bytes, Tuple[str, str], Any, str]]:
+        """
+        Return the most recently written entries, oldest first.
+
+        Args:
+            limit: Maximum number of entries
+            namespace: Only return entries of this namespace if given
+
+        Returns:
+            List of (key, (code, code_version), vector, namespace) tuples,
+            ordered so that replaying them into an LRU keeps the newest hot
+        """
+        query = "SELECT hash, code, code_version, vector, model FROM codegen_cache"
+        params: Tuple[Any, ...] = ()
+        if namespace is not None:
+            query += " WHERE model = ?"
+            params = (namespace,)
+        query += " ORDER BY created_at DESC, rowid DESC LIMIT ?"
+        rows = self._conn.execute(query, params + (limit,)).fetchall()
+        return [
+            (bytes.fromhex(h), (code, version), self._load_vector(blob), model)
+            for h, code, version, blob, model in reversed(rows)
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        sqlite_tuning.optimize(self._conn)
+        self._conn.close()
+
+    @staticmethod
+    def _load_vector(blob: Optional[bytes]) -> Optional[np.ndarray]:
+        return None if blob is None else np.frombuffer(blob, dtype=np.float64)
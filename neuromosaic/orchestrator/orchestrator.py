@@ -14,36 +14,214 @@ Improvements:
 - Strict checks on missing fields or invalid returns
 """
 
-from typing import Dict, Any, Optional, List, Union, TYPE_CHECKING
+from typing import (
+    Dict,
+    Any,
+    AsyncIterator,
+    Iterator,
+    Mapping,
+    Optional,
+    List,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+    get_type_hints,
+)
 from pathlib import Path
+from collections import OrderedDict, deque
+from contextvars import ContextVar
 import asyncio
+import bisect
+import hashlib
+import json
 import logging
-from datetime import datetime
-from dataclasses import asdict
+import time
+from datetime import datetime, timezone
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+import numpy as np
+import orjson
 
 from ..arch_space import ArchitectureVector
 from ..llm_code_gen import CodeGenerator
-from ..env_manager import ContainerManager
-from ..results_db.db import ResultsDB as ResultsDBImpl
+from ..env_manager.container_manager import ContainerManager
+from ..utils.exceptions import ContainerDaemonError
 from ..utils.logging import setup_logger
-from ..utils.version_control import VersionControl
+from .code_cache import CodeCacheStore, SemanticCodeCache
 from .interface import IOrchestrator
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
+    from ..results_db.db import ResultsDB
     from ..utils.config import Config
+    from ..utils.version_control import VersionControl
     from .strategies import RandomSearch, BayesianOptimization
 
 logger = setup_logger(__name__)
 
-_orchestrator_instance: Optional[IOrchestrator] = None
+# Per-context orchestrator, so concurrent tasks or sessions can each own one
+_orchestrator_cv: "ContextVar[Optional[IOrchestrator]]" = ContextVar(
+    "_orchestrator", default=None
+)
+
+# Maximum number of decoded specs memoized per Orchestrator
+_DECODE_CACHE_SIZE = 4096
+
+# Write-behind queue bound and the most runs saved per DB transaction
+_DB_WRITE_QUEUE_SIZE = 256
+_DB_WRITE_BATCH_SIZE = 64
+
+# Reported for cycles a batch cancelled after losing the container daemon
+_CANCELLED_RESULT = {"status": "cancelled", "error": "Container daemon unavailable"}
+
+# Keys every results dict passed to submit_results() must carry
+_REQUIRED_RESULT_FIELDS = frozenset({"architecture_id", "metrics"})
+
+
+@lru_cache(maxsize=None)
+def _strategy_cls(strategy_type: str) -> type:
+    """
+    Resolve a search strategy class by its config name, importing it once.
+
+    Raises:
+        ValueError: If the strategy type is unknown.
+    """
+    if strategy_type == "random":
+        from .strategies import RandomSearch
+
+        return RandomSearch
+    if strategy_type == "bayesian_optimization":
+        from .strategies import BayesianOptimization
+
+        return BayesianOptimization
+    raise ValueError(f"Unknown search strategy type: {strategy_type}")
+
+
+@lru_cache(maxsize=None)
+def _llm_provider_cls(provider: str) -> type:
+    """
+    Resolve a code generator class by LLM provider name, importing it once.
+
+    Raises:
+        ValueError: If the provider is unknown.
+    """
+    if provider == "openai":
+        from ..llm_code_gen.providers import OpenAICodeGenerator
+
+        return OpenAICodeGenerator
+    if provider == "llama":
+        from ..llm_code_gen.providers import LlamaCodeGenerator
+
+        return LlamaCodeGenerator
+    raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+@lru_cache(maxsize=None)
+def _container_runtime_cls(runtime: str) -> type:
+    """
+    Resolve a container manager class by runtime name, importing it once.
+
+    Podman exposes a Docker-compatible API, so both runtimes share a manager.
+
+    Raises:
+        ValueError: If the runtime is unknown.
+    """
+    if runtime in ("docker", "podman"):
+        from ..env_manager.providers import DockerContainerManager
+
+        return DockerContainerManager
+    raise ValueError(f"Unknown container runtime: {runtime}")
+
+
+@dataclass(eq=False)
+class CycleResult(Mapping):
+    """
+    Outcome of a successful search cycle.
+
+    A slotted record, several times smaller than the equivalent dict when a
+    large batch holds many of them. It is also a read-only mapping, so it
+    can be indexed like a result dict.
+
+    Attributes:
+        architecture_id: Content-derived ID of the architecture
+        metrics: Metrics reported by the training run
+        code_version: Commit hash of the generated code
+        arch_spec: Decoded architecture specification
+    """
+
+    __slots__ = ("architecture_id", "metrics", "code_version", "arch_spec")
+
+    architecture_id: str
+    metrics: Dict[str, Any]
+    code_version: str
+    arch_spec: Dict[str, Any]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+
+@dataclass
+class ExperimentState:
+    """
+    Tracking state of a scheduled experiment.
+
+    Attributes:
+        status: "scheduled", "running", "stopping", "stopped", "completed"
+            or "failed"
+        start_time: ISO 8601 UTC time the run started, if it has
+        task: Task running the experiment
+        logs: (POSIX timestamp, message) entries in timestamp order
+        log_timestamps: Timestamps of logs, kept separately for bisection
+        results: Results of the completed run
+        error: Error message of the failed run
+    """
+
+    __slots__ = (
+        "status",
+        "start_time",
+        "task",
+        "logs",
+        "log_timestamps",
+        "results",
+        "error",
+    )
+
+    status: str
+    start_time: Optional[str]
+    task: Optional["asyncio.Task"]
+    logs: List[Tuple[float, str]]
+    log_timestamps: List[float]
+    results: Optional[CycleResult]
+    error: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public view of the state, without the task handle."""
+        return {
+            "status": self.status,
+            "start_time": self.start_time,
+            "results": self.results,
+            "error": self.error,
+            "logs": [message for _, message in self.logs],
+        }
 
 
 def get_orchestrator_instance(
     config: Optional[Union[Dict[str, Any], "Config"]] = None
 ) -> IOrchestrator:
     """
-    Get or create a global orchestrator instance (singleton pattern).
+    Get or create the orchestrator instance for the current context.
+
+    The instance is held in a ContextVar: asyncio tasks inherit the instance
+    of the context they were created from, and one created inside a task
+    stays private to that task.
 
     Args:
         config: Optional configuration for the orchestrator (dict or Config object).
@@ -56,9 +234,8 @@ def get_orchestrator_instance(
         - If config is a dict, we create a base config from environment and potentially
           merge the dict (skipped in this minimal example).
     """
-    global _orchestrator_instance
-
-    if _orchestrator_instance is None:
+    orchestrator = _orchestrator_cv.get()
+    if orchestrator is None:
         if config is None:
             from ..utils.config import Config
 
@@ -70,9 +247,10 @@ def get_orchestrator_instance(
             # TODO: merge config dict with base_config if desired
             config = base_config
 
-        _orchestrator_instance = Orchestrator(config)
+        orchestrator = Orchestrator(config)
+        _orchestrator_cv.set(orchestrator)
 
-    return _orchestrator_instance
+    return orchestrator
 
 
 class Orchestrator(IOrchestrator):
@@ -88,90 +266,113 @@ class Orchestrator(IOrchestrator):
 
     Attributes:
         config (Config): Configuration object with search_strategy, llm, container, etc.
+        experiment_id (Optional[str]): Experiment whose GP posterior is persisted
+            to, and restored from, the results DB.
     """
 
-    def __init__(self, config: "Config"):
+    def __init__(self, config: "Config", experiment_id: Optional[str] = None):
         """
         Initialize the orchestrator with configuration.
 
         Args:
             config: Configuration object with all necessary settings.
+            experiment_id: Optional experiment ID used to persist and restore the
+                Bayesian optimization posterior across orchestrator restarts.
         """
         self.config = config
+        self.experiment_id = experiment_id
+        self._gp_state_restored = False
         self._setup_components()
+        # Generated (code, code_version) keyed by spec digest and arch vector,
+        # in memory (L1) and optionally written through to SQLite (L2)
+        cache_config = self.config.llm.get("cache") or {}
+        enabled = cache_config.get("enabled", True)
+        self._spec_cache = SemanticCodeCache(
+            max_size=cache_config.get("max_size", 1000) if enabled else 0,
+            threshold=cache_config.get("threshold", 0.98),
+            ttl_seconds=cache_config.get("ttl_seconds"),
+        )
+        self._code_store: Optional[CodeCacheStore] = None
+        if enabled and cache_config.get("path"):
+            self._code_store = CodeCacheStore(cache_config["path"])
+            warm_entries = cache_config.get("warm_entries", 100)
+            for key, value, vector, namespace in self._code_store.recent(
+                min(warm_entries, self._spec_cache.max_size)
+            ):
+                self._spec_cache.put(key, value, vector, namespace)
+        # Idle containers kept warm for reuse between cycles
+        self._reuse_strategy = self.config.container.get("reuse_strategy", "none")
+        self._pool_size = self.config.container.get("pool_size", 4)
+        self._container_pool: "deque[str]" = deque()
+        # Upper bound on concurrent cycles in a parallel batch
+        orchestrator_config = getattr(self.config, "orchestrator", None) or {}
+        self._max_parallel: Optional[int] = orchestrator_config.get("max_parallel")
+        # vector bytes -> (bounds, categorical_dims, decoded spec), LRU-bounded
+        self._decode_cache: OrderedDict = OrderedDict()
+        # Code generation in progress, shared by concurrent identical requests
+        self._inflight_codegen: Dict[Tuple[bytes, str], asyncio.Future] = {}
+        # Run records awaiting a background DB write; created inside the loop
+        self._db_write_queue: Optional[asyncio.Queue] = None
+        self._db_writer_task: Optional[asyncio.Task] = None
+        # Suggestion made while the previous cycle's container was running
+        self._next_arch_task: Optional[asyncio.Task] = None
         # Track actively running or scheduled experiments
-        self._running_experiments: Dict[str, Dict[str, Any]] = {}
+        self._running_experiments: Dict[str, ExperimentState] = {}
 
     def _setup_components(self) -> None:
         """
-        Initialize all required components from configuration:
-        - search_strategy
-        - code_generator
-        - container_manager
-        - results DB
-        - version control
+        Initialize the search strategy from configuration.
 
-        Uses lazy imports to avoid circular dependencies.
+        The code generator, container manager, results DB and version
+        control are created on first access through their properties, so
+        constructing an Orchestrator does not import or connect to providers
+        it never uses. Component classes are resolved through cached lookups.
         """
-        from .strategies import RandomSearch, BayesianOptimization
+        from .strategies import SearchStrategy
 
-        # 1. Search Strategy
-        if isinstance(
-            self.config.search_strategy, (RandomSearch, BayesianOptimization)
-        ):
+        if isinstance(self.config.search_strategy, SearchStrategy):
             self._search_strategy = self.config.search_strategy
         else:
             strategy_config = self.config.search_strategy
             strategy_type = strategy_config.get("type", "bayesian_optimization")
+            self._search_strategy = _strategy_cls(strategy_type)(strategy_config)
+        self._validate_strategy(self._search_strategy)
 
-            if strategy_type == "random":
-                self._search_strategy = RandomSearch(strategy_config)
-            elif strategy_type == "bayesian_optimization":
-                self._search_strategy = BayesianOptimization(strategy_config)
-            else:
-                raise ValueError(f"Unknown search strategy type: {strategy_type}")
-
-        # 2. Code Generator
-        if not hasattr(self, "_code_generator"):
-            from ..llm_code_gen.providers import (
-                MockCodeGenerator,
-                OpenAICodeGenerator,
-                LlamaCodeGenerator,
+    @staticmethod
+    def _validate_strategy(strategy: Any) -> None:
+        """
+        Check once that a strategy declares ArchitectureVector suggestions.
+
+        Suggestions are trusted on the hot path, so the return type is
+        checked here against the strategy's annotations instead.
+
+        Raises:
+            ValueError: If suggest_architecture() declares another return type.
+        """
+        hints = get_type_hints(type(strategy).suggest_architecture)
+        returns = hints.get("return")
+        if not (isinstance(returns, type) and issubclass(returns, ArchitectureVector)):
+            raise ValueError(
+                f"{type(strategy).__name__}.suggest_architecture() must return "
+                "an ArchitectureVector"
             )
 
+    @property
+    def code_generator(self) -> CodeGenerator:
+        """Returns the code generator instance, creating it on first access."""
+        if "_code_generator" not in self.__dict__:
             if self.config.environment == "development":
-                # Use a mock generator in dev mode
-                self._code_generator = LlamaCodeGenerator(asdict(self.config.llm))
+                provider = "llama"
             else:
                 provider = self.config.llm.get("provider", "openai")
-                if provider == "openai":
-                    self._code_generator = OpenAICodeGenerator(asdict(self.config.llm))
-                elif provider == "llama":
-                    self._code_generator = LlamaCodeGenerator(asdict(self.config.llm))
-                else:
-                    raise ValueError(f"Unknown LLM provider: {provider}")
+            llm_config = asdict(self.config.llm)
+            if self._max_parallel:
+                llm_config.setdefault("max_connections", self._max_parallel)
+            self._code_generator = _llm_provider_cls(provider)(llm_config)
             logger.info(
                 "Initialized code generator: %s",
                 self._code_generator.__class__.__name__,
             )
-
-        # 3. Container Manager
-        if not hasattr(self, "_container_manager"):
-            from ..env_manager.providers import DockerContainerManager
-
-            self._container_manager = DockerContainerManager(self.config.container)
-
-        # 4. Results DB
-        if not hasattr(self, "_results_db"):
-            self._results_db = ResultsDBImpl(self.config)
-
-        # 5. Version Control
-        if not hasattr(self, "_version_control"):
-            self._version_control = VersionControl()
-
-    @property
-    def code_generator(self) -> CodeGenerator:
-        """Returns the code generator instance."""
         return self._code_generator
 
     @code_generator.setter
@@ -181,7 +382,12 @@ class Orchestrator(IOrchestrator):
 
     @property
     def container_manager(self) -> ContainerManager:
-        """Returns the container manager instance."""
+        """Returns the container manager instance, creating it on first access."""
+        if "_container_manager" not in self.__dict__:
+            runtime = self.config.container.get("runtime", "docker")
+            self._container_manager = _container_runtime_cls(runtime)(
+                self.config.container
+            )
         return self._container_manager
 
     @container_manager.setter
@@ -189,18 +395,55 @@ class Orchestrator(IOrchestrator):
         """Sets the container manager instance."""
         self._container_manager = manager
 
-    async def run_cycle(self) -> Dict[str, Any]:
+    @property
+    def results_db(self) -> "ResultsDB":
+        """Returns the results DB instance, creating it on first access."""
+        if "_results_db" not in self.__dict__:
+            from ..results_db.db import ResultsDB
+
+            self._results_db = ResultsDB(self.config)
+        return self._results_db
+
+    @results_db.setter
+    def results_db(self, db: "ResultsDB") -> None:
+        """Sets the results DB instance."""
+        self._results_db = db
+
+    @property
+    def version_control(self) -> "VersionControl":
+        """Returns the version control instance, creating it on first access."""
+        if "_version_control" not in self.__dict__:
+            from ..utils.version_control import VersionControl
+
+            self._version_control = VersionControl()
+        return self._version_control
+
+    @version_control.setter
+    def version_control(self, vc: "VersionControl") -> None:
+        """Sets the version control instance."""
+        self._version_control = vc
+
+    async def run_cycle(
+        self, arch_vector: Optional[ArchitectureVector] = None
+    ) -> CycleResult:
         """
         Run a single cycle of the neural architecture search.
 
         Steps:
-            1) get_next_architecture()
+            1) get_next_architecture() (skipped if arch_vector is given)
             2) generate_code()
             3) create & run container
             4) store results, update strategy
 
+        When the architecture comes from the strategy, the next one is
+        suggested while the container runs and picked up by the next call.
+
+        Args:
+            arch_vector: Optional architecture already suggested by the strategy,
+                e.g. one point of a batch from suggest_architectures().
+
         Returns:
-            Dictionary with keys:
+            CycleResult, a mapping with keys:
                 - architecture_id
                 - metrics
                 - code_version
@@ -210,53 +453,391 @@ class Orchestrator(IOrchestrator):
             RuntimeError: If any sub-step fails.
         """
         try:
-            arch_info = await self.get_next_architecture()  # step 1
-            arch_vector = arch_info["vector"]
-            arch_spec = arch_vector.decode()
-
-            # Generate code (step 2)
-            code = await self._code_generator.generate_code(arch_spec)
-
-            # Commit code to version control
-            code_version = await self._version_control.commit_code(code)
-
-            # Create container (step 3)
-            container_spec = {
-                "code": code,
-                # Potentially add "requirements" or "data_path"
-                # or environment overrides if needed
-            }
-            container_id = await self._container_manager.create_container(
-                container_spec
+            prefetch = arch_vector is None
+            if prefetch:
+                arch_info = await self._take_next_architecture()  # step 1
+                arch_vector = arch_info["vector"]
+            arch_spec = self._get_or_decode(arch_vector)
+            canonical = self._canonical_spec(arch_spec)
+            spec_digest = hashlib.sha256(canonical).digest()
+
+            # Generate code, commit it and create its container (steps 2-3)
+            code, code_version, container_id = await self._prepare_experiment(
+                arch_spec, canonical, spec_digest, getattr(arch_vector, "vector", None)
             )
 
+            reusable = False
             try:
-                run_results = await self._container_manager.run_container(container_id)
+                if prefetch:
+                    # Suggest the next architecture while this one trains
+                    self._next_arch_task = asyncio.ensure_future(
+                        self.get_next_architecture()
+                    )
+                run_results = await self.container_manager.run_container(container_id)
+                reusable = True
                 if run_results["status"] != "success":
                     # We consider this a critical error
                     raise RuntimeError(f"Container run failed: {run_results}")
 
                 # Step 4: process results
                 metrics = run_results.get("results", {})
-                architecture_id = f"arch_{code_version[:8]}"
-
-                final_results = {
-                    "architecture_id": architecture_id,
-                    "metrics": metrics,
-                    "code_version": code_version,
-                    "arch_spec": arch_spec,
-                }
-                await self.submit_results(final_results)
+                # Content-addressed, so identical specs share one architecture
+                architecture_id = f"arch_{spec_digest[:16].hex()}"
+
+                final_results = CycleResult(
+                    architecture_id=architecture_id,
+                    metrics=metrics,
+                    code_version=code_version,
+                    arch_spec=arch_spec,
+                )
+                await self.submit_results(final_results, arch_vector)
                 return final_results
 
             finally:
-                # Always attempt to clean up container
-                await self._container_manager.cleanup_container(container_id)
+                # Always hand the container back, to the pool or for cleanup
+                await self._release_container(container_id, reusable)
 
         except Exception as e:
             logger.error(f"run_cycle failed: {e}")
+            if prefetch and arch_vector is not None:
+                self._search_strategy.discard_pending(arch_vector)
             raise
 
+    async def _take_next_architecture(self) -> Dict[str, Any]:
+        """Get the next architecture, using the one prefetched if any."""
+        task, self._next_arch_task = self._next_arch_task, None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            return await task
+        return await self.get_next_architecture()
+
+    def _get_or_decode(self, arch_vector: ArchitectureVector) -> Dict[str, Any]:
+        """
+        Decode an architecture vector, reusing the spec of an identical vector.
+
+        Hits are only served when the cached entry was decoded under the same
+        bounds and categorical dimensions. A copy is returned so callers may
+        modify the spec freely.
+        """
+        vector = getattr(arch_vector, "vector", None)
+        if not isinstance(vector, np.ndarray):
+            return arch_vector.decode()
+
+        key = vector.tobytes()
+        entry = self._decode_cache.get(key)
+        if entry is not None:
+            bounds, categorical_dims, spec = entry
+            if (bounds is arch_vector.bounds or bounds == arch_vector.bounds) and (
+                categorical_dims is arch_vector.categorical_dims
+                or categorical_dims == arch_vector.categorical_dims
+            ):
+                self._decode_cache.move_to_end(key)
+                return dict(spec)
+
+        spec = arch_vector.decode()
+        self._decode_cache[key] = (
+            arch_vector.bounds,
+            arch_vector.categorical_dims,
+            spec,
+        )
+        self._decode_cache.move_to_end(key)
+        if len(self._decode_cache) > _DECODE_CACHE_SIZE:
+            self._decode_cache.popitem(last=False)
+        return dict(spec)
+
+    async def _prepare_experiment(
+        self,
+        arch_spec: Dict[str, Any],
+        canonical: bytes,
+        cache_key: bytes,
+        vector: Optional[np.ndarray] = None,
+    ) -> Tuple[str, str, str]:
+        """
+        Generate code for an architecture, commit it and create its container.
+
+        While the LLM generates code, the base image is pulled or, when
+        containers are reused, a container is acquired. Once the code is
+        ready the commit and loading it into the container run concurrently.
+        Code already generated for an identical spec, or for a near-identical
+        architecture vector, under the same prompt template is reused from
+        memory or the on-disk cache, skipping both the LLM call and the commit.
+
+        Args:
+            arch_spec: Decoded architecture specification
+            canonical: Canonical serialization of arch_spec
+            cache_key: SHA-256 digest of canonical
+            vector: Raw architecture vector used for similarity lookups
+
+        Returns:
+            Tuple of (code, code_version, container_id)
+
+        Raises:
+            Exception: Whatever the failing stage raised; a container created
+                alongside a failed commit is cleaned up first.
+        """
+        namespace = self.code_generator.template_version
+        cached = self._lookup_code(cache_key, vector, namespace)
+        if cached is not None:
+            code, code_version = cached
+            container_id = await self._checkout_container({"code": code})
+            return code, code_version, container_id
+
+        reuse = self._reuse_strategy != "none"
+        if reuse:
+            # Reused containers take their code later, so get one ready now
+            container_ready = asyncio.ensure_future(self._acquire_container())
+        else:
+            container_ready = asyncio.ensure_future(
+                self.container_manager.prepare_base_image()
+            )
+        try:
+            code = await self._generate_code_once(cache_key, namespace, arch_spec)
+            acquired = await container_ready
+        except BaseException:
+            if reuse:
+                container_ready.add_done_callback(self._release_acquired)
+            else:
+                container_ready.cancel()
+            raise
+
+        container_spec = {
+            "code": code,
+            # Potentially add "requirements" or "data_path"
+            # or environment overrides if needed
+        }
+        code_version, container_id = await asyncio.gather(
+            self.version_control.commit_code(code),
+            (
+                self._load_code(acquired, container_spec)
+                if reuse
+                else self._checkout_container(container_spec)
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(code_version, BaseException):
+            if not isinstance(container_id, BaseException):
+                await self._release_container(container_id)
+            raise code_version
+        if isinstance(container_id, BaseException):
+            raise container_id
+        self._spec_cache.put(cache_key, (code, code_version), vector, namespace)
+        if self._code_store is not None:
+            self._code_store.put(
+                cache_key, (code, code_version), canonical, vector, namespace
+            )
+        return code, code_version, container_id
+
+    async def _generate_code_once(
+        self, key: bytes, namespace: str, arch_spec: Dict[str, Any]
+    ) -> str:
+        """
+        Generate code, sharing one LLM call among concurrent identical specs.
+
+        Callers that arrive while generation for the same spec is in flight
+        await that request instead of starting their own. A cancelled caller
+        does not cancel the shared request.
+        """
+        inflight_key = (key, namespace)
+        future = self._inflight_codegen.get(inflight_key)
+        if future is None:
+            future = asyncio.ensure_future(self.code_generator.generate_code(arch_spec))
+            self._inflight_codegen[inflight_key] = future
+            future.add_done_callback(
+                lambda _: self._inflight_codegen.pop(inflight_key, None)
+            )
+        return await asyncio.shield(future)
+
+    def _lookup_code(
+        self, key: bytes, vector: Optional[np.ndarray], namespace: str
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Find cached (code, code_version) in memory, then on disk.
+
+        Disk hits are promoted into the in-memory cache.
+        """
+        cached = self._spec_cache.get(key, vector, namespace)
+        if cached is None and self._code_store is not None:
+            stored = self._code_store.get(key, namespace)
+            if stored is not None:
+                cached, stored_vector = stored
+                self._spec_cache.put(key, cached, stored_vector, namespace)
+        return cached
+
+    async def _checkout_container(self, spec: Dict[str, Any]) -> str:
+        """
+        Take a warm container from the pool and load the code into it.
+
+        Falls back to creating a new container when reuse is disabled or the
+        pool is empty.
+
+        Args:
+            spec: Container specification with the code to run
+
+        Returns:
+            Container ID as string
+        """
+        if self._reuse_strategy != "none" and self._container_pool:
+            container_id = await self._acquire_container()
+            return await self._load_code(container_id, spec)
+        return await self.container_manager.create_container(spec)
+
+    async def _acquire_container(self) -> str:
+        """
+        Get a running container whose workspace is loaded later.
+
+        Takes a warm container from the pool, or creates one with an empty
+        workspace. Only used when containers are reused, as loading code into
+        the container relies on reset_workspace().
+
+        Returns:
+            Container ID as string
+        """
+        while self._container_pool:
+            container_id = self._container_pool.popleft()
+            if self._reuse_strategy != "pause":
+                return container_id
+            try:
+                await self.container_manager.unpause_container(container_id)
+                return container_id
+            except ContainerDaemonError:
+                raise
+            except Exception as e:
+                logger.warning(f"Discarding pooled container {container_id}: {e}")
+                await self._cleanup_quietly(container_id)
+        return await self.container_manager.create_container({"code": ""})
+
+    async def _load_code(self, container_id: str, spec: Dict[str, Any]) -> str:
+        """
+        Load code into an acquired container.
+
+        A container whose workspace cannot be reset is replaced by a newly
+        created one.
+
+        Args:
+            container_id: Container from _acquire_container()
+            spec: Container specification with the code to run
+
+        Returns:
+            ID of the container holding the code
+        """
+        try:
+            await self.container_manager.reset_workspace(container_id, spec)
+            return container_id
+        except ContainerDaemonError:
+            raise
+        except Exception as e:
+            logger.warning(f"Discarding container {container_id}: {e}")
+            await self._cleanup_quietly(container_id)
+        return await self.container_manager.create_container(spec)
+
+    def _release_acquired(self, future: "asyncio.Future[str]") -> None:
+        """Hand back a container acquired for a cycle that failed meanwhile."""
+        if not future.cancelled() and future.exception() is None:
+            asyncio.ensure_future(self._release_container(future.result()))
+
+    async def _release_container(
+        self, container_id: str, reusable: bool = True
+    ) -> None:
+        """
+        Return a container to the pool, or clean it up.
+
+        Args:
+            container_id: ID of the container to release
+            reusable: False if the container may be in a bad state
+        """
+        if (
+            self._reuse_strategy == "none"
+            or not reusable
+            or len(self._container_pool) >= self._pool_size
+        ):
+            await self.container_manager.cleanup_container(container_id)
+            return
+        if self._reuse_strategy == "pause":
+            try:
+                await self.container_manager.pause_container(container_id)
+            except Exception as e:
+                logger.warning(f"Could not pause container {container_id}: {e}")
+                await self._cleanup_quietly(container_id)
+                return
+        self._container_pool.append(container_id)
+
+    async def _cleanup_quietly(self, container_id: str) -> None:
+        """Clean up a container, logging rather than raising on failure."""
+        try:
+            await self.container_manager.cleanup_container(container_id)
+        except Exception as e:
+            logger.warning(f"Failed to clean up container {container_id}: {e}")
+
+    async def warm_container_pool(self, size: Optional[int] = None) -> None:
+        """
+        Pre-create idle containers so the first cycles skip cold starts.
+
+        Does nothing unless container reuse is enabled.
+
+        Args:
+            size: Number of containers to keep warm, defaults to the pool size
+        """
+        if self._reuse_strategy == "none":
+            return
+        size = min(self._pool_size if size is None else size, self._pool_size)
+        missing = size - len(self._container_pool)
+        if missing <= 0:
+            return
+        container_ids = await asyncio.gather(
+            *(
+                self.container_manager.create_container({"code": ""})
+                for _ in range(missing)
+            )
+        )
+        for container_id in container_ids:
+            await self._release_container(container_id)
+
+    async def close_container_pool(self) -> None:
+        """Clean up every idle container held in the pool."""
+        while self._container_pool:
+            await self._cleanup_quietly(self._container_pool.popleft())
+
+    @staticmethod
+    def _canonical_spec(arch_spec: Dict[str, Any]) -> bytes:
+        """Serialize a spec deterministically for use as a cache key."""
+        # Stays on stdlib json: architecture IDs are digests of these exact
+        # bytes, and orjson's compact output would change every stored ID
+        return json.dumps(arch_spec, sort_keys=True, default=str).encode()
+
+    def _uses_gp_state(self) -> bool:
+        """Whether the strategy's GP posterior should be persisted."""
+        return self.experiment_id is not None and isinstance(
+            self._search_strategy, _strategy_cls("bayesian_optimization")
+        )
+
+    async def _restore_gp_state(self) -> None:
+        """Warm-start the search strategy from a persisted GP posterior, once."""
+        if self._gp_state_restored or not self._uses_gp_state():
+            return
+        self._gp_state_restored = True
+        state = await self.results_db.load_gp_state(self.experiment_id)
+        if state is not None:
+            self._search_strategy.set_gp_state(state)
+            logger.info(
+                "Restored GP state with %d observations for %s",
+                len(state["y_train"]),
+                self.experiment_id,
+            )
+
+    async def _persist_gp_state(self) -> None:
+        """Save the strategy's current GP posterior to the results DB."""
+        if not self._uses_gp_state():
+            return
+        state = self._search_strategy.get_gp_state()
+        if state is not None:
+            await self.results_db.save_gp_state(
+                self.experiment_id,
+                state["L"],
+                state["alpha"],
+                state["X_train"],
+                state["hypers"],
+                state["y_train"],
+            )
+
     async def get_next_architecture(self) -> Dict[str, Any]:
         """
         Retrieves the next architecture to evaluate from the search strategy.
@@ -266,13 +847,13 @@ class Orchestrator(IOrchestrator):
                 - vector: ArchitectureVector
                 - metadata: dict with strategy name, iteration, etc.
 
-        Raises:
-            ValueError: If the strategy returns an invalid type (not ArchitectureVector).
+        The strategy's return type is validated once at setup, not per call.
+        The suggestion is registered as pending with the strategy, so one
+        made while another architecture trains does not repeat it. It stays
+        pending until its results are submitted or it is discarded.
         """
-        arch_vector = await self._search_strategy.suggest_architecture()
-        if not isinstance(arch_vector, ArchitectureVector):
-            raise ValueError("Strategy returned invalid architecture type")
-
+        await self._restore_gp_state()
+        (arch_vector,) = await self._search_strategy.suggest_architectures(1)
         return {
             "vector": arch_vector,
             "metadata": {
@@ -281,7 +862,11 @@ class Orchestrator(IOrchestrator):
             },
         }
 
-    async def submit_results(self, results: Dict[str, Any]) -> None:
+    async def submit_results(
+        self,
+        results: Mapping[str, Any],
+        arch_vector: Optional[ArchitectureVector] = None,
+    ) -> None:
         """
         Submit results from a completed experiment.
 
@@ -290,70 +875,266 @@ class Orchestrator(IOrchestrator):
             - metrics
 
         Steps:
-            1) Save run info to DB
-            2) Update search strategy with results
+            1) Queue run info for a background DB write
+            2) Update search strategy with results (and persist its GP state)
             3) Log outcome
 
+        The DB write happens off the critical path; call flush_results() to
+        wait for it. run_batch() flushes before returning.
+
+        Args:
+            results: Results of the run
+            arch_vector: The evaluated architecture. Without it the results
+                are only recorded, since the strategy cannot tell which
+                point they belong to.
+
         Raises:
-            ValueError: If required fields are missing.
-            Any DB or search strategy exceptions that might bubble up.
+            ValueError: If required fields are missing or metrics is not a dict.
+            Any search strategy exceptions that might bubble up.
         """
-        required_fields = ["architecture_id", "metrics"]
-        for field in required_fields:
-            if field not in results:
-                raise ValueError(f"submit_results: missing required field '{field}'")
+        if not _REQUIRED_RESULT_FIELDS <= results.keys():
+            missing = sorted(_REQUIRED_RESULT_FIELDS - results.keys())
+            raise ValueError(f"submit_results: missing required fields {missing}")
+        if not isinstance(results["metrics"], dict):
+            raise ValueError("submit_results: 'metrics' must be a dictionary")
 
-        # Persist results
-        await self._results_db.save_run_info(results)
+        # Persist results in the background
+        await self._enqueue_run_info(results)
 
         # Update search strategy with outcome
-        await self._search_strategy.update_with_results(results)
+        if arch_vector is not None:
+            await self._search_strategy.update_with_results(
+                arch_vector, results["metrics"]
+            )
+            await self._persist_gp_state()
 
         # Logging
-        logger.info(f"Submitted results for {results['architecture_id']}")
-        logger.info(f"Metrics: {results['metrics']}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Submitted results for %s",
+                results["architecture_id"],
+                extra={
+                    "payload": orjson.dumps(
+                        results["metrics"],
+                        default=str,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                    )
+                },
+            )
+
+    async def _enqueue_run_info(self, results: Mapping[str, Any]) -> None:
+        """
+        Hand a run record to the background DB writer.
+
+        The writer is (re)started on the running loop if needed. Waits only
+        when the queue is full, so a slow DB applies backpressure.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._db_writer_task is None
+            or self._db_writer_task.done()
+            or self._db_writer_task.get_loop() is not loop
+        ):
+            self._db_write_queue = asyncio.Queue(maxsize=_DB_WRITE_QUEUE_SIZE)
+            self._db_writer_task = loop.create_task(
+                self._db_writer_loop(self._db_write_queue)
+            )
+        await self._db_write_queue.put(results)
+
+    async def _db_writer_loop(self, queue: asyncio.Queue) -> None:
+        """Save queued run records, batching whatever has accumulated."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _DB_WRITE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self.results_db.save_run_info_batch([dict(r) for r in batch])
+            except Exception as e:
+                logger.error(f"Failed to save {len(batch)} run(s): {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush_results(self) -> None:
+        """Wait until every queued run record has been written to the DB."""
+        task = self._db_writer_task
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            await self._db_write_queue.join()
+
+    async def aclose(self) -> None:
+        """
+        Release resources held across cycles.
+
+        Pending run records are written first, then the DB writer and any
+        prefetched suggestion are stopped, the prefetched architecture is
+        discarded from the strategy's pending points, idle pooled containers
+        are cleaned up and the code generator's HTTP client and the on-disk
+        code cache are closed.
+        """
+        await self.flush_results()
+        for task in (self._db_writer_task, self._next_arch_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        prefetched = self._next_arch_task
+        if (
+            prefetched is not None
+            and not prefetched.cancelled()
+            and prefetched.exception() is None
+        ):
+            self._search_strategy.discard_pending(prefetched.result()["vector"])
+        self._db_writer_task = None
+        self._next_arch_task = None
+
+        await self.close_container_pool()
+        if "_code_generator" in self.__dict__:
+            await self._code_generator.aclose()
+        if self._code_store is not None:
+            self._code_store.close()
+            self._code_store = None
 
     async def run_batch(
         self, batch_size: int, parallel: bool = True
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Mapping[str, Any]]:
         """
         Run multiple architecture evaluations in batch.
 
         Args:
             batch_size (int): Number of architectures to evaluate
-            parallel (bool): If True, run all cycles concurrently.
+            parallel (bool): If True, run cycles concurrently, at most
+                             orchestrator.max_parallel at a time.
                              If False, run them sequentially.
 
         Returns:
             A list of results dictionaries. Each element may be either:
-                - A successful results dict from run_cycle(), or
+                - A successful CycleResult from run_cycle(),
                 - A dict with status="failed" and an "error" message
-                  if that particular cycle failed.
+                  if that particular cycle failed, or
+                - A dict with status="cancelled" if the batch was aborted
+                  before that cycle finished.
 
         Notes:
             - Even if parallel=True, some tasks might fail while others succeed.
+            - In parallel mode the strategy is asked once for the whole batch,
+              with in-flight points fantasized by its default rule, and each
+              real result is told back to the strategy as soon as its cycle
+              finishes.
+            - If the container daemon becomes unavailable, the remaining cycles
+              are cancelled and reported with status="cancelled".
+            - Use iter_batch() to consume parallel results as they finish.
         """
-        tasks = [self.run_cycle() for _ in range(batch_size)]
+        results: List[Optional[Mapping[str, Any]]] = [None] * batch_size
 
         if parallel:
-            # Run concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, r in enumerate(results):
-                if isinstance(r, Exception):
-                    logger.error(f"Parallel run {i} failed: {r}")
-                    results[i] = {"status": "failed", "error": str(r)}
+            async for i, result in self.iter_batch(batch_size):
+                results[i] = result
             return results
-        else:
-            # Run sequentially to avoid partial failures messing concurrency
-            aggregated = []
-            for i, task in enumerate(tasks):
+
+        # Run sequentially to avoid partial failures messing concurrency
+        for i in range(batch_size):
+            try:
+                await self._safe_run_cycle(i, None, results)
+            except ContainerDaemonError:
+                break
+
+        await self.flush_results()
+        return [r if r is not None else dict(_CANCELLED_RESULT) for r in results]
+
+    async def iter_batch(
+        self, batch_size: int
+    ) -> AsyncIterator[Tuple[int, Mapping[str, Any]]]:
+        """
+        Run a parallel batch, yielding each result as soon as its cycle ends.
+
+        Results arrive in completion order, paired with their index in the
+        batch, with the same results as run_batch(). If the container
+        daemon becomes unavailable, the cycles still running are cancelled
+        and yielded last with status="cancelled". If the strategy cannot
+        suggest the batch, every index is yielded with status="failed".
+        Closing the iterator early cancels the remaining cycles.
+
+        Args:
+            batch_size: Number of architectures to evaluate
+
+        Yields:
+            Tuples of (index, result)
+        """
+        results: List[Optional[Mapping[str, Any]]] = [None] * batch_size
+        await self._restore_gp_state()
+        try:
+            vectors = await self._search_strategy.suggest_architectures(batch_size)
+        except Exception as e:
+            # e.g. SearchSpaceExhausted: every cycle of the batch fails
+            logger.error(f"Batch suggestion failed: {e}")
+            for i in range(batch_size):
+                yield i, {"status": "failed", "error": str(e)}
+            return
+        semaphore = asyncio.Semaphore(self._max_parallel or min(batch_size, 8))
+
+        async def guarded(i: int, vector: ArchitectureVector) -> Tuple[int, bool]:
+            async with semaphore:
                 try:
-                    res = await task
-                    aggregated.append(res)
-                except Exception as e:
-                    logger.error(f"Sequential run {i} failed: {e}")
-                    aggregated.append({"status": "failed", "error": str(e)})
-            return aggregated
+                    await self._safe_run_cycle(i, vector, results)
+                except ContainerDaemonError:
+                    return i, True
+            return i, False
+
+        tasks = [asyncio.ensure_future(guarded(i, v)) for i, v in enumerate(vectors)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                i, daemon_down = await next_done
+                yield i, results[i]
+                if daemon_down:
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for i, vector in enumerate(vectors):
+                if results[i] is None:
+                    self._search_strategy.discard_pending(vector)
+            await self.flush_results()
+
+        for i, result in enumerate(results):
+            if result is None:
+                yield i, dict(_CANCELLED_RESULT)
+
+    async def _safe_run_cycle(
+        self,
+        index: int,
+        vector: Optional[ArchitectureVector],
+        results: List[Optional[Mapping[str, Any]]],
+    ) -> None:
+        """
+        Run one cycle of a batch and write its outcome into results[index].
+
+        Failures are stored as {"status": "failed", "error": ...}. When a
+        pre-suggested vector fails, it is discarded from the strategy's
+        pending points; on success
+        run_cycle() has already reported the metrics to the strategy.
+
+        Raises:
+            ContainerDaemonError: After recording it, so the batch can abort.
+        """
+        try:
+            result = await self.run_cycle(vector)
+        except Exception as e:
+            logger.error(f"Batch run {index} failed: {e}")
+            if vector is not None:
+                self._search_strategy.discard_pending(vector)
+            results[index] = {"status": "failed", "error": str(e)}
+            if isinstance(e, ContainerDaemonError):
+                raise
+            return
+        results[index] = result
 
     def schedule_experiment(self, experiment_id: str) -> None:
         """
@@ -370,13 +1151,18 @@ class Orchestrator(IOrchestrator):
                 f"Experiment {experiment_id} is already running or scheduled"
             )
 
-        self._running_experiments[experiment_id] = {
-            "status": "scheduled",
-            "start_time": None,
-            "logs": [],
-        }
+        state = self._running_experiments[experiment_id] = ExperimentState(
+            status="scheduled",
+            start_time=None,
+            task=None,
+            logs=[],
+            log_timestamps=[],
+            results=None,
+            error=None,
+        )
+        self._log_experiment(experiment_id, "Experiment scheduled")
 
-        asyncio.create_task(self._run_experiment(experiment_id))
+        state.task = asyncio.create_task(self._run_experiment(experiment_id))
 
     async def _run_experiment(self, experiment_id: str) -> None:
         """
@@ -387,27 +1173,48 @@ class Orchestrator(IOrchestrator):
             experiment_id: The ID of the experiment to run.
 
         Raises:
-            Exceptions bubble up but are caught to mark experiment as failed in state.
+            asyncio.CancelledError: If stopped, after marking it as stopped.
+            Other exceptions are caught to mark experiment as failed in state.
         """
+        state = self._running_experiments[experiment_id]
         try:
-            self._running_experiments[experiment_id]["status"] = "running"
-            self._running_experiments[experiment_id][
-                "start_time"
-            ] = datetime.utcnow().isoformat()
+            state.status = "running"
+            state.start_time = datetime.utcnow().isoformat()
+            self._log_experiment(experiment_id, "Experiment started")
 
             result = await self.run_cycle()
+            await self.flush_results()
 
-            self._running_experiments[experiment_id]["status"] = "completed"
-            self._running_experiments[experiment_id]["results"] = result
+            state.status = "completed"
+            state.results = result
+            self._log_experiment(experiment_id, "Experiment completed")
 
+        except asyncio.CancelledError:
+            state.status = "stopped"
+            self._log_experiment(experiment_id, "Experiment stopped")
+            raise
         except Exception as e:
-            self._running_experiments[experiment_id]["status"] = "failed"
-            self._running_experiments[experiment_id]["error"] = str(e)
+            state.status = "failed"
+            state.error = str(e)
+            self._log_experiment(experiment_id, f"Experiment failed: {e}")
             logger.error(f"Experiment {experiment_id} failed: {e}")
 
+    def _log_experiment(self, experiment_id: str, message: str) -> None:
+        """Append a log entry, keeping the entries sorted by timestamp."""
+        state = self._running_experiments[experiment_id]
+        timestamps = state.log_timestamps
+        # Guard the sort order against wall-clock steps backwards
+        timestamp = max(time.time(), timestamps[-1]) if timestamps else time.time()
+        timestamps.append(timestamp)
+        state.logs.append((timestamp, message))
+
     def stop_experiment(self, experiment_id: str) -> None:
         """
-        Mark experiment as stopping (TODO: actual container or job cancellation).
+        Stop an experiment by cancelling its task.
+
+        The running cycle is interrupted at its next await and its container
+        is released; the status becomes "stopped" once the task unwinds.
+        Finished experiments are left untouched.
 
         Args:
             experiment_id: ID of the experiment.
@@ -418,8 +1225,10 @@ class Orchestrator(IOrchestrator):
         if experiment_id not in self._running_experiments:
             raise ValueError(f"Experiment {experiment_id} is not running or scheduled")
 
-        self._running_experiments[experiment_id]["status"] = "stopping"
-        # TODO: implement actual container/job stop logic if feasible
+        state = self._running_experiments[experiment_id]
+        if state.task is not None and not state.task.done():
+            state.status = "stopping"
+            state.task.cancel()
 
     def get_experiment_status(self, experiment_id: str) -> Dict[str, Any]:
         """
@@ -436,7 +1245,7 @@ class Orchestrator(IOrchestrator):
         """
         if experiment_id not in self._running_experiments:
             raise ValueError(f"Experiment {experiment_id} not found")
-        return self._running_experiments[experiment_id]
+        return self._running_experiments[experiment_id].to_dict()
 
     def list_running_experiments(self) -> List[str]:
         """
@@ -455,7 +1264,8 @@ class Orchestrator(IOrchestrator):
 
         Args:
             experiment_id: ID of the experiment
-            start_time: If provided, only return logs after that timestamp.
+            start_time: If provided, only return logs after this ISO 8601
+                timestamp (UTC if it carries no offset).
 
         Returns:
             A list of log entries (strings).
@@ -463,8 +1273,11 @@ class Orchestrator(IOrchestrator):
         if experiment_id not in self._running_experiments:
             raise ValueError(f"Experiment {experiment_id} not found")
 
-        logs = self._running_experiments[experiment_id]["logs"]
+        state = self._running_experiments[experiment_id]
+        start = 0
         if start_time:
             dt = datetime.fromisoformat(start_time)
-            return [l for l in logs if l["timestamp"] > dt]
-        return logs
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            start = bisect.bisect_right(state.log_timestamps, dt.timestamp())
+        return [message for _, message in state.logs[start:]]
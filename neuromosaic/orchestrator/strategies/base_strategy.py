@@ -12,7 +12,7 @@ Example:
     >>> await strategy.update_with_results(arch_vector, results)
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from abc import ABC, abstractmethod
 import numpy as np
 import logging
@@ -39,8 +39,14 @@ class SearchStrategy(ABC):
             - optimization_objectives: Metrics to optimize
             - constraints: Any constraints on architectures
         history (List[Dict[str, Any]]): History of evaluated architectures
+        pending (List[Dict[str, Any]]): Architectures handed out by
+            suggest_architectures() that have not reported results yet
+        pending_fantasies (Tuple[str, ...]): Supported imputation rules for
+            pending points
     """
 
+    pending_fantasies: Tuple[str, ...] = ("mean", "min", "max")
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the search strategy.
@@ -50,6 +56,7 @@ class SearchStrategy(ABC):
         """
         self.config = config
         self.history = []
+        self.pending = []
         self.bounds = {}  # Initialize bounds before setup
         self._setup_search_space()
 
@@ -57,6 +64,104 @@ class SearchStrategy(ABC):
         """Initialize the search space from configuration."""
         raise NotImplementedError
 
+    async def suggest_architectures(
+        self, num_architectures: int, pending_fantasy: str = "mean"
+    ) -> List[ArchitectureVector]:
+        """
+        Suggest several architectures at once for parallel evaluation.
+
+        Each suggestion is registered as a pending point with a fantasized
+        ("constant liar") objective before the next one is drawn, so later
+        suggestions in the batch account for the earlier in-flight ones.
+
+        Args:
+            num_architectures: Number of architectures to suggest
+            pending_fantasy: How to impute the objective of pending points,
+                one of pending_fantasies; the base rules are the "mean",
+                "min" or "max" of the observed objectives
+
+        Returns:
+            List of ArchitectureVector instances
+        """
+        if pending_fantasy not in self.pending_fantasies:
+            raise ValueError(f"Unknown pending_fantasy: {pending_fantasy}")
+
+        suggestions = []
+        for _ in range(num_architectures):
+            vector = await self.suggest_architecture()
+            self._fantasy_register(vector, pending_fantasy)
+            suggestions.append(vector)
+        return suggestions
+
+    def _fantasy_register(
+        self, architecture: ArchitectureVector, pending_fantasy: str = "mean"
+    ) -> None:
+        """
+        Register an in-flight architecture with an imputed objective.
+
+        Args:
+            architecture: The architecture being evaluated
+            pending_fantasy: Imputation rule, one of pending_fantasies
+        """
+        objective = self._fantasy_objective(architecture, pending_fantasy)
+        self.pending.append(
+            {"architecture": architecture, "results": {"objective": objective}}
+        )
+
+    def _fantasy_objective(
+        self, architecture: ArchitectureVector, pending_fantasy: str
+    ) -> float:
+        """
+        Impute the objective of a pending architecture.
+
+        Args:
+            architecture: The architecture being evaluated
+            pending_fantasy: "mean", "min" or "max" of the observed objectives
+
+        Returns:
+            The fantasized objective, or 0.0 before any observation
+        """
+        observed = [
+            h["results"]["objective"]
+            for h in self.history
+            if "objective" in h["results"]
+        ]
+        if not observed:
+            return 0.0
+        reduce = {"mean": np.mean, "min": np.min, "max": np.max}[pending_fantasy]
+        return float(reduce(observed))
+
+    def _real_register(
+        self, architecture: ArchitectureVector, results: Dict[str, float], **extra
+    ) -> None:
+        """
+        Replace the fantasy for an architecture with its observed results.
+
+        Args:
+            architecture: The evaluated architecture
+            results: Dictionary of metric values
+            **extra: Additional fields stored on the history entry
+        """
+        self.discard_pending(architecture)
+        if any(h["architecture"] is architecture for h in self.history):
+            return
+        self.history.append({"architecture": architecture, "results": results, **extra})
+
+    def discard_pending(self, architecture: ArchitectureVector) -> None:
+        """
+        Forget a pending architecture without recording a result.
+
+        Call this when the evaluation of a suggested architecture fails or is
+        cancelled, so its fantasized objective stops shaping suggestions.
+        Unknown architectures are ignored.
+
+        Args:
+            architecture: An architecture returned by suggest_architectures()
+        """
+        self.pending = [
+            p for p in self.pending if p["architecture"] is not architecture
+        ]
+
     @abstractmethod
     async def suggest_architecture(self) -> ArchitectureVector:
         """
@@ -21,9 +21,13 @@ Example:
 """
 
 from typing import Dict, Any, List, Optional, Tuple
+import heapq
 import numpy as np
 from scipy.stats import norm
+from scipy.special import erfcx
 from scipy.optimize import minimize
+from scipy.linalg import cholesky, cho_solve, solve_triangular
+from scipy.spatial.distance import cdist
 import logging
 
 from .base_strategy import SearchStrategy
@@ -32,27 +36,109 @@ from ...utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+_LOG_SQRT_2PI = 0.5 * np.log(2 * np.pi)
+_SQRT_PI_2 = np.sqrt(np.pi / 2)
+# Below this z the erfcx form loses all precision to cancellation
+_LOG_H_ASYMPTOTIC_Z = -1 / np.sqrt(np.finfo(float).eps)
+
+
+def _log_h(z: np.ndarray) -> np.ndarray:
+    """
+    Compute log(z * Phi(z) + phi(z)), the log of expected improvement per sigma.
+
+    The direct form underflows to log(0) once z drops below about -38, which
+    flattens the acquisition into a zero-gradient plateau. For z <= -1 it is
+    rewritten as phi(z) * (1 - |z| sqrt(pi/2) erfcx(-z / sqrt(2))) and the
+    log taken term by term; for extreme z the asymptote phi(z) / z^2 is used.
+
+    Args:
+        z: Standardized improvement, (mu - best_f) / sigma
+
+    Returns:
+        log h(z), finite for every finite z
+    """
+    z = np.asarray(z, dtype=float)
+    out = np.empty_like(z)
+
+    upper = z > -1
+    zu = z[upper]
+    out[upper] = np.log(zu * norm.cdf(zu) + norm.pdf(zu))
+
+    middle = ~upper & (z > _LOG_H_ASYMPTOTIC_Z)
+    zm = z[middle]
+    out[middle] = (
+        -0.5 * zm**2
+        - _LOG_SQRT_2PI
+        + np.log1p(-np.abs(zm) * _SQRT_PI_2 * erfcx(-zm / np.sqrt(2)))
+    )
+
+    tail = z <= _LOG_H_ASYMPTOTIC_Z
+    zt = z[tail]
+    out[tail] = -0.5 * zt**2 - _LOG_SQRT_2PI - 2 * np.log(np.abs(zt))
+    return out
+
 
 class GaussianProcess:
     """
     Gaussian Process regression model.
 
+    The Cholesky factor of the training covariance is cached. Refitting on a
+    dataset that extends the previous one reuses the factor for the shared
+    leading rows, since the leading block of a Cholesky factor is the factor
+    of the leading block of the covariance.
+
     Attributes:
         kernel (str): Kernel function type
         length_scale (float): Kernel length scale
         noise (float): Observation noise variance
         X (np.ndarray): Training input points
         y (np.ndarray): Training target values
+        L (np.ndarray): Lower Cholesky factor of the training covariance
+        alpha (np.ndarray): K^-1 y, used for the posterior mean
     """
 
     def __init__(
         self, kernel: str = "matern", length_scale: float = 1.0, noise: float = 1e-6
     ):
+        if kernel not in ("matern", "rbf"):
+            raise ValueError(f"Unknown kernel: {kernel}")
         self.kernel = kernel
         self.length_scale = length_scale
         self.noise = noise
         self.X = None
         self.y = None
+        self.L = None
+        self.alpha = None
+
+    def _kernel(self, A: np.ndarray, B: np.ndarray) -> np.ndarray:
+        """Evaluate the covariance matrix between two sets of points."""
+        return self._kernel_from_r(cdist(A, B) / self.length_scale)
+
+    def _kernel_from_r(self, r: np.ndarray) -> np.ndarray:
+        """Evaluate the kernel on scaled distances, preserving their dtype."""
+        if self.kernel == "rbf":
+            return np.exp(-0.5 * r**2)
+        # Matern 5/2
+        sqrt5_r = np.sqrt(r.dtype.type(5.0)) * r
+        return (1 + sqrt5_r + sqrt5_r**2 / 3) * np.exp(-sqrt5_r)
+
+    def _cross_kernel32(self, X: np.ndarray) -> np.ndarray:
+        """
+        Covariance between query points and the training set, in FP32.
+
+        Squared distances are expanded as |a|^2 + |b|^2 - 2ab so the work is
+        a single SGEMM; cdist would upcast to FP64. Only good enough to rank
+        screening candidates: finite-difference gradients taken through it
+        fall below FP32 resolution.
+        """
+        X32 = np.asarray(X, dtype=np.float32)
+        sq_dists = (
+            np.einsum("ij,ij->i", X32, X32)[:, None]
+            + self._X32_sq_norms[None, :]
+            - 2 * (X32 @ self._X32.T)
+        )
+        r = np.sqrt(np.maximum(sq_dists, 0)) / np.float32(self.length_scale)
+        return self._kernel_from_r(r)
 
     def fit(self, X: np.ndarray, y: np.ndarray) -> None:
         """
@@ -62,20 +148,106 @@ class GaussianProcess:
             X: Input points
             y: Target values
         """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        # Length of the prefix shared with the cached factor
+        n_shared = 0
+        if self.L is not None:
+            limit = min(len(self.X), len(X))
+            same = np.all(self.X[:limit] == X[:limit], axis=1)
+            n_shared = limit if same.all() else int(np.argmin(same))
+
+        L11 = self.L[:n_shared, :n_shared] if n_shared else None
+        X_new = X[n_shared:]
+        K22 = self._kernel(X_new, X_new) + self.noise * np.eye(len(X_new))
+        if not len(X_new):
+            L = L11
+        elif n_shared:
+            K12 = self._kernel(X[:n_shared], X_new)
+            L21 = solve_triangular(L11, K12, lower=True).T
+            L22 = cholesky(K22 - L21 @ L21.T, lower=True)
+            L = np.block([[L11, np.zeros((n_shared, len(X_new)))], [L21, L22]])
+        else:
+            L = cholesky(K22, lower=True)
+
         self.X = X
         self.y = y
-
-    def predict(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        self.L = L
+        self.alpha = cho_solve((L, True), y)
+        self._cache_training_fp32()
+
+    def _cache_training_fp32(self) -> None:
+        """Keep an FP32 copy of the training inputs for cross-covariances."""
+        self._X32 = np.asarray(self.X, dtype=np.float32)
+        self._X32_sq_norms = np.einsum("ij,ij->i", self._X32, self._X32)
+
+    def predict(
+        self, X: np.ndarray, fp32: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Make predictions with uncertainty.
 
         Args:
             X: Points to predict at
+            fp32: Evaluate the cross-covariance in FP32, for screening many
+                points when only their ranking matters
 
         Returns:
             Tuple of (mean, variance) arrays
         """
-        raise NotImplementedError
+        if self.L is None:
+            raise OptimizationError("GaussianProcess.predict called before fit")
+        if fp32:
+            # FP32 kernel evaluation, FP64 for the solve where conditioning matters
+            K_s = self._cross_kernel32(X).astype(np.float64)
+        else:
+            K_s = self._kernel(np.asarray(X, dtype=float), self.X)
+        mean = K_s @ self.alpha
+        v = solve_triangular(self.L, K_s.T, lower=True)
+        variance = np.clip(1.0 - np.sum(v**2, axis=0), 0.0, None)
+        return mean, variance
+
+    def get_state(self) -> Dict[str, Any]:
+        """Return the fitted posterior state and hyperparameters."""
+        return {
+            "L": self.L,
+            "alpha": self.alpha,
+            "X_train": self.X,
+            "y_train": self.y,
+            "hypers": {
+                "kernel": self.kernel,
+                "length_scale": self.length_scale,
+                "noise": self.noise,
+            },
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a posterior previously returned by get_state().
+
+        Raises:
+            ValueError: If the arrays disagree on the number of observations
+        """
+        n = len(state["y_train"])
+        if (
+            np.shape(state["L"]) != (n, n)
+            or np.shape(state["alpha"]) != (n,)
+            or len(state["X_train"]) != n
+        ):
+            raise ValueError(
+                f"Inconsistent GP state: expected {n} observations in L, "
+                "alpha and X_train"
+            )
+        hypers = state["hypers"]
+        self.kernel = hypers["kernel"]
+        self.length_scale = hypers["length_scale"]
+        self.noise = hypers["noise"]
+        self.L = state["L"]
+        self.alpha = state["alpha"]
+        self.X = state["X_train"]
+        self.y = state["y_train"]
+        self._cache_training_fp32()
 
 
 class BayesianOptimization(SearchStrategy):
@@ -92,8 +264,12 @@ class BayesianOptimization(SearchStrategy):
         gp (GaussianProcess): The surrogate model
         acquisition_function (str): Type of acquisition function
         exploration_weight (float): Exploration-exploitation trade-off
+        num_candidates (int): Random points screened per suggestion
+        num_restarts (int): Screened points refined with L-BFGS-B
     """
 
+    pending_fantasies = SearchStrategy.pending_fantasies + ("believer",)
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Bayesian optimization strategy.
@@ -105,6 +281,8 @@ class BayesianOptimization(SearchStrategy):
                 - kernel: GP kernel type
                 - length_scale: GP kernel length scale
                 - exploration_weight: Acquisition function parameter
+                - num_candidates: Random points screened per suggestion
+                - num_restarts: Best screened points refined with L-BFGS-B
         """
         if "dimensions" not in config:
             raise ValueError("BayesianOptimization requires 'dimensions' in config")
@@ -114,6 +292,8 @@ class BayesianOptimization(SearchStrategy):
             "acquisition_function", "expected_improvement"
         )
         self.exploration_weight = config.get("exploration_weight", 0.1)
+        self.num_candidates = config.get("num_candidates", 2048)
+        self.num_restarts = config.get("num_restarts", 5)
         self.num_trials = config.get("num_trials", 10)
         self.parallel = config.get("parallel", False)
 
@@ -121,6 +301,9 @@ class BayesianOptimization(SearchStrategy):
             kernel=config.get("kernel", "matern"),
             length_scale=config.get("length_scale", 1.0),
         )
+        # Observations restored from a persisted GP posterior
+        self._prior_X = np.empty((0, self.dimensions))
+        self._prior_y = np.empty(0)
 
     def _setup_search_space(self) -> None:
         """Initialize the GP model and bounds."""
@@ -132,7 +315,8 @@ class BayesianOptimization(SearchStrategy):
 
         The suggestion process:
         1. If not enough data, fall back to random sampling
-        2. Otherwise, optimize acquisition function
+        2. Otherwise, screen random candidates with one vectorized
+           acquisition evaluation and refine the best few with L-BFGS-B
         3. Convert optimal point to architecture vector
 
         Returns:
@@ -141,22 +325,26 @@ class BayesianOptimization(SearchStrategy):
         Raises:
             OptimizationError: If acquisition optimization fails
         """
-        if len(self.history) < self.dimensions:
+        if len(self._prior_y) + len(self.history) < self.dimensions:
             return await self._random_architecture()
 
-        X = np.array([h["architecture"].vector for h in self.history])
-        y = np.array([h["results"]["objective"] for h in self.history])
+        # Pending points carry fantasized objectives so batch suggestions spread out
+        self.gp.fit(*self._training_data(include_pending=True))
 
-        self.gp.fit(X, y)
+        # Start the local optimizer only from the most promising candidates.
+        # Both stages work on the log of the acquisition: same maximizer, but
+        # no underflow to flat zero far from the incumbent. The screen only
+        # ranks, so it runs in FP32; the refine needs FP64 gradients
+        candidates = np.random.uniform(0, 1, (self.num_candidates, self.dimensions))
+        scores = self._log_acquisition_batch(candidates, fp32=True)
+        num_starts = min(self.num_restarts, len(candidates))
+        starts = candidates[np.argpartition(-scores, num_starts - 1)[:num_starts]]
 
-        # Optimize acquisition function
         best_x = None
-        best_value = float("-inf")
-
-        for _ in range(10):  # Multiple random starts
-            x0 = np.random.uniform(0, 1, self.dimensions)
+        best_value = float("inf")
+        for x0 in starts:
             res = minimize(
-                lambda x: -self._acquisition(x),
+                lambda x: -self._log_acquisition_batch(x.reshape(1, -1))[0],
                 x0,
                 bounds=self.bounds,
                 method="L-BFGS-B",
@@ -169,6 +357,50 @@ class BayesianOptimization(SearchStrategy):
         vector.vector = best_x
         return vector
 
+    async def suggest_architectures(
+        self, num_architectures: int, pending_fantasy: str = "believer"
+    ) -> List[ArchitectureVector]:
+        """
+        Suggest a batch of architectures from a single GP fit.
+
+        By default pending points are imputed with the GP posterior mean
+        (Kriging Believer). The GP is fitted in full once, for the first
+        suggestion; each later suggestion only appends its predecessor to
+        the cached Cholesky factor instead of refitting.
+
+        Args:
+            num_architectures: Number of architectures to suggest
+            pending_fantasy: "believer", or a base rule ("mean", "min", "max")
+
+        Returns:
+            List of ArchitectureVector instances
+        """
+        return await super().suggest_architectures(num_architectures, pending_fantasy)
+
+    def _fantasy_objective(
+        self, architecture: ArchitectureVector, pending_fantasy: str
+    ) -> float:
+        """Impute a pending objective, using the GP mean for "believer"."""
+        if pending_fantasy != "believer":
+            return super()._fantasy_objective(architecture, pending_fantasy)
+        if self.gp.L is None:
+            # Still sampling at random; fall back to the observed mean
+            return super()._fantasy_objective(architecture, "mean")
+        mean, _ = self.gp.predict(np.reshape(architecture.vector, (1, -1)))
+        return float(mean[0])
+
+    def _training_data(self, include_pending: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Stack restored, observed and optionally pending points for the GP."""
+        observations = self.history + self.pending if include_pending else self.history
+        X = np.vstack(
+            [self._prior_X]
+            + [np.reshape(h["architecture"].vector, (1, -1)) for h in observations]
+        )
+        y = np.concatenate(
+            [self._prior_y, [h["results"]["objective"] for h in observations]]
+        )
+        return X, y
+
     async def _random_architecture(self) -> ArchitectureVector:
         """Generate a random architecture for initial exploration."""
         vector = ArchitectureVector(self.dimensions)
@@ -187,18 +419,80 @@ class BayesianOptimization(SearchStrategy):
         Returns:
             Acquisition function value
         """
-        mu, sigma = self.gp.predict(x.reshape(1, -1))
+        return float(self._acquisition_batch(x.reshape(1, -1))[0])
+
+    def _acquisition_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute acquisition function values for many points at once.
+
+        Args:
+            X: Points to evaluate, one per row
+
+        Returns:
+            Acquisition function value per point
+        """
+        return np.exp(self._log_acquisition_batch(X))
+
+    def _log_acquisition_batch(self, X: np.ndarray, fp32: bool = False) -> np.ndarray:
+        """
+        Compute the log of the acquisition function for many points at once.
+
+        Expected improvement plus the exploration bonus is
+        sigma * (h(z) + exploration_weight), evaluated in log space.
+
+        Args:
+            X: Points to evaluate, one per row
+            fp32: Use the FP32 GP cross-covariance, for ranking only
+
+        Returns:
+            Log acquisition function value per point
+        """
+        mu, variance = self.gp.predict(X, fp32=fp32)
+        sigma = np.sqrt(np.maximum(variance, 1e-18))
 
         if self.acquisition_function == "expected_improvement":
             best_f = np.max(self.gp.y)
-            z = (mu - best_f) / sigma
-            ei = sigma * (z * norm.cdf(z) + norm.pdf(z))
-            return float(ei + self.exploration_weight * sigma)
+            log_h = _log_h((mu - best_f) / sigma)
+            if self.exploration_weight > 0:
+                log_h = np.logaddexp(log_h, np.log(self.exploration_weight))
+            return np.log(sigma) + log_h
         else:
             raise ValueError(
                 f"Unknown acquisition function: {self.acquisition_function}"
             )
 
+    def get_gp_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the current GP posterior for persistence.
+
+        Fantasized pending points are never persisted; the GP is refitted on
+        real observations only, which reuses the cached factor for them.
+
+        Returns:
+            Dictionary with L, alpha, X_train, y_train and hypers, or None
+            if there are no observations yet
+        """
+        X, y = self._training_data(include_pending=False)
+        if not len(y):
+            return None
+        self.gp.fit(X, y)
+        return self.gp.get_state()
+
+    def set_gp_state(self, state: Dict[str, Any]) -> None:
+        """
+        Warm-start from a persisted GP posterior.
+
+        The restored training points count as prior observations, and the
+        cached Cholesky factor is extended rather than recomputed when new
+        results arrive.
+
+        Args:
+            state: Dictionary as returned by get_gp_state()
+        """
+        self.gp.set_state(state)
+        self._prior_X = np.asarray(state["X_train"])
+        self._prior_y = np.asarray(state["y_train"])
+
     async def update_with_results(
         self, architecture: ArchitectureVector, results: Dict[str, float]
     ) -> None:
@@ -209,7 +503,7 @@ class BayesianOptimization(SearchStrategy):
             architecture: The evaluated architecture
             results: Dictionary of metric values
         """
-        self.history.append({"architecture": architecture, "results": results})
+        self._real_register(architecture, results)
 
     async def get_best_architectures(
         self, metric: str, num_architectures: int = 1
@@ -227,11 +521,11 @@ class BayesianOptimization(SearchStrategy):
         if not self.history:
             return []
 
-        sorted_history = sorted(
-            self.history, key=lambda x: x["results"][metric], reverse=True
+        best = heapq.nlargest(
+            num_architectures, self.history, key=lambda x: x["results"][metric]
         )
 
-        return [h["architecture"] for h in sorted_history[:num_architectures]]
+        return [h["architecture"] for h in best]
 
 
 class OptimizationError(Exception):
@@ -14,6 +14,7 @@ Example:
 """
 
 from typing import Dict, Any, List, Optional
+import heapq
 import numpy as np
 import logging
 
@@ -52,14 +53,17 @@ class RandomSearch(SearchStrategy):
         """
         self.dimensions = config.get("dimensions", 64)
         super().__init__(config)
-        self.bounds = config.get("bounds", {})
         self.num_samples = config.get("num_samples", float("inf"))
         self.current_sample = 0
 
     def _setup_search_space(self) -> None:
         """Initialize search space bounds from configuration."""
-        if not self.bounds:
-            self.bounds = {f"dim_{i}": (0.0, 1.0) for i in range(self.dimensions)}
+        self.bounds = self.config.get("bounds") or {
+            f"dim_{i}": (0.0, 1.0) for i in range(self.dimensions)
+        }
+        # Limits as arrays, so a whole vector is sampled in one call
+        limits = np.array(list(self.bounds.values()), dtype=np.float64)
+        self._low, self._high = limits.reshape(-1, 2).T
 
     async def suggest_architecture(self) -> ArchitectureVector:
         """
@@ -75,12 +79,50 @@ class RandomSearch(SearchStrategy):
             raise SearchSpaceExhausted(f"Reached maximum samples: {self.num_samples}")
 
         vector = ArchitectureVector(self.dimensions)
-        for i, (min_val, max_val) in enumerate(self.bounds.values()):
-            vector.vector[i] = np.random.uniform(min_val, max_val)
+        vector.vector[: len(self._low)] = np.random.uniform(self._low, self._high)
 
         self.current_sample += 1
         return vector
 
+    async def suggest_architectures(
+        self, num_architectures: int, pending_fantasy: str = "mean"
+    ) -> List[ArchitectureVector]:
+        """
+        Suggest several random architectures, drawn as one block.
+
+        Random samples do not depend on earlier suggestions, so the whole
+        batch comes from a single (num_architectures, dimensions) draw
+        instead of one draw per vector.
+
+        Args:
+            num_architectures: Number of architectures to suggest
+            pending_fantasy: Imputation rule for the pending points, one of
+                pending_fantasies
+
+        Returns:
+            List of ArchitectureVector instances
+
+        Raises:
+            SearchSpaceExhausted: If the batch would exceed num_samples
+        """
+        if pending_fantasy not in self.pending_fantasies:
+            raise ValueError(f"Unknown pending_fantasy: {pending_fantasy}")
+        if self.current_sample + num_architectures > self.num_samples:
+            raise SearchSpaceExhausted(f"Reached maximum samples: {self.num_samples}")
+
+        samples = np.random.uniform(
+            self._low, self._high, size=(num_architectures, len(self._low))
+        )
+        suggestions = []
+        for sample in samples:
+            vector = ArchitectureVector(self.dimensions)
+            vector.vector[: len(sample)] = sample
+            self._fantasy_register(vector, pending_fantasy)
+            suggestions.append(vector)
+
+        self.current_sample += num_architectures
+        return suggestions
+
     async def update_with_results(
         self, architecture: ArchitectureVector, results: Dict[str, float]
     ) -> None:
@@ -91,13 +133,7 @@ class RandomSearch(SearchStrategy):
             architecture: The evaluated architecture
             results: Dictionary of metric values
         """
-        self.history.append(
-            {
-                "architecture": architecture,
-                "results": results,
-                "sample_num": self.current_sample,
-            }
-        )
+        self._real_register(architecture, results, sample_num=self.current_sample)
 
     async def get_best_architectures(
         self, metric: str, num_architectures: int = 1
@@ -115,11 +151,11 @@ class RandomSearch(SearchStrategy):
         if not self.history:
             return []
 
-        sorted_history = sorted(
-            self.history, key=lambda x: x["results"][metric], reverse=True
+        best = heapq.nlargest(
+            num_architectures, self.history, key=lambda x: x["results"][metric]
         )
 
-        return [h["architecture"] for h in sorted_history[:num_architectures]]
+        return [h["architecture"] for h in best]
 
 
 class SearchSpaceExhausted(Exception):
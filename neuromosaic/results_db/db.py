@@ -2,19 +2,95 @@
 Implementation of the results database interface using SQLAlchemy.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+)
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import json
+import asyncio
+import functools
+import heapq
+import itertools
+from pathlib import Path
 import logging
-from sqlalchemy import create_engine, or_
-from sqlalchemy.orm import sessionmaker, Session
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import numpy as np
+import orjson
+from sqlalchemy import (
+    create_engine,
+    delete,
+    event,
+    func,
+    literal_column,
+    or_,
+    text,
+    update,
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Query, sessionmaker, Session
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlalchemy.dialects.sqlite import insert
 
+from ..utils import sqlite as sqlite_tuning
+from ..utils.ids import new_id
 from .db_interface import ResultsDB as BaseResultsDB
 from .models import Base, Architecture, Experiment, Run
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Metric names that are safe to inline into a JSON path and an index name
+_METRIC_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Experiment IDs that are safe to use as a directory name
+_EXPERIMENT_DIR_NAME = re.compile(r"[A-Za-z0-9_-]+")
+
+# Names the GP state generation currently in use, within an experiment's dir
+_GP_STATE_POINTER = "CURRENT"
+
+# Columns read back for each table; plain row tuples skip building ORM
+# instances and their identity-map bookkeeping for every row
+_RUN_COLUMNS = (
+    Run.id,
+    Run.experiment_id,
+    Run.architecture_id,
+    Run.metrics,
+    Run.timestamp,
+)
+_ARCHITECTURE_COLUMNS = (
+    Architecture.vector_hash,
+    Architecture.arch_spec,
+    Architecture.code_commit,
+    Architecture.creation_time,
+)
+_EXPERIMENT_COLUMNS = (
+    Experiment.id,
+    Experiment.status,
+    Experiment.start_time,
+    Experiment.end_time,
+    Experiment.config,
+)
+
+# Size and lifetime of the experiment and architecture lookup caches
+_LOOKUP_CACHE_SIZE = 1024
+_LOOKUP_CACHE_TTL = 5.0
+
 _db_instance: Optional[BaseResultsDB] = None
 
 
@@ -38,6 +114,90 @@ def get_db_instance(config: Optional[Dict[str, Any]] = None) -> BaseResultsDB:
     return _db_instance
 
 
+def close_db_instance() -> None:
+    """Close the shared database instance, if one was created."""
+    global _db_instance
+
+    if _db_instance is not None:
+        _db_instance.close()
+        _db_instance = None
+
+
+def _in_executor(method: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Expose a blocking ResultsDB method as a coroutine run on its executor.
+
+    The sqlite3 driver is synchronous, so running queries inline would stall
+    the event loop of every caller for the duration of each query.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "ResultsDB", *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(method, self, *args, **kwargs)
+        )
+
+    return wrapper
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value for a JSON text column."""
+    return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+
+
+def _loads_object(raw: Optional[str]) -> Dict[str, Any]:
+    """
+    Decode a JSON object column.
+
+    Each call parses afresh, so callers own the result, nested values
+    included, and are free to modify it.
+    """
+    return orjson.loads(raw) if raw else {}
+
+
+class _TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after a fixed time.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept
+        ttl_seconds (float): Entry lifetime
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, expiry deadline)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the live value for a key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """Drop a key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
 class ResultsDB(BaseResultsDB):
     """Implementation of the results database interface using SQLAlchemy."""
 
@@ -48,19 +208,108 @@ class ResultsDB(BaseResultsDB):
         if hasattr(config, "database"):
             db_config = config.database
             self.db_url = db_config.db_url
+            gp_state_dir = getattr(db_config, "gp_state_dir", "gp_state")
+            storage_root = getattr(getattr(config, "storage", None), "root", "data")
         else:
             db_config = config.get("database", {})
             self.db_url = db_config.get("db_url", "sqlite:///results.db")
-
-        self.engine = create_engine(self.db_url, echo=False)
+            gp_state_dir = db_config.get("gp_state_dir", "gp_state")
+            storage_root = config.get("storage", {}).get("root", "data")
+        self.gp_state_dir = self._resolve_gp_state_dir(
+            gp_state_dir, self.db_url, storage_root
+        )
+
+        self.engine = create_engine(
+            self.db_url, echo=False, **self._engine_options(self.db_url)
+        )
+        if self.engine.dialect.name == "sqlite":
+            event.listen(
+                self.engine,
+                "connect",
+                lambda dbapi_conn, _: sqlite_tuning.tune_connection(dbapi_conn),
+            )
         self.Session = sessionmaker(bind=self.engine)
         Base.metadata.create_all(self.engine)
+        # create_all skips existing tables, including indexes added later
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        self._metric_indexes = set()
+        # Primary-key lookups polled by the UI; rows are cached, not dicts, so
+        # each hit still hands out fresh dicts. Misses are not cached
+        self._experiment_rows = _TTLCache(_LOOKUP_CACHE_SIZE, _LOOKUP_CACHE_TTL)
+        self._architecture_rows = _TTLCache(_LOOKUP_CACHE_SIZE, _LOOKUP_CACHE_TTL)
+        # One worker per pooled connection; the single connection behind an
+        # in-memory database must not be used from two threads at once
+        pool = self.engine.pool
+        workers = 1 if isinstance(pool, StaticPool) else pool.size()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="results-db"
+        )
+
+    @staticmethod
+    def _resolve_gp_state_dir(
+        gp_state_dir: str, db_url: str, storage_root: str
+    ) -> Path:
+        """
+        Anchor a relative GP state directory to a stable location.
+
+        A relative path is taken relative to the directory of a file-backed
+        SQLite database, otherwise to the storage root, so the state is found
+        again whatever the working directory of a later run.
+        """
+        path = Path(gp_state_dir)
+        if path.is_absolute():
+            return path
+        url = make_url(db_url)
+        if url.get_backend_name() == "sqlite" and url.database not in (
+            None,
+            "",
+            ":memory:",
+        ):
+            return Path(url.database).resolve().parent / path
+        return Path(storage_root).resolve() / path
+
+    @staticmethod
+    def _engine_options(db_url: str) -> Dict[str, Any]:
+        """
+        Engine settings for the configured backend.
+
+        SQLite connections are kept open across calls, so sessions reuse a
+        tuned connection instead of paying for a new connection and its
+        PRAGMAs each time. An in-memory database is held on a single shared
+        connection so every session sees the same data. With psycopg2, the
+        executemany used by bulk writes is sent as paged multi-row
+        statements rather than one round trip per row.
+        """
+        url = make_url(db_url)
+        if url.get_backend_name() == "postgresql":
+            if url.get_driver_name() == "psycopg2":
+                return {"executemany_mode": "values_plus_batch"}
+            return {}
+        if url.get_backend_name() != "sqlite":
+            return {}
+        options = {"connect_args": {"check_same_thread": False}}
+        if url.database in (None, "", ":memory:"):
+            options["poolclass"] = StaticPool
+        else:
+            options.update(poolclass=QueuePool, pool_size=5)
+        return options
 
     def _get_session(self) -> Session:
         """Get a new database session."""
         return self.Session()
 
-    async def list_all_runs(
+    def close(self) -> None:
+        """Refresh SQLite planner statistics and close pooled connections."""
+        self._executor.shutdown(wait=True)
+        if self.engine.dialect.name == "sqlite":
+            with self.engine.connect() as conn:
+                sqlite_tuning.optimize(conn.connection.dbapi_connection)
+        self.engine.dispose()
+
+    @_in_executor
+    def list_all_runs(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
@@ -68,145 +317,308 @@ class ResultsDB(BaseResultsDB):
     ) -> List[Dict[str, Any]]:
         """List all runs in the database."""
         with self._get_session() as session:
-            query = session.query(Run)
+            rows = self._query_runs(session, start_date, end_date, **filters).all()
+        return [self._run_row_to_dict(row) for row in rows]
 
-            if start_date:
-                query = query.filter(Run.timestamp >= start_date)
-            if end_date:
-                query = query.filter(Run.timestamp <= end_date)
+    async def iter_all_runs(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        batch_size: int = 1000,
+        **filters,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream runs instead of materializing them all.
+
+        Rows are fetched from the cursor batch_size at a time, so memory stays
+        bounded and the first runs arrive before the query is exhausted. The
+        read transaction stays open until the iterator is exhausted or closed.
+        """
+        loop = asyncio.get_running_loop()
+        with self._get_session() as session:
+            query = self._query_runs(session, start_date, end_date, **filters)
+            rows = iter(query.yield_per(batch_size))
+            while True:
+                batch = await loop.run_in_executor(
+                    self._executor, list, itertools.islice(rows, batch_size)
+                )
+                if not batch:
+                    break
+                for row in batch:
+                    yield self._run_row_to_dict(row)
 
-            for key, value in filters.items():
-                if hasattr(Run, key):
-                    query = query.filter(getattr(Run, key) == value)
+    def _query_runs(
+        self,
+        session: Session,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        **filters,
+    ) -> Query:
+        """Build a filtered query over the run columns returned to callers."""
+        query = session.query(*_RUN_COLUMNS)
+        return self._filter_runs(query, start_date, end_date, **filters)
+
+    @staticmethod
+    def _run_row_to_dict(row: Any) -> Dict[str, Any]:
+        run_id, experiment_id, architecture_id, metrics, timestamp = row
+        return {
+            "id": run_id,
+            "experiment_id": experiment_id,
+            "architecture_id": architecture_id,
+            "metrics": _loads_object(metrics),
+            "timestamp": timestamp.isoformat() if timestamp else None,
+        }
+
+    @staticmethod
+    def _architecture_row_to_dict(row: Any) -> Dict[str, Any]:
+        vector_hash, arch_spec, code_commit, creation_time = row
+        return {
+            "id": vector_hash,
+            "arch_spec": orjson.loads(arch_spec),
+            "code_commit": code_commit,
+            "creation_time": creation_time.isoformat(),
+        }
+
+    @staticmethod
+    def _experiment_row_to_dict(row: Any) -> Dict[str, Any]:
+        experiment_id, status, start_time, end_time, config = row
+        return {
+            "id": experiment_id,
+            "status": status,
+            "start_time": start_time.isoformat() if start_time else None,
+            "end_time": end_time.isoformat() if end_time else None,
+            "config": _loads_object(config),
+        }
+
+    @staticmethod
+    def _filter_runs(
+        query: Query,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        **filters,
+    ) -> Query:
+        """Apply date bounds and column equality filters to a runs query."""
+        if start_date:
+            query = query.filter(Run.timestamp >= start_date)
+        if end_date:
+            query = query.filter(Run.timestamp <= end_date)
+
+        for key, value in filters.items():
+            if hasattr(Run, key):
+                query = query.filter(getattr(Run, key) == value)
+        return query
+
+    @_in_executor
+    def get_best_architectures(
+        self, metric: str, limit: int = 10, **filters
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the best architectures based on a metric.
+
+        On SQLite the metric is extracted, filtered and sorted in SQL, backed
+        by an expression index created the first time the metric is queried,
+        so only the returned rows are parsed. Other backends sort in Python.
+
+        Raises:
+            ValueError: If metric is not a plain identifier
+        """
+        if not _METRIC_NAME.fullmatch(metric):
+            raise ValueError(f"Invalid metric name: {metric!r}")
+        if self.engine.dialect.name != "sqlite":
+            return self._best_architectures_in_python(metric, limit, **filters)
+
+        self._ensure_metric_index(metric)
+        # Must match the indexed expression exactly for the index to be used
+        value = literal_column(f"json_extract(runs.metrics, '$.{metric}')")
+        with self._get_session() as session:
+            query = session.query(Run.architecture_id, Run.metrics).filter(
+                func.json_type(Run.metrics, f"$.{metric}").in_(("integer", "real"))
+            )
+            rows = (
+                self._filter_runs(query, **filters)
+                .order_by(value.desc())
+                .limit(limit)
+                .all()
+            )
+        return [
+            {"architecture_id": architecture_id, "metrics": _loads_object(metrics)}
+            for architecture_id, metrics in rows
+        ]
 
-            runs = query.all()
-            return [
-                {
-                    "id": run.id,
-                    "experiment_id": run.experiment_id,
-                    "architecture_id": run.architecture_id,
-                    "metrics": json.loads(run.metrics) if run.metrics else {},
-                    "timestamp": run.timestamp.isoformat() if run.timestamp else None,
-                }
-                for run in runs
-            ]
+    def _ensure_metric_index(self, metric: str) -> None:
+        """Create the SQLite expression index for a metric, once."""
+        if metric in self._metric_indexes:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_runs_metric_{metric} "
+                    f"ON runs (json_extract(metrics, '$.{metric}'))"
+                )
+            )
+        self._metric_indexes.add(metric)
 
-    async def get_best_architectures(
-        self, metric: str, limit: int = 10, **filters
+    def _best_architectures_in_python(
+        self, metric: str, limit: int, **filters
     ) -> List[Dict[str, Any]]:
-        """Get the best architectures based on a metric."""
-        # Get all runs that match filters
-        all_runs = await self.list_all_runs(**filters)
-
-        # Filter out runs that have that metric and ensure it's numeric
-        valid_runs = []
-        for run in all_runs:
-            val = run["metrics"].get(metric)
-            if isinstance(val, (int, float)):
-                valid_runs.append(run)
-
-        # Sort descending by the metric
-        valid_runs.sort(key=lambda r: r["metrics"][metric], reverse=True)
-
-        # Return top N
-        best = valid_runs[:limit]
+        """Rank runs by a metric in Python, for backends without json_extract."""
+        with self._get_session() as session:
+            query = session.query(Run.architecture_id, Run.metrics)
+            rows = self._filter_runs(query, **filters).all()
+
+        # Keep only runs where the metric is numeric
+        candidates = []
+        for architecture_id, metrics in rows:
+            metric_data = _loads_object(metrics)
+            val = metric_data.get(metric)
+            if isinstance(val, (int, float)) and not isinstance(val, bool):
+                candidates.append((val, architecture_id, metric_data))
+
+        # Partial sort: O(N log limit) rather than sorting every run
+        best = heapq.nlargest(limit, candidates, key=lambda c: c[0])
         return [
-            {"architecture_id": run["architecture_id"], "metrics": run["metrics"]}
-            for run in best
+            {"architecture_id": architecture_id, "metrics": metric_data}
+            for _, architecture_id, metric_data in best
         ]
 
-    async def save_run_info(self, run_info: Dict[str, Any]) -> str:
+    @_in_executor
+    def save_run_info(self, run_info: Dict[str, Any]) -> str:
         """Save run information to the database."""
-        run_id = run_info.get("id", str(datetime.now().timestamp()))
-        architecture_id = run_info["architecture_id"]
+        with self._get_session() as session:
+            (run_id,) = self._add_runs(session, [run_info])
+            session.commit()
+        return run_id
 
+    @_in_executor
+    def save_run_info_batch(self, run_infos: List[Dict[str, Any]]) -> List[str]:
+        """Save several runs in a single transaction."""
         with self._get_session() as session:
-            # Upsert architecture if arch_spec is provided
+            run_ids = self._add_runs(session, run_infos)
+            session.commit()
+        return run_ids
+
+    def _add_runs(self, session: Session, run_infos: List[Dict[str, Any]]) -> List[str]:
+        """
+        Insert runs, and their architectures if new, on an open session.
+
+        Rows are prepared first and then written with one executemany per
+        table, so the statement count does not grow with the batch.
+        """
+        now = datetime.now()
+        run_ids, architectures, runs = [], [], []
+        for run_info in run_infos:
+            run_id = run_info["id"] if "id" in run_info else new_id()
+            architecture_id = run_info["architecture_id"]
+
             arch_spec = run_info.get("arch_spec")
             if arch_spec:
-                stmt = insert(Architecture).values(
-                    vector_hash=architecture_id,
-                    arch_spec=json.dumps(arch_spec),
-                    code_commit=run_info.get("code_commit"),
+                architectures.append(
+                    {
+                        "vector_hash": architecture_id,
+                        "arch_spec": _dumps(arch_spec),
+                        "code_commit": run_info.get("code_commit"),
+                    }
                 )
-                # On conflict do nothing (SQLite 3.24+)
-                stmt = stmt.on_conflict_do_nothing(index_elements=["vector_hash"])
-                session.execute(stmt)
-
-            run = Run(
-                id=run_id,
-                experiment_id=run_info.get("experiment_id"),
-                architecture_id=architecture_id,
-                metrics=json.dumps(run_info["metrics"]),
-                timestamp=datetime.now(),
+            runs.append(
+                {
+                    "id": run_id,
+                    "experiment_id": run_info.get("experiment_id"),
+                    "architecture_id": architecture_id,
+                    "metrics": _dumps(run_info["metrics"]),
+                    "timestamp": now,
+                }
             )
-            session.add(run)
-            session.commit()
-        return run_id
+            run_ids.append(run_id)
+
+        if architectures:
+            # Upsert architectures: on conflict do nothing (SQLite 3.24+)
+            stmt = insert(Architecture).on_conflict_do_nothing(
+                index_elements=["vector_hash"]
+            )
+            session.execute(stmt, architectures)
+        if runs:
+            session.execute(insert(Run), runs)
+        return run_ids
 
     async def get_experiment_details(
         self, experiment_id: str
     ) -> Optional[Dict[str, Any]]:
         """Get details of a specific experiment."""
+        row = self._experiment_rows.get(experiment_id)
+        if row is None:
+            row = await self._fetch_experiment_row(experiment_id)
+        return self._experiment_row_to_dict(row) if row else None
+
+    # Same lookup under the name used by the API interface
+    get_experiment = get_experiment_details
+
+    @_in_executor
+    def _fetch_experiment_row(self, experiment_id: str) -> Optional[Any]:
         with self._get_session() as session:
-            experiment = session.get(Experiment, experiment_id)
-            if experiment is None:
-                return None
-            return {
-                "id": experiment.id,
-                "status": experiment.status,
-                "start_time": (
-                    experiment.start_time.isoformat() if experiment.start_time else None
-                ),
-                "end_time": (
-                    experiment.end_time.isoformat() if experiment.end_time else None
-                ),
-                "config": json.loads(experiment.config) if experiment.config else {},
-            }
-
-    async def create_experiment(
+            row = (
+                session.query(*_EXPERIMENT_COLUMNS)
+                .filter(Experiment.id == experiment_id)
+                .one_or_none()
+            )
+        if row is not None:
+            self._experiment_rows.put(experiment_id, row)
+        return row
+
+    @_in_executor
+    def create_experiment(
         self, name: str, description: Optional[str], config: Dict[str, Any]
     ) -> str:
         """Create a new experiment."""
-        experiment_id = str(datetime.now().timestamp())
+        experiment_id = new_id()
         with self._get_session() as session:
             experiment = Experiment(
                 id=experiment_id,
                 status="created",
                 start_time=datetime.now(),
-                config=json.dumps({"name": name, "description": description, **config}),
+                config=_dumps({"name": name, "description": description, **config}),
             )
             session.add(experiment)
             session.commit()
         return experiment_id
 
-    async def update_experiment_status(self, experiment_id: str, status: str) -> None:
+    @_in_executor
+    def update_experiment_status(self, experiment_id: str, status: str) -> None:
         """Update the status of an experiment."""
+        values = {"status": status}
+        if status == "completed":
+            values["end_time"] = datetime.now()
+        # A single UPDATE; the row count tells us whether the experiment exists
         with self._get_session() as session:
-            experiment = session.get(Experiment, experiment_id)
-            if experiment:
-                experiment.status = status
-                if status == "completed":
-                    experiment.end_time = datetime.now()
-                session.commit()
-            else:
-                logger.warning(f"No experiment found with id={experiment_id}")
-
-    async def delete_experiment(self, experiment_id: str) -> bool:
+            result = session.execute(
+                update(Experiment)
+                .where(Experiment.id == experiment_id)
+                .values(**values)
+            )
+            session.commit()
+        self._experiment_rows.pop(experiment_id)
+        if result.rowcount == 0:
+            logger.warning(f"No experiment found with id={experiment_id}")
+
+    @_in_executor
+    def delete_experiment(self, experiment_id: str) -> bool:
         """Delete an experiment."""
         with self._get_session() as session:
-            experiment = session.get(Experiment, experiment_id)
-            if experiment is None:
-                return False
-            session.delete(experiment)
+            # Mirrors the ON DELETE SET NULL declared on runs.experiment_id,
+            # which SQLite does not enforce here
+            session.execute(
+                update(Run)
+                .where(Run.experiment_id == experiment_id)
+                .values(experiment_id=None)
+            )
+            result = session.execute(
+                delete(Experiment).where(Experiment.id == experiment_id)
+            )
             session.commit()
-            return True
+        self._experiment_rows.pop(experiment_id)
+        return result.rowcount > 0
 
-    async def get_experiment(self, experiment_id: str) -> Optional[Dict[str, Any]]:
-        """Get experiment details by ID."""
-        return await self.get_experiment_details(experiment_id)
-
-    async def get_metrics(
+    @_in_executor
+    def get_metrics(
         self,
         experiment_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
@@ -215,90 +627,166 @@ class ResultsDB(BaseResultsDB):
     ) -> List[Dict[str, Any]]:
         """Get metrics with optional filtering."""
         with self._get_session() as session:
-            query = session.query(Run)
+            query = session.query(Run.experiment_id, Run.metrics, Run.timestamp)
 
             if experiment_id:
-                query = query.filter_by(experiment_id=experiment_id)
+                query = query.filter(Run.experiment_id == experiment_id)
             if start_time:
                 query = query.filter(Run.timestamp >= start_time)
             if end_time:
                 query = query.filter(Run.timestamp <= end_time)
 
-            runs = query.all()
-            metrics = []
-            for run in runs:
-                metric_data = json.loads(run.metrics) if run.metrics else {}
-                if metric_names:
-                    metric_data = {
-                        k: v for k, v in metric_data.items() if k in metric_names
-                    }
-                metrics.append(
-                    {
-                        "experiment_id": run.experiment_id,
-                        "metrics": metric_data,
-                        "timestamp": (
-                            run.timestamp.isoformat() if run.timestamp else None
-                        ),
-                    }
-                )
-            return metrics
+            rows = query.all()
+
+        wanted = set(metric_names) if metric_names else None
+        metrics = []
+        for run_experiment_id, run_metrics, timestamp in rows:
+            metric_data = _loads_object(run_metrics)
+            if wanted:
+                metric_data = {k: v for k, v in metric_data.items() if k in wanted}
+            metrics.append(
+                {
+                    "experiment_id": run_experiment_id,
+                    "metrics": metric_data,
+                    "timestamp": timestamp.isoformat() if timestamp else None,
+                }
+            )
+        return metrics
 
     async def get_architecture(self, architecture_id: str) -> Optional[Dict[str, Any]]:
         """Get architecture details by ID."""
+        row = self._architecture_rows.get(architecture_id)
+        if row is None:
+            row = await self._fetch_architecture_row(architecture_id)
+        return self._architecture_row_to_dict(row) if row else None
+
+    @_in_executor
+    def _fetch_architecture_row(self, architecture_id: str) -> Optional[Any]:
         with self._get_session() as session:
-            architecture = session.get(Architecture, architecture_id)
-            if architecture is None:
-                return None
-            return {
-                "id": architecture.vector_hash,
-                "arch_spec": json.loads(architecture.arch_spec),
-                "code_commit": architecture.code_commit,
-                "creation_time": architecture.creation_time.isoformat(),
-            }
-
-    async def list_architectures(
+            row = (
+                session.query(*_ARCHITECTURE_COLUMNS)
+                .filter(Architecture.vector_hash == architecture_id)
+                .one_or_none()
+            )
+        if row is not None:
+            self._architecture_rows.put(architecture_id, row)
+        return row
+
+    @_in_executor
+    def list_architectures(
         self, skip: int = 0, limit: int = 100
     ) -> List[Dict[str, Any]]:
         """List architectures with pagination."""
         with self._get_session() as session:
-            architectures = (
-                session.query(Architecture)
+            rows = (
+                session.query(*_ARCHITECTURE_COLUMNS)
                 .order_by(Architecture.creation_time.desc())
                 .offset(skip)
                 .limit(limit)
                 .all()
             )
-            return [
-                {
-                    "id": arch.vector_hash,
-                    "arch_spec": json.loads(arch.arch_spec),
-                    "code_commit": arch.code_commit,
-                    "creation_time": arch.creation_time.isoformat(),
-                }
-                for arch in architectures
-            ]
+        return [self._architecture_row_to_dict(row) for row in rows]
 
-    async def list_experiments(
-        self, skip: int = 0, limit: int = 100
-    ) -> List[Dict[str, Any]]:
+    @_in_executor
+    def list_experiments(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
         """List experiments with pagination."""
         with self._get_session() as session:
-            experiments = (
-                session.query(Experiment)
+            rows = (
+                session.query(*_EXPERIMENT_COLUMNS)
                 .order_by(Experiment.start_time.desc())
                 .offset(skip)
                 .limit(limit)
                 .all()
             )
-            return [
-                {
-                    "id": exp.id,
-                    "status": exp.status,
-                    "start_time": (
-                        exp.start_time.isoformat() if exp.start_time else None
-                    ),
-                    "end_time": exp.end_time.isoformat() if exp.end_time else None,
-                    "config": json.loads(exp.config) if exp.config else {},
-                }
-                for exp in experiments
-            ]
+        return [self._experiment_row_to_dict(row) for row in rows]
+
+    def _gp_state_dir_for(self, experiment_id: str) -> Path:
+        """
+        Directory holding an experiment's GP state generations.
+
+        Raises:
+            ValueError: If the experiment ID is not safe as a directory name
+        """
+        if not _EXPERIMENT_DIR_NAME.fullmatch(experiment_id):
+            raise ValueError(f"Invalid experiment ID for GP state: {experiment_id!r}")
+        return self.gp_state_dir / experiment_id
+
+    @_in_executor
+    def save_gp_state(
+        self,
+        experiment_id: str,
+        L: np.ndarray,
+        alpha: np.ndarray,
+        X_train: np.ndarray,
+        hypers: Dict[str, Any],
+        y_train: np.ndarray,
+    ) -> None:
+        """
+        Persist a fitted GP posterior for an experiment.
+
+        Arrays are written as .npy files (no pickling) so they can be
+        memory-mapped on load. Each save writes a fresh generation directory
+        and then switches the CURRENT pointer to it with one atomic replace,
+        so a crash mid-save leaves the previous state intact. The previous
+        generation is kept for readers still opening it; older ones are
+        removed.
+
+        Raises:
+            ValueError: If the experiment ID is not safe as a directory name
+        """
+        state_dir = self._gp_state_dir_for(experiment_id)
+        state_dir.mkdir(parents=True, exist_ok=True)
+        pointer = state_dir / _GP_STATE_POINTER
+        previous = pointer.read_text() if pointer.exists() else None
+
+        generation = Path(
+            tempfile.mkdtemp(prefix=f"{time.time_ns():020d}-", dir=state_dir)
+        )
+        arrays = {"L": L, "alpha": alpha, "X_train": X_train, "y_train": y_train}
+        for name, array in arrays.items():
+            with open(generation / f"{name}.npy", "wb") as f:
+                np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+        (generation / "hypers.json").write_bytes(
+            orjson.dumps(hypers, option=_ORJSON_OPTIONS)
+        )
+
+        tmp_path = state_dir / f"{_GP_STATE_POINTER}.tmp"
+        tmp_path.write_text(generation.name)
+        os.replace(tmp_path, pointer)
+
+        for entry in state_dir.iterdir():
+            if entry.is_dir() and entry.name not in (generation.name, previous):
+                shutil.rmtree(entry, ignore_errors=True)
+
+    @_in_executor
+    def load_gp_state(self, experiment_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a GP posterior saved by save_gp_state().
+
+        Returns:
+            Dictionary with L, alpha, X_train, y_train (read-only memory maps)
+            and hypers, or None if no state was saved for the experiment or
+            the saved arrays disagree on the number of observations
+
+        Raises:
+            ValueError: If the experiment ID is not safe as a directory name
+        """
+        pointer = self._gp_state_dir_for(experiment_id) / _GP_STATE_POINTER
+        if not pointer.exists():
+            return None
+        generation = pointer.parent / pointer.read_text()
+        state = {
+            name: np.load(generation / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+            for name in ("L", "alpha", "X_train", "y_train")
+        }
+        n = len(state["y_train"])
+        if (
+            state["L"].shape != (n, n)
+            or state["alpha"].shape != (n,)
+            or state["X_train"].ndim != 2
+            or len(state["X_train"]) != n
+        ):
+            logger.warning(f"Ignoring inconsistent GP state for {experiment_id}")
+            return None
+        state["hypers"] = orjson.loads((generation / "hypers.json").read_bytes())
+        return state
@@ -2,7 +2,7 @@
 Database interface for experiment results storage and retrieval.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from abc import ABC, abstractmethod
 
 
@@ -14,11 +14,19 @@ class ResultsDB(ABC):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
 
+    def close(self) -> None:
+        """Release connections held by the database, if any."""
+        pass
+
     @abstractmethod
     async def save_run_info(self, run_info: Dict[str, Any]) -> str:
         """Save information about an experiment run."""
         pass
 
+    async def save_run_info_batch(self, run_infos: List[Dict[str, Any]]) -> List[str]:
+        """Save several runs; implementations may use a single transaction."""
+        return [await self.save_run_info(run_info) for run_info in run_infos]
+
     @abstractmethod
     async def get_best_architectures(
         self, metric: str, limit: int = 10, **filters
@@ -35,3 +43,13 @@ class ResultsDB(ABC):
     ) -> List[Dict[str, Any]]:
         """List all experiment runs with optional filtering."""
         pass
+
+    async def iter_all_runs(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        **filters
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over runs; implementations may stream them in batches."""
+        for run in await self.list_all_runs(start_date, end_date, **filters):
+            yield run
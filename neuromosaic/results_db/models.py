@@ -7,12 +7,19 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Index,
     func,
 )
 from sqlalchemy.orm import relationship, declarative_base
 
 Base = declarative_base()
 
+# JSON payloads (arch_spec, config, metrics) are Text columns written with
+# orjson rather than sqlalchemy.JSON. On SQLite both are stored as text, so
+# JSON would only swap the orjson decoding in db.py for slower per-row
+# stdlib json parsing; SQL-side access goes through json_extract instead,
+# with expression indexes created per ranked metric.
+
 
 class Architecture(Base):
     """
@@ -21,7 +28,11 @@ class Architecture(Base):
     """
 
     __tablename__ = "architectures"
+    __table_args__ = (Index("ix_architectures_creation_time", "creation_time"),)
 
+    # Kept as text: IDs are public strings ("arch_<32 hex>", see
+    # Orchestrator.run_cycle) used in API routes and the CLI, and runs may
+    # reference architectures by caller-chosen IDs that are not digests
     vector_hash = Column(String, primary_key=True)
     arch_spec = Column(
         Text, nullable=False
@@ -41,8 +52,12 @@ class Experiment(Base):
     """
 
     __tablename__ = "experiments"
+    __table_args__ = (Index("ix_experiments_start_time", "start_time"),)
 
     id = Column(String, primary_key=True)
+    # Free-form on purpose: callers pass their own statuses through
+    # update_experiment_status. An Enum column would reject unknown values and
+    # is still VARCHAR on SQLite, so it would not shrink the row either
     status = Column(String, nullable=True)
     start_time = Column(DateTime, nullable=True)
     end_time = Column(DateTime, nullable=True)
@@ -60,15 +75,28 @@ class Run(Base):
     """
 
     __tablename__ = "runs"
+    # The composite indexes also serve plain experiment_id/architecture_id
+    # lookups through their leading column; timestamp gets its own index for
+    # date-bounded listings that do not filter by either
+    __table_args__ = (
+        Index("ix_runs_exp_ts", "experiment_id", "timestamp"),
+        Index("ix_runs_arch_ts", "architecture_id", "timestamp"),
+        Index("ix_runs_timestamp", "timestamp"),
+    )
 
     id = Column(String, primary_key=True)
-    experiment_id = Column(String, ForeignKey("experiments.id"), nullable=True)
+    # Deleting an experiment detaches its runs. SQLite leaves foreign keys
+    # unenforced (runs may name architectures that were never stored), so
+    # delete_experiment also clears the column itself, in the same transaction
+    experiment_id = Column(
+        String, ForeignKey("experiments.id", ondelete="SET NULL"), nullable=True
+    )
     architecture_id = Column(
         String, ForeignKey("architectures.vector_hash"), nullable=True
     )
-    metrics = Column(
-        Text, nullable=True
-    )  # Stored as JSON string for SQLite compatibility
+    # Stored as JSON text rather than a binary encoding so that SQLite's
+    # json_extract can rank runs by a metric and back it with an index
+    metrics = Column(Text, nullable=True)
     timestamp = Column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
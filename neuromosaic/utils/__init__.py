@@ -0,0 +1,6 @@
+"""
+Shared utilities for Neuromosaic: configuration, logging, storage and version control.
+
+Submodules are imported directly (e.g. ``neuromosaic.utils.config``) so that
+importing one does not load the heavier ones.
+"""
@@ -18,43 +18,136 @@ Example:
 """
 
 import os
+import re
+import sys
+import copy
+import time
+import hashlib
 import yaml
 import logging
+import orjson
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List, TYPE_CHECKING
-from dataclasses import dataclass, field, asdict, fields
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union, List, Mapping, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field, asdict, fields, is_dataclass
+from dotenv import find_dotenv, load_dotenv
 
-from ..arch_space.vector_representation import ArchSpace
 from .exceptions import ConfigurationError
 
+try:
+    # libyaml-backed loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+_dotenv_loaded = False
+
+
+def load_env_file() -> None:
+    """
+    Load variables from a .env file into os.environ, once per process.
+
+    Set NEUROMOSAIC_SKIP_DOTENV=1 where the environment is injected directly,
+    e.g. in containers, to skip searching the directory tree for the file.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded or os.getenv("NEUROMOSAIC_SKIP_DOTENV") == "1":
+        return
+    _dotenv_loaded = True
+    dotenv_path = find_dotenv()
+    if dotenv_path:
+        load_dotenv(dotenv_path)
+
+
 # Load environment variables from .env file
-load_dotenv()
+load_env_file()
+
+# Slotted configs (Python 3.10+) skip the per-instance __dict__. Slots classes
+# are rebuilt by the decorator, which breaks zero-argument super(), so
+# overrides call BaseConfig.__post_init__ explicitly
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+_VALID_ENVIRONMENTS = frozenset({"development", "staging", "production"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_STRATEGY_TYPES = frozenset({"random", "bayesian_optimization"})
+_VALID_OPTIMIZERS = frozenset({"adam", "sgd", "adamw"})
+_VALID_SCHEDULERS = frozenset({"cosine", "linear", "step", "none"})
+_VALID_DEVICES = frozenset({"cpu", "gpu"})
+_VALID_RUNTIMES = frozenset({"docker", "podman"})
+_VALID_REUSE_STRATEGIES = frozenset({"none", "keep_alive", "pause"})
+_VALID_LLM_PROVIDERS = frozenset({"openai", "anthropic", "cohere", "llama", "deepseek"})
+_VALID_DEPLOYMENT_TYPES = frozenset({"local", "cloud"})
+
+# Copied into each LLMConfig, never handed out directly
+_DEFAULT_RETRY_CONFIG = {"max_retries": 3, "initial_wait": 1.0, "backoff_factor": 2.0}
+
+
+def _env_flag(env: Mapping[str, str], name: str, default: bool = False) -> bool:
+    """Read a boolean environment variable."""
+    value = env.get(name)
+    return default if value is None else value.lower() in _TRUTHY
+
 
 # Use TYPE_CHECKING for strategy type hints to avoid circular imports
 if TYPE_CHECKING:
+    from ..arch_space.vector_representation import ArchSpace
     from ..orchestrator.strategies.random_strategy import RandomSearch
     from ..orchestrator.strategies.bayesopt_strategy import BayesianOptimization
 
 
-@dataclass
+# The architecture space and strategies pull in NumPy/SciPy, so they are only
+# imported once a config actually needs them, not whenever config is imported
+def _arch_space_class() -> type:
+    from ..arch_space.vector_representation import ArchSpace
+
+    return ArchSpace
+
+
+@lru_cache(maxsize=1)
+def _strategy_classes() -> Tuple[type, ...]:
+    from ..orchestrator.strategies.random_strategy import RandomSearch
+    from ..orchestrator.strategies.bayesopt_strategy import BayesianOptimization
+
+    return RandomSearch, BayesianOptimization
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``from neuromosaic.utils.config import ArchSpace`` working
+    if name == "ArchSpace":
+        return _arch_space_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset:
+    """Names of a dataclass's fields, computed once per class."""
+    return frozenset(f.name for f in fields(cls))
+
+
+@dataclass(**_SLOTS)
 class BaseConfig:
     """Base configuration class that provides dictionary-style access."""
 
     def __post_init__(self):
         """Handle any unknown fields by logging warnings."""
-        known_fields = {f.name for f in fields(self)}
-        for key, value in dict(self.__dict__).items():
-            if key not in known_fields:
-                logging.warning(
-                    f"Unknown configuration field '{key}' for {self.__class__.__name__}, ignoring it"
-                )
-                delattr(self, key)
+        # Slotted instances cannot hold unknown attributes in the first place
+        instance_dict = getattr(self, "__dict__", None)
+        if not instance_dict:
+            return
+        known_fields = _field_names(type(self))
+        for key in [key for key in instance_dict if key not in known_fields]:
+            logging.warning(
+                f"Unknown configuration field '{key}' for {self.__class__.__name__}, ignoring it"
+            )
+            delattr(self, key)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value by key, with an optional default.
-        Uses dataclasses.asdict() for dictionary-style access.
+        Supports "section.key" lookups; nested config sections are returned
+        as plain dicts, as dataclasses.asdict() would.
 
         Args:
             key: The configuration key to look up
@@ -63,17 +156,22 @@ class BaseConfig:
         Returns:
             The configuration value if found, otherwise the default value
         """
-        try:
-            if "." in key:
-                section, subkey = key.split(".", 1)
-                section_dict = asdict(getattr(self, section))
-                return section_dict.get(subkey, default)
-            return asdict(self).get(key, default)
-        except (AttributeError, TypeError):
+        target = self
+        if "." in key:
+            section, key = key.split(".", 1)
+            if section not in _field_names(type(self)):
+                return default
+            target = getattr(self, section)
+            if not is_dataclass(target) or isinstance(target, type):
+                return default
+        if key not in _field_names(type(target)):
             return default
+        # Read the one field instead of converting the whole tree via asdict()
+        value = getattr(target, key)
+        return asdict(value) if is_dataclass(value) else value
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Training(BaseConfig):
     """Configuration for model training."""
 
@@ -94,13 +192,13 @@ class Training(BaseConfig):
             raise ConfigurationError(f"Invalid max epochs: {self.max_epochs}")
         if self.learning_rate <= 0:
             raise ConfigurationError(f"Invalid learning rate: {self.learning_rate}")
-        if self.optimizer not in ["adam", "sgd", "adamw"]:
+        if self.optimizer not in _VALID_OPTIMIZERS:
             raise ConfigurationError(f"Invalid optimizer: {self.optimizer}")
-        if self.scheduler not in ["cosine", "linear", "step", "none"]:
+        if self.scheduler not in _VALID_SCHEDULERS:
             raise ConfigurationError(f"Invalid scheduler: {self.scheduler}")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LLMConfig(BaseConfig):
     """Configuration for LLM providers."""
 
@@ -113,11 +211,7 @@ class LLMConfig(BaseConfig):
     temperature: float = field(default=0.7)
     max_tokens: int = field(default=2000)
     retry_config: Dict[str, Any] = field(
-        default_factory=lambda: {
-            "max_retries": 3,
-            "initial_wait": 1.0,
-            "backoff_factor": 2.0,
-        }
+        default_factory=lambda: dict(_DEFAULT_RETRY_CONFIG)
     )
     # Provider-specific fields
     api_base: Optional[str] = field(default=None)  # For custom API endpoints
@@ -126,42 +220,49 @@ class LLMConfig(BaseConfig):
     n_gpu_layers: int = field(default=0)  # For local LLaMA models
     n_batch: int = field(default=512)  # For local LLaMA models
     deployment_type: str = field(default="cloud")  # "local" or "cloud"
+    # Generated-code cache; near-duplicate architecture vectors share code
+    cache: Dict[str, Any] = field(
+        default_factory=lambda: {
+            "enabled": True,
+            "max_size": 1000,
+            "ttl_seconds": None,
+            "threshold": 0.98,
+            "path": None,  # SQLite file persisting the cache across sessions
+            "warm_entries": 100,  # Recent entries loaded from disk at startup
+        }
+    )
 
     @classmethod
-    def from_env(cls) -> "LLMConfig":
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "LLMConfig":
         """Create config from environment variables."""
+        env = os.environ if env is None else env
         return cls(
-            openai_api_key=os.getenv("OPENAI_API_KEY"),
-            anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
-            cohere_api_key=os.getenv("COHERE_API_KEY"),
-            deepseek_api_key=os.getenv("DEEPSEEK_API_KEY"),
-            provider=os.getenv("LLM_PROVIDER", "openai"),
-            model=os.getenv("LLM_MODEL", "gpt-4"),
-            temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("LLM_MAX_TOKENS", "2000")),
-            retry_config={"max_retries": 3, "initial_wait": 1.0, "backoff_factor": 2.0},
-            api_base=os.getenv("LLM_API_BASE"),
-            model_path=os.getenv("LLAMA_MODEL_PATH"),
-            n_ctx=int(os.getenv("LLAMA_N_CTX", "2048")),
-            n_gpu_layers=int(os.getenv("LLAMA_N_GPU_LAYERS", "0")),
-            n_batch=int(os.getenv("LLAMA_N_BATCH", "512")),
-            deployment_type=os.getenv("LLAMA_DEPLOYMENT_TYPE", "cloud"),
+            openai_api_key=env.get("OPENAI_API_KEY"),
+            anthropic_api_key=env.get("ANTHROPIC_API_KEY"),
+            cohere_api_key=env.get("COHERE_API_KEY"),
+            deepseek_api_key=env.get("DEEPSEEK_API_KEY"),
+            provider=env.get("LLM_PROVIDER", "openai"),
+            model=env.get("LLM_MODEL", "gpt-4"),
+            temperature=float(env.get("LLM_TEMPERATURE", "0.7")),
+            max_tokens=int(env.get("LLM_MAX_TOKENS", "2000")),
+            api_base=env.get("LLM_API_BASE"),
+            model_path=env.get("LLAMA_MODEL_PATH"),
+            n_ctx=int(env.get("LLAMA_N_CTX", "2048")),
+            n_gpu_layers=int(env.get("LLAMA_N_GPU_LAYERS", "0")),
+            n_batch=int(env.get("LLAMA_N_BATCH", "512")),
+            deployment_type=env.get("LLAMA_DEPLOYMENT_TYPE", "cloud"),
         )
 
     def __post_init__(self):
         """Validate LLM configuration."""
-        if self.provider not in ["openai", "anthropic", "cohere", "llama", "deepseek"]:
+        if self.provider not in _VALID_LLM_PROVIDERS:
             raise ConfigurationError(f"Invalid LLM provider: {self.provider}")
         if self.temperature < 0 or self.temperature > 1:
             raise ConfigurationError(f"Invalid temperature: {self.temperature}")
         if self.max_tokens <= 0:
             raise ConfigurationError(f"Invalid max_tokens: {self.max_tokens}")
         if self.retry_config is None:
-            self.retry_config = {
-                "max_retries": 3,
-                "initial_wait": 1.0,
-                "backoff_factor": 2.0,
-            }
+            self.retry_config = dict(_DEFAULT_RETRY_CONFIG)
 
         # Set default API base for DeepSeek
         if self.provider == "deepseek" and not self.api_base:
@@ -175,7 +276,7 @@ class LLMConfig(BaseConfig):
                 self.model = "deepseek-chat"  # Default to DeepSeek-V3
 
         elif self.provider == "llama":
-            if self.deployment_type not in ["local", "cloud"]:
+            if self.deployment_type not in _VALID_DEPLOYMENT_TYPES:
                 raise ConfigurationError(
                     f"Invalid deployment_type: {self.deployment_type}"
                 )
@@ -200,7 +301,7 @@ class LLMConfig(BaseConfig):
                     )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StorageConfig(BaseConfig):
     """Configuration for data and artifact storage."""
 
@@ -209,16 +310,22 @@ class StorageConfig(BaseConfig):
     artifact_retention_days: int = field(default=30)
 
     @classmethod
-    def from_env(cls) -> "StorageConfig":
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "StorageConfig":
         """Create config from environment variables."""
+        env = os.environ if env is None else env
         return cls(
-            root=Path(os.getenv("STORAGE_ROOT", "data")),
-            cache_size=os.getenv("MAX_CACHE_SIZE", "50GB"),
+            root=Path(env.get("STORAGE_ROOT", "data")),
+            cache_size=env.get("MAX_CACHE_SIZE", "50GB"),
             artifact_retention_days=30,
         )
 
+    def __post_init__(self):
+        """Validate storage configuration."""
+        BaseConfig.__post_init__(self)
+        parse_size(self.cache_size)
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class DatabaseConfig(BaseConfig):
     """Configuration for database connection."""
 
@@ -230,30 +337,33 @@ class DatabaseConfig(BaseConfig):
     db_url: str = field(default="sqlite:///neuromosaic.db")
     type: Optional[str] = field(default="sqlite")
     path: Optional[str] = field(default=None)
+    gp_state_dir: str = field(default="gp_state")
 
     @classmethod
-    def from_env(cls) -> "DatabaseConfig":
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "DatabaseConfig":
         """Create config from environment variables."""
+        env = os.environ if env is None else env
         return cls(
-            host=os.getenv("DB_HOST", "localhost"),
-            port=int(os.getenv("DB_PORT", "5432")),
-            name=os.getenv("DB_NAME", "neuromosaic"),
-            user=os.getenv("DB_USER", "postgres"),
-            password=os.getenv("DB_PASSWORD"),
-            db_url=os.getenv("DB_URL", "sqlite:///neuromosaic.db"),
-            type=os.getenv("DB_TYPE", "sqlite"),
-            path=os.getenv("DB_PATH"),
+            host=env.get("DB_HOST", "localhost"),
+            port=int(env.get("DB_PORT", "5432")),
+            name=env.get("DB_NAME", "neuromosaic"),
+            user=env.get("DB_USER", "postgres"),
+            password=env.get("DB_PASSWORD"),
+            db_url=env.get("DB_URL", "sqlite:///neuromosaic.db"),
+            type=env.get("DB_TYPE", "sqlite"),
+            path=env.get("DB_PATH"),
+            gp_state_dir=env.get("DB_GP_STATE_DIR", "gp_state"),
         )
 
     def __post_init__(self):
         """Validate database configuration."""
-        super().__post_init__()
+        BaseConfig.__post_init__(self)
         if self.type == "sqlite" and not self.path and "sqlite:///" not in self.db_url:
             self.path = "neuromosaic.db"
             self.db_url = f"sqlite:///{self.path}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ContainerConfig(BaseConfig):
     """Configuration for container runtime."""
 
@@ -264,37 +374,43 @@ class ContainerConfig(BaseConfig):
     base_image: str = field(default="pytorch/pytorch:2.0.0-cuda11.7-cudnn8-runtime")
     gpu_support: bool = field(default=True)
     timeout: int = field(default=3600)
+    reuse_strategy: str = field(default="none")  # "none", "keep_alive" or "pause"
+    pool_size: int = field(default=4)  # Idle containers kept for reuse
 
     @classmethod
-    def from_env(cls) -> "ContainerConfig":
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "ContainerConfig":
         """Create config from environment variables."""
+        env = os.environ if env is None else env
         return cls(
-            device=os.getenv("CONTAINER_DEVICE", "cpu"),
-            memory_limit=os.getenv("CONTAINER_MEMORY_LIMIT", "8GB"),
-            num_cpus=int(os.getenv("CONTAINER_NUM_CPUS", "4")),
-            runtime=os.getenv("CONTAINER_RUNTIME", "docker"),
-            base_image=os.getenv(
+            device=env.get("CONTAINER_DEVICE", "cpu"),
+            memory_limit=env.get("CONTAINER_MEMORY_LIMIT", "8GB"),
+            num_cpus=int(env.get("CONTAINER_NUM_CPUS", "4")),
+            runtime=env.get("CONTAINER_RUNTIME", "docker"),
+            base_image=env.get(
                 "CONTAINER_BASE_IMAGE", "pytorch/pytorch:2.0.0-cuda11.7-cudnn8-runtime"
             ),
-            gpu_support=os.getenv("CONTAINER_GPU_SUPPORT", "true").lower() == "true",
-            timeout=int(os.getenv("CONTAINER_TIMEOUT", "3600")),
+            gpu_support=_env_flag(env, "CONTAINER_GPU_SUPPORT", True),
+            timeout=int(env.get("CONTAINER_TIMEOUT", "3600")),
+            reuse_strategy=env.get("CONTAINER_REUSE_STRATEGY", "none"),
+            pool_size=int(env.get("CONTAINER_POOL_SIZE", "4")),
         )
 
     def __post_init__(self):
         """Validate container configuration."""
-        if self.device not in ["cpu", "gpu"]:
+        if self.device not in _VALID_DEVICES:
             raise ConfigurationError(f"Invalid device: {self.device}")
         if self.num_cpus <= 0:
             raise ConfigurationError(f"Invalid number of CPUs: {self.num_cpus}")
-        if self.runtime not in ["docker", "podman"]:
+        if self.runtime not in _VALID_RUNTIMES:
             raise ConfigurationError(f"Invalid runtime: {self.runtime}")
-        try:
-            parse_size(self.memory_limit)
-        except ValueError:
-            raise ConfigurationError(f"Invalid memory limit: {self.memory_limit}")
+        if self.reuse_strategy not in _VALID_REUSE_STRATEGIES:
+            raise ConfigurationError(f"Invalid reuse strategy: {self.reuse_strategy}")
+        if self.pool_size < 0:
+            raise ConfigurationError(f"Invalid pool size: {self.pool_size}")
+        parse_size(self.memory_limit)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MonitoringConfig(BaseConfig):
     """Configuration for monitoring and logging."""
 
@@ -315,18 +431,28 @@ class MonitoringConfig(BaseConfig):
     )
 
     @classmethod
-    def from_env(cls) -> "MonitoringConfig":
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "MonitoringConfig":
         """Create config from environment variables."""
+        env = os.environ if env is None else env
         return cls(
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            enable_wandb=os.getenv("ENABLE_WANDB", "false").lower() == "true",
-            wandb_api_key=os.getenv("WANDB_API_KEY"),
-            wandb_project=os.getenv("WANDB_PROJECT", "neuromosaic"),
-            wandb_entity=os.getenv("WANDB_ENTITY"),
+            log_level=env.get("LOG_LEVEL", "INFO"),
+            enable_wandb=_env_flag(env, "ENABLE_WANDB", False),
+            wandb_api_key=env.get("WANDB_API_KEY"),
+            wandb_project=env.get("WANDB_PROJECT", "neuromosaic"),
+            wandb_entity=env.get("WANDB_ENTITY"),
         )
 
+    def __post_init__(self):
+        """Validate monitoring configuration."""
+        BaseConfig.__post_init__(self)
+        if self.log_level not in _VALID_LOG_LEVELS:
+            raise ConfigurationError(
+                f"Invalid log level: {self.log_level}. "
+                f"Must be one of {set(_VALID_LOG_LEVELS)}"
+            )
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class SecurityConfig(BaseConfig):
     """Configuration for security settings."""
 
@@ -334,15 +460,26 @@ class SecurityConfig(BaseConfig):
     encryption_key: Optional[str] = field(default=None)
 
     @classmethod
-    def from_env(cls) -> "SecurityConfig":
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "SecurityConfig":
         """Create config from environment variables."""
+        env = os.environ if env is None else env
         return cls(
-            auth_secret_key=os.getenv("AUTH_SECRET_KEY"),
-            encryption_key=os.getenv("ENCRYPTION_KEY"),
+            auth_secret_key=env.get("AUTH_SECRET_KEY"),
+            encryption_key=env.get("ENCRYPTION_KEY"),
         )
 
 
-@dataclass
+# Config sections built directly from their YAML mapping by load_config
+_YAML_SECTIONS: Dict[str, type] = {
+    "storage": StorageConfig,
+    "database": DatabaseConfig,
+    "container": ContainerConfig,
+    "monitoring": MonitoringConfig,
+    "security": SecurityConfig,
+}
+
+
+@dataclass(**_SLOTS)
 class Config(BaseConfig):
     """Main configuration class."""
 
@@ -382,6 +519,11 @@ class Config(BaseConfig):
         }
     )
     training: Training = field(default_factory=Training)
+    orchestrator: Dict[str, Any] = field(
+        default_factory=lambda: {
+            "max_parallel": None,  # Concurrent cycles per batch, None = min(batch, 8)
+        }
+    )
     wandb: Dict[str, Any] = field(
         default_factory=lambda: {
             "enabled": True,
@@ -396,19 +538,39 @@ class Config(BaseConfig):
         if not self.llm.openai_api_key:
             self.llm = LLMConfig.from_env()
 
+    def get_arch_space(self) -> "ArchSpace":
+        """
+        Get the architecture space, building it from its dict form on first use.
+
+        Keeping the dict until then means configs that never touch the space
+        (CLI help, health checks, DB tools) do not import NumPy.
+        """
+        if isinstance(self.arch_space, dict):
+            self.arch_space = _arch_space_class()(**self.arch_space)
+        return self.arch_space
+
     @classmethod
-    def from_env(cls) -> "Config":
-        """Create config from environment variables."""
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Config":
+        """
+        Create config from environment variables.
+
+        Args:
+            env: Variables to read instead of os.environ
+        """
+        if env is None:
+            # One snapshot for every section instead of a lookup per variable.
+            # Sections then use env.get per field: most variables are usually
+            # unset, so a batched itemgetter would nearly always hit KeyError
+            env = dict(os.environ)
         return cls(
-            llm=LLMConfig.from_env(),
-            storage=StorageConfig.from_env(),
-            database=DatabaseConfig.from_env(),
-            container=ContainerConfig.from_env(),
-            monitoring=MonitoringConfig.from_env(),
-            security=SecurityConfig.from_env(),
-            debug=os.getenv("DEBUG", "false").lower() == "true",
-            environment=os.getenv("ENVIRONMENT", "production"),
-            arch_space=ArchSpace(),
+            llm=LLMConfig.from_env(env),
+            storage=StorageConfig.from_env(env),
+            database=DatabaseConfig.from_env(env),
+            container=ContainerConfig.from_env(env),
+            monitoring=MonitoringConfig.from_env(env),
+            security=SecurityConfig.from_env(env),
+            debug=_env_flag(env, "DEBUG", False),
+            environment=env.get("ENVIRONMENT", "production"),
             search_strategy={
                 "dimensions": 64,
                 "num_trials": 10,
@@ -436,34 +598,20 @@ class Config(BaseConfig):
 
             # Update each config section if present in YAML
             if "llm" in yaml_config:
-                # Merge with environment variables
+                # API keys missing from the YAML fall back to the environment
                 env_llm = LLMConfig.from_env()
-                yaml_config["llm"]["openai_api_key"] = (
-                    yaml_config["llm"].get("openai_api_key") or env_llm.openai_api_key
-                )
-                yaml_config["llm"]["anthropic_api_key"] = (
-                    yaml_config["llm"].get("anthropic_api_key")
-                    or env_llm.anthropic_api_key
-                )
-                yaml_config["llm"]["cohere_api_key"] = (
-                    yaml_config["llm"].get("cohere_api_key") or env_llm.cohere_api_key
-                )
-                self.llm = LLMConfig(**yaml_config["llm"])
+                llm = yaml_config["llm"]
+                for key in ("openai_api_key", "anthropic_api_key", "cohere_api_key"):
+                    llm[key] = llm.get(key) or getattr(env_llm, key)
+                self.llm = LLMConfig(**llm)
             else:
                 # If no LLM config in YAML, use environment variables
                 self.llm = LLMConfig.from_env()
-            if "storage" in yaml_config:
-                self.storage = StorageConfig(**yaml_config["storage"])
-            if "database" in yaml_config:
-                self.database = DatabaseConfig(**yaml_config["database"])
-            if "container" in yaml_config:
-                self.container = ContainerConfig(**yaml_config["container"])
-            if "monitoring" in yaml_config:
-                self.monitoring = MonitoringConfig(**yaml_config["monitoring"])
-            if "security" in yaml_config:
-                self.security = SecurityConfig(**yaml_config["security"])
+            for section, section_class in _YAML_SECTIONS.items():
+                if section in yaml_config:
+                    setattr(self, section, section_class(**yaml_config[section]))
             if "arch_space" in yaml_config:
-                self.arch_space = ArchSpace(**yaml_config["arch_space"])
+                self.arch_space = _arch_space_class()(**yaml_config["arch_space"])
             if "search_strategy" in yaml_config:
                 # Store as dict, let orchestrator handle instantiation
                 self.search_strategy = yaml_config["search_strategy"]
@@ -472,6 +620,8 @@ class Config(BaseConfig):
                     self.search_strategy["type"] = "bayesian_optimization"
                 if "dimensions" not in self.search_strategy:
                     self.search_strategy["dimensions"] = 64
+            if "orchestrator" in yaml_config:
+                self.orchestrator = {**self.orchestrator, **yaml_config["orchestrator"]}
 
             # Update simple fields
             self.debug = yaml_config.get("debug", self.debug)
@@ -484,109 +634,200 @@ class Config(BaseConfig):
             raise ConfigurationError(f"Failed to load configuration: {e}")
 
 
+# NUMBER[unit]; the unit's first letter selects the multiplier
+_SIZE_RE = re.compile(r"(\d+(?:\.\d*)?|\.\d+)\s*([TGMK]B?|B)?")
+_SIZE_MULTIPLIERS = {"T": 1024**4, "G": 1024**3, "M": 1024**2, "K": 1024, "B": 1}
+
+
+@lru_cache(maxsize=256)
 def parse_size(size_str: str) -> int:
     """Parse size string (e.g., '50GB' or '50G') to bytes."""
-    # Support both full units and single letter units
-    units = {
-        "TB": 1024**4,
-        "T": 1024**4,
-        "GB": 1024**3,
-        "G": 1024**3,
-        "MB": 1024**2,
-        "M": 1024**2,
-        "KB": 1024,
-        "K": 1024,
-        "B": 1,
-    }
-
     size_str = size_str.strip().upper()
+    match = _SIZE_RE.fullmatch(size_str)
+    if match is not None:
+        number, unit = match.groups()
+        if unit:
+            return int(float(number) * _SIZE_MULTIPLIERS[unit[0]])
+        if "." not in number:
+            # Without a unit the value is a whole number of bytes
+            return int(number)
+    raise ConfigurationError(
+        f"Invalid size format: {size_str}. Expected format: NUMBER[T|TB|G|GB|M|MB|K|KB|B]"
+    )
 
-    # Try to find the unit by checking each unit in order (longest first)
-    for unit, multiplier in units.items():
-        if size_str.endswith(unit):
-            try:
-                # Extract the number part by removing the unit
-                number_str = size_str[: -len(unit)].strip()
-                number = float(number_str)
-                return int(number * multiplier)
-            except ValueError:
-                continue
-
-    # If no unit is found or parsing failed, try to parse as raw bytes
-    try:
-        return int(size_str)
-    except ValueError:
-        raise ConfigurationError(
-            f"Invalid size format: {size_str}. Expected format: NUMBER[T|TB|G|GB|M|MB|K|KB|B]"
-        )
+
+# Files modified more recently than this are not memoized in-process: a
+# rewrite within the same mtime tick would otherwise go unnoticed
+_RACY_MTIME_NS = 2_000_000_000
 
 
 def load_yaml_config(path: Union[str, Path]) -> Dict[str, Any]:
-    """Load configuration from YAML file."""
+    """
+    Load configuration from YAML file.
+
+    In production the parsed config is also written to a JSON sidecar
+    (``<path>.cache.json``) keyed on a digest of the YAML bytes, and later
+    loads of unchanged files read the sidecar instead of parsing the YAML.
+    Within a process, loads are additionally memoized on the file's path,
+    mtime and size; callers get a fresh copy they are free to modify.
+
+    String values may reference environment variables as ``${NAME}`` or
+    ``${NAME:default}``. They are expanded on every load, after the caches,
+    so secrets never reach the sidecar and environment changes are seen.
+    References to unset variables without a default are left as written.
+    """
     try:
-        with open(path, "r") as f:
-            return yaml.safe_load(f)
+        stat = os.stat(path)
+        if time.time_ns() - stat.st_mtime_ns < _RACY_MTIME_NS:
+            config = _read_yaml_config(path)
+        else:
+            config = copy.deepcopy(
+                _read_yaml_config_cached(
+                    os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+                )
+            )
+        return _expand_env_refs(config, os.environ)
     except Exception as e:
         raise ConfigurationError(f"Failed to load config file: {e}")
 
 
+_ENV_REF = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)(?::([^}]*))?\}")
+
+
+def _expand_env_refs(node: Any, env: Mapping[str, str]) -> Any:
+    """Expand ${NAME[:default]} in the strings of a freshly loaded config."""
+
+    def substitute(match: "re.Match[str]") -> str:
+        name, default = match.groups()
+        value = env.get(name, default)
+        return match.group(0) if value is None else value
+
+    # Containers are updated in place: they belong to this load only
+    stack = [node] if isinstance(node, (dict, list)) else []
+    while stack:
+        container = stack.pop()
+        items = (
+            container.items() if isinstance(container, dict) else enumerate(container)
+        )
+        for key, value in items:
+            if isinstance(value, str):
+                if "${" in value:
+                    container[key] = _ENV_REF.sub(substitute, value)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return node
+
+
+@lru_cache(maxsize=16)
+def _read_yaml_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Memoized _read_yaml_config; mtime and size only serve as the key."""
+    return _read_yaml_config(path)
+
+
+load_yaml_config.cache_clear = _read_yaml_config_cached.cache_clear
+
+
+def _read_yaml_config(path: Union[str, Path]) -> Dict[str, Any]:
+    """Parse a YAML config, going through the sidecar cache in production."""
+    # Bytes let libyaml detect the encoding and skip Python-side decoding
+    with open(path, "rb") as f:
+        data = f.read()
+    if os.getenv("ENVIRONMENT", "production") != "production":
+        return yaml.load(data, Loader=_YamlLoader)
+
+    cache_path = Path(f"{path}.cache.json")
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    config = _read_config_cache(cache_path, digest)
+    if config is None:
+        config = yaml.load(data, Loader=_YamlLoader)
+        _write_config_cache(cache_path, digest, config)
+    return config
+
+
+def _read_config_cache(cache_path: Path, digest: str) -> Optional[Dict[str, Any]]:
+    """Return the cached config if the sidecar matches the YAML digest."""
+    try:
+        entry = orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict) or entry.get("digest") != digest:
+        return None
+    return entry.get("config")
+
+
+def _write_config_cache(cache_path: Path, digest: str, config: Any) -> None:
+    """Atomically write the config sidecar; failures only cost the cache."""
+    try:
+        data = orjson.dumps({"digest": digest, "config": config})
+    except TypeError:
+        return
+    # Skip configs using YAML types JSON would change, e.g. dates
+    if orjson.loads(data)["config"] != config:
+        return
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.debug(f"Could not write config cache {cache_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively merge two configuration dictionaries."""
-    result = base.copy()
+    """
+    Recursively merge two configuration dictionaries.
 
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
-        else:
-            result[key] = value
+    Nested dicts present in both are merged and any other override value
+    replaces the base one. Neither input is modified: each merged level is
+    copied once, and levels only in one input are shared, not copied.
+    """
+    result = base.copy()
+    # Explicit stack instead of recursion: no call per nested level
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
 
     return result
 
 
 def validate_config(config: Config) -> None:
     """Validate configuration values."""
-    # Validate storage configuration
-    try:
-        parse_size(config.storage.cache_size)
-    except ValueError:
-        raise ConfigurationError(f"Invalid cache size: {config.storage.cache_size}")
-
-    # Validate container configuration
-    try:
-        parse_size(config.container.memory_limit)
-    except ValueError:
-        raise ConfigurationError(
-            f"Invalid container memory limit: {config.container.memory_limit}"
-        )
+    # Storage sizes, container settings and the log level are checked by
+    # their sections' __post_init__; re-run those in case fields were
+    # reassigned after construction (parse_size is memoized, so this is cheap)
+    config.storage.__post_init__()
+    config.container.__post_init__()
+    config.monitoring.__post_init__()
 
     # Validate environment
-    valid_environments = {"development", "staging", "production"}
-    if config.environment not in valid_environments:
+    if config.environment not in _VALID_ENVIRONMENTS:
         raise ConfigurationError(
             f"Invalid environment: {config.environment}. "
-            f"Must be one of {valid_environments}"
-        )
-
-    # Validate log level
-    valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-    if config.monitoring.log_level not in valid_log_levels:
-        raise ConfigurationError(
-            f"Invalid log level: {config.monitoring.log_level}. "
-            f"Must be one of {valid_log_levels}"
+            f"Must be one of {set(_VALID_ENVIRONMENTS)}"
         )
 
-    # Validate arch_space configuration
-    if not isinstance(config.arch_space, ArchSpace):
+    # Validate arch_space configuration; a dict is turned into an ArchSpace by
+    # Config.get_arch_space when first needed
+    if not (
+        isinstance(config.arch_space, dict)
+        or isinstance(config.arch_space, _arch_space_class())
+    ):
         raise ConfigurationError("Invalid arch_space configuration")
 
     # Validate search_strategy configuration
-    if TYPE_CHECKING:
-        from ..orchestrator.strategies.random_strategy import RandomSearch
-        from ..orchestrator.strategies.bayesopt_strategy import BayesianOptimization
-
     if not (
         isinstance(config.search_strategy, dict)
-        or isinstance(config.search_strategy, (RandomSearch, BayesianOptimization))
+        or isinstance(config.search_strategy, _strategy_classes())
     ):
         raise ConfigurationError("Invalid search_strategy configuration")
 
@@ -599,11 +840,10 @@ def validate_config(config: Config) -> None:
                     f"Missing required field in search_strategy: {field}"
                 )
 
-        valid_types = {"random", "bayesian_optimization"}
-        if config.search_strategy["type"] not in valid_types:
+        if config.search_strategy["type"] not in _VALID_STRATEGY_TYPES:
             raise ConfigurationError(
                 f"Invalid search strategy type: {config.search_strategy['type']}. "
-                f"Must be one of {valid_types}"
+                f"Must be one of {set(_VALID_STRATEGY_TYPES)}"
             )
 
     # Validate training configuration
@@ -642,7 +882,9 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     return config
 
 
-# Global configuration instance
+# Global configuration instance. Deliberately cached per process only: a
+# Config carries API keys from the environment, so it is not persisted, and
+# rebuilding it is cheap once the YAML sidecar cache and lazy imports apply
 config: Optional[Config] = None
 
 
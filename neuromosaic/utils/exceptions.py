@@ -36,6 +36,7 @@ class ErrorCode(Enum):
     CONTAINER_RUN_FAILED = 3001
     RESOURCE_EXCEEDED = 3002
     TIMEOUT = 3003
+    DAEMON_UNAVAILABLE = 3004
 
     # Training & Evaluation (4000-4999)
     TRAINING_FAILED = 4000
@@ -142,6 +143,13 @@ class ContainerCreateError(ContainerError):
         super().__init__(message, ErrorCode.CONTAINER_CREATE_FAILED, details)
 
 
+class ContainerDaemonError(ContainerError):
+    """Raised when the container daemon itself is unreachable."""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, ErrorCode.DAEMON_UNAVAILABLE, details)
+
+
 class ResourceExceededError(ContainerError):
     """Raised when container exceeds resource limits."""
 
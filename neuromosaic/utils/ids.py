@@ -0,0 +1,51 @@
+"""
+Time-ordered unique identifiers for database rows.
+"""
+
+import secrets
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7 (RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds and the next 12
+    bits a counter that is randomly seeded each millisecond and incremented
+    within it, so IDs from this process sort in creation order, both as
+    UUIDs and as strings. The remaining 62 bits are random.
+
+    Returns:
+        A version 7 UUID
+    """
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            # Seed below the midpoint to leave room for increments
+            _last_ms, _counter = ms, secrets.randbits(11)
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # Counter exhausted: borrow the next millisecond
+                _last_ms, _counter = _last_ms + 1, 0
+        ms, counter = _last_ms, _counter
+    value = (
+        (ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """Return a new time-ordered ID as a string."""
+    return str(uuid7())
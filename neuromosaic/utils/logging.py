@@ -3,33 +3,61 @@ Logging utilities for the project.
 """
 
 import logging
-from typing import Optional
+import os
+from typing import Dict, Optional
 from pathlib import Path
 
 
+class StructuredFormatter(logging.Formatter):
+    """
+    Formatter that appends a record's pre-serialized JSON ``payload``.
+
+    Callers pass ``extra={"payload": orjson.dumps(...)}`` so structured data
+    is serialized once, in C, instead of being repr()'d into the message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        payload = getattr(record, "payload", None)
+        if payload is not None:
+            message = f"{message} {payload.decode()}"
+        return message
+
+
+# Formatters keep no per-record state, so every handler shares this one
+_FORMATTER = StructuredFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+# Absolute log file path -> the one handler (and file descriptor) writing it
+_file_handlers: Dict[str, logging.FileHandler] = {}
+
+
 def setup_logger(
     name: str, log_file: Optional[str] = None, level: int = logging.INFO
 ) -> logging.Logger:
     """
     Set up a logger with console and optional file handlers.
+
+    Loggers are process-wide, so a logger that already has handlers is
+    returned as is; adding them again would emit each record once more per
+    call. File handlers are shared between loggers writing to the same file.
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-
-    # Create formatters
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    if logger.handlers:
+        return logger
 
     # Create console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
 
     # Create file handler if log_file is specified
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
+        path = os.path.abspath(log_file)
+        file_handler = _file_handlers.get(path)
+        if file_handler is None:
+            file_handler = _file_handlers[path] = logging.FileHandler(path)
+            file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
 
     return logger
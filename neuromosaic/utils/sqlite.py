@@ -0,0 +1,41 @@
+"""
+SQLite connection tuning shared by the on-disk stores.
+"""
+
+import sqlite3
+
+# WAL lets readers proceed during writes and, with synchronous=NORMAL, only
+# syncs at checkpoints instead of on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def tune_connection(conn: sqlite3.Connection) -> None:
+    """
+    Apply SQLITE_PRAGMAS to a freshly opened connection.
+
+    Args:
+        conn: DB-API connection to an SQLite database
+    """
+    cursor = conn.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def optimize(conn: sqlite3.Connection) -> None:
+    """
+    Let SQLite refresh its query planner statistics, e.g. before closing.
+
+    Args:
+        conn: DB-API connection to an SQLite database
+    """
+    conn.execute("PRAGMA optimize")
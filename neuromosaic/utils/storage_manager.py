@@ -16,7 +16,7 @@ Example:
 import os
 import shutil
 import hashlib
-import json
+import heapq
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
@@ -25,14 +25,13 @@ from datetime import datetime
 import requests
 import torch
 from tqdm import tqdm
-from dotenv import load_dotenv
-
+from .config import load_env_file
 from .logging import setup_logger
 
 logger = setup_logger(__name__)
 
 # Load environment variables for API keys
-load_dotenv()
+load_env_file()
 
 
 class StorageConfig:
@@ -289,10 +288,13 @@ def list_checkpoints(
         }
         checkpoints.append(info)
 
-    if metric is not None:
+    if metric is not None and n_best is not None:
+        checkpoints = heapq.nlargest(
+            n_best, checkpoints, key=lambda x: x["metrics"][metric]
+        )
+    elif metric is not None:
         checkpoints.sort(key=lambda x: x["metrics"][metric], reverse=True)
-
-    if n_best is not None:
+    elif n_best is not None:
         checkpoints = checkpoints[:n_best]
 
     return checkpoints
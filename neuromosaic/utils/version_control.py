@@ -2,7 +2,9 @@
 Version control utilities for tracking experiment code versions.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import asyncio
+import hashlib
 import subprocess
 from pathlib import Path
 import logging
@@ -11,22 +13,84 @@ import os
 
 logger = logging.getLogger(__name__)
 
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _is_object_id(value: str) -> bool:
+    return len(value) in (40, 64) and set(value) <= _HEX_DIGITS
+
+
+def _read_head_commit(start: Path) -> Optional[str]:
+    """
+    Resolve HEAD from the files of the enclosing repository, without forking git.
+
+    Only plain repositories with loose or packed refs are handled; anything
+    else (worktrees, submodules, reftable, unborn branches) returns None so
+    the caller can fall back to ``git rev-parse``.
+
+    Args:
+        start: Directory to search upwards from for ``.git``
+
+    Returns:
+        The commit hash, or None if it could not be read directly
+    """
+    for directory in (start, *start.parents):
+        git_dir = directory / ".git"
+        if git_dir.exists():
+            break
+    else:
+        return None
+    try:
+        if not git_dir.is_dir():
+            return None
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head if _is_object_id(head) else None
+        ref = head[len("ref: ") :]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            commit = ref_path.read_text().strip()
+            return commit if _is_object_id(commit) else None
+        packed_refs = git_dir / "packed-refs"
+        if packed_refs.is_file():
+            for line in packed_refs.read_text().splitlines():
+                commit, _, name = line.partition(" ")
+                if name == ref and _is_object_id(commit):
+                    return commit
+    except OSError:
+        pass
+    return None
+
 
 class VersionControl:
     """
     Utilities for version control operations.
+
+    Concurrent commit_code() calls are group-committed: code staged while a
+    commit is running goes into the next one, so a batch of cycles costs a
+    handful of git invocations instead of one per cycle.
     """
 
     def __init__(self, code_dir: Optional[str] = None):
         """Initialize with optional code directory."""
         self.code_dir = code_dir or "generated_code"
         os.makedirs(self.code_dir, exist_ok=True)
+        self._staged: List[str] = []
+        self._committing: Optional[asyncio.Future] = None
+        self._next_commit: Optional[asyncio.Future] = None
 
     @staticmethod
     def get_current_commit() -> str:
         """Get the current commit hash."""
+        commit = _read_head_commit(Path.cwd())
+        if commit is not None:
+            return commit
+        # Only stdout is read, so stderr is discarded rather than piped
         result = subprocess.run(
-            ["git", "rev-parse", "HEAD"], capture_output=True, text=True
+            ["git", "rev-parse", "HEAD"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="ascii",
         )
         return result.stdout.strip()
 
@@ -49,10 +113,54 @@ class VersionControl:
 
         return VersionControl.get_current_commit()
 
+    def stage_code(self, code: str) -> str:
+        """
+        Write generated code to the code directory without committing it.
+
+        Files are named after a digest of their content, so identical code
+        maps to the same file.
+
+        Args:
+            code: The generated code to stage
+
+        Returns:
+            str: Path of the written file
+        """
+        digest = hashlib.blake2b(code.encode(), digest_size=8).hexdigest()
+        filepath = os.path.join(self.code_dir, f"model_{digest}.py")
+        Path(filepath).write_text(code)
+        if filepath not in self._staged:
+            self._staged.append(filepath)
+        return filepath
+
+    def commit_staged(self) -> str:
+        """
+        Commit every staged file in a single commit.
+
+        Returns:
+            str: The resulting commit hash
+        """
+        paths, self._staged = self._staged, []
+        return self._commit_paths(paths)
+
+    def _commit_paths(self, paths: List[str]) -> str:
+        """Stage and commit the given files with one git add and commit."""
+        if paths:
+            if len(paths) == 1:
+                message = f"Generated model code: {os.path.basename(paths[0])}"
+            else:
+                message = f"Generated model code: {len(paths)} files"
+            subprocess.run(["git", "add", *paths])
+            subprocess.run(["git", "commit", "-m", message, "--", *paths])
+        return self.get_current_commit()
+
     async def commit_code(self, code: str) -> str:
         """
         Save and commit generated code.
 
+        The code joins the next group commit; the call returns once that
+        commit has been made.
+
         Args:
             code: The generated code to commit
 
@@ -63,15 +171,23 @@ class VersionControl:
             RuntimeError: If git operations fail
         """
         try:
-            # Create a unique filename
-            filename = f"model_{self.get_current_commit()[:8]}.py"
-            filepath = os.path.join(self.code_dir, filename)
-
-            # Save and commit the code
-            return self.save_code_snapshot(
-                code, filepath, message=f"Generated model code: {filename}"
-            )
+            self.stage_code(code)
+            loop = asyncio.get_running_loop()
+            if self._next_commit is None or self._next_commit.get_loop() is not loop:
+                self._next_commit = loop.create_task(self._group_commit())
+            return await asyncio.shield(self._next_commit)
 
         except Exception as e:
             logger.error(f"Failed to commit code: {str(e)}")
             raise RuntimeError(f"Failed to commit code: {str(e)}")
+
+    async def _group_commit(self) -> str:
+        """Commit everything staged once the commit in progress finishes."""
+        previous = self._committing
+        if previous is not None and previous.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([previous])
+        # Code staged from here on waits for the commit after this one
+        self._committing, self._next_commit = self._next_commit, None
+        paths, self._staged = self._staged, []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._commit_paths, paths)
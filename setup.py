@@ -20,6 +20,7 @@ setup(
         "tqdm>=4.62.0",
         "requests>=2.26.0",
         "python-dotenv>=0.19.0",
+        "orjson>=3.8.0",
         "wandb>=0.12.0",
         "datasets>=2.0.0",
         "docker>=5.0.0",
@@ -220,3 +220,20 @@ def test_invalid_specification(vector_config: Dict[str, Any]):
     }
     with pytest.raises(ValueError):
         vector.encode(invalid_spec)
+
+
+def test_decoder_shared_across_schema(vector_config: Dict[str, Any]):
+    """Test that vectors with the same schema reuse one compiled decoder."""
+    vectors = [
+        ArchitectureVector(
+            dimensions=vector_config["dimensions"],
+            bounds=vector_config["bounds"],
+            categorical_dims=vector_config["categorical_dims"],
+        )
+        for _ in range(2)
+    ]
+    vectors[0].vector = np.random.rand(vector_config["dimensions"])
+    vectors[1].vector = vectors[0].vector.copy()
+
+    assert vectors[0].decode() == vectors[1].decode()
+    assert vectors[0]._decoder is vectors[1]._decoder
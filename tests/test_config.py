@@ -0,0 +1,321 @@
+"""Tests for configuration loading."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from neuromosaic.utils.config import (
+    Config,
+    MonitoringConfig,
+    StorageConfig,
+    load_yaml_config,
+    merge_configs,
+    parse_size,
+    validate_config,
+)
+from neuromosaic.utils.exceptions import ConfigurationError
+
+
+def test_load_yaml_config(temp_dir: Path):
+    """Test parsing a YAML file, including non-ASCII text."""
+    path = temp_dir / "config.yaml"
+    path.write_text("llm:\n  provider: openai\n  note: café\n", encoding="utf-8")
+
+    assert load_yaml_config(path) == {"llm": {"provider": "openai", "note": "café"}}
+
+
+def test_load_yaml_config_missing_file(temp_dir: Path):
+    """Test that unreadable files raise a ConfigurationError."""
+    with pytest.raises(ConfigurationError):
+        load_yaml_config(temp_dir / "missing.yaml")
+
+
+def test_load_yaml_config_is_safe(temp_dir: Path):
+    """Test that the (C-accelerated) loader keeps safe_load semantics."""
+    path = temp_dir / "config.yaml"
+    path.write_text("cmd: !!python/object/apply:os.system ['true']\n")
+
+    with pytest.raises(ConfigurationError):
+        load_yaml_config(path)
+
+
+def test_load_yaml_config_expands_env_refs(
+    temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test ${VAR} expansion, defaults, and that secrets skip the sidecar."""
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    monkeypatch.setenv("NM_TEST_KEY", "sk-secret")
+    monkeypatch.delenv("NM_TEST_MISSING", raising=False)
+    path = temp_dir / "config.yaml"
+    path.write_text(
+        "llm:\n"
+        "  openai_api_key: ${NM_TEST_KEY}\n"
+        "  model: ${NM_TEST_MISSING:gpt-4}\n"
+        "  tags:\n"
+        "    - a-${NM_TEST_KEY}\n"
+        "    - ${NM_TEST_MISSING}\n"
+    )
+
+    assert load_yaml_config(path) == {
+        "llm": {
+            "openai_api_key": "sk-secret",
+            "model": "gpt-4",
+            "tags": ["a-sk-secret", "${NM_TEST_MISSING}"],
+        }
+    }
+    assert "sk-secret" not in (temp_dir / "config.yaml.cache.json").read_text()
+
+    monkeypatch.setenv("NM_TEST_KEY", "sk-rotated")
+    assert load_yaml_config(path)["llm"]["openai_api_key"] == "sk-rotated"
+
+
+def test_load_yaml_config_empty_file(temp_dir: Path):
+    """Test that an empty file loads as None rather than failing."""
+    path = temp_dir / "config.yaml"
+    path.write_text("")
+
+    assert load_yaml_config(path) is None
+
+
+def test_load_yaml_config_uses_sidecar_cache(
+    temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that unchanged YAML is read back from the JSON sidecar."""
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    path = temp_dir / "config.yaml"
+    path.write_text("storage:\n  cache_size: 50GB\n")
+    assert load_yaml_config(path) == {"storage": {"cache_size": "50GB"}}
+    assert (temp_dir / "config.yaml.cache.json").exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML was parsed again")
+
+    monkeypatch.setattr(yaml, "load", fail)
+    assert load_yaml_config(path) == {"storage": {"cache_size": "50GB"}}
+
+    monkeypatch.undo()
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    path.write_text("storage:\n  cache_size: 10GB\n")
+    assert load_yaml_config(path) == {"storage": {"cache_size": "10GB"}}
+
+
+def test_load_yaml_config_memoized_in_process(
+    temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that settled files are parsed once and handed out as copies."""
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    path = temp_dir / "config.yaml"
+    path.write_text("llm:\n  provider: openai\n")
+    os.utime(path, ns=(0, 0))
+    load_yaml_config.cache_clear()
+
+    first = load_yaml_config(path)
+    first["llm"]["provider"] = "changed"
+    monkeypatch.setattr(yaml, "load", lambda *args, **kwargs: {"parsed": "again"})
+    assert load_yaml_config(path) == {"llm": {"provider": "openai"}}
+
+    os.utime(path, ns=(1, 1))
+    assert load_yaml_config(path) == {"parsed": "again"}
+    load_yaml_config.cache_clear()
+
+
+def test_load_yaml_config_skips_cache_outside_production(
+    temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that development loads never write a sidecar."""
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    path = temp_dir / "config.yaml"
+    path.write_text("debug: true\n")
+
+    assert load_yaml_config(path) == {"debug": True}
+    assert not (temp_dir / "config.yaml.cache.json").exists()
+
+
+def test_import_does_not_load_numpy():
+    """Test that importing config leaves the numeric stack unloaded."""
+    code = (
+        "import sys, neuromosaic.utils.config; "
+        "print(sorted({'numpy', 'scipy'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_config_from_env_mapping():
+    """Test building a config from an explicit environment mapping."""
+    config = Config.from_env(
+        {"DEBUG": "1", "CONTAINER_GPU_SUPPORT": "off", "DB_PORT": "6543"}
+    )
+
+    assert config.debug is True
+    assert config.container.gpu_support is False
+    assert config.database.port == 6543
+    assert config.monitoring.enable_wandb is False
+
+
+def test_config_load_config_sections(temp_dir: Path):
+    """Test that YAML sections replace the matching config sections."""
+    path = temp_dir / "config.yaml"
+    path.write_text(
+        "storage:\n  cache_size: 10GB\n"
+        "container:\n  runtime: podman\n"
+        "debug: true\n"
+    )
+    config = Config.from_env({})
+    database = config.database
+
+    config.load_config(path)
+
+    assert isinstance(config.storage, StorageConfig)
+    assert config.storage.cache_size == "10GB"
+    assert config.container.runtime == "podman"
+    assert config.database is database
+    assert config.debug is True
+
+
+def test_config_get():
+    """Test dictionary-style access to fields and nested sections."""
+    config = Config.from_env({})
+
+    assert config.get("environment") == "production"
+    assert config.get("storage.cache_size") == config.storage.cache_size
+    assert config.get("training") == {
+        f: getattr(config.training, f) for f in config.training.__dataclass_fields__
+    }
+    assert config.get("search_strategy.type", "none") == "none"
+    assert config.get("missing", 1) == 1
+    assert config.get("storage.missing", 2) == 2
+    assert config.get("get") is None
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        ("50GB", 50 * 1024**3),
+        ("8g", 8 * 1024**3),
+        (" 1.5 MB ", 1572864),
+        ("512", 512),
+        ("2kb", 2048),
+        ("1T", 1024**4),
+    ],
+)
+def test_parse_size(size: str, expected: int):
+    """Test parsing sizes with full, single letter and missing units."""
+    assert parse_size(size) == expected
+
+
+def test_parse_size_invalid():
+    """Test that malformed sizes raise a ConfigurationError."""
+    for size in ("lots", "1.5", "10XB", "GB"):
+        with pytest.raises(ConfigurationError):
+            parse_size(size)
+
+
+def test_config_module_is_packaged():
+    """Test that the single config module ships with the package."""
+    from setuptools import find_packages
+
+    import neuromosaic.utils.config as config_module
+
+    root = Path(__file__).resolve().parents[1]
+    assert "neuromosaic.utils" in find_packages(
+        str(root), include=["neuromosaic", "neuromosaic.*"]
+    )
+    assert Path(config_module.__file__).resolve() == (
+        root / "neuromosaic" / "utils" / "config.py"
+    )
+
+
+def test_load_env_file_runs_once(temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that the .env file is searched for once and can be skipped."""
+    import neuromosaic.utils.config as config_module
+
+    dotenv_path = temp_dir / ".env"
+    dotenv_path.write_text("NEUROMOSAIC_TEST_DOTENV=loaded\n")
+    calls = []
+
+    def find_dotenv():
+        calls.append(True)
+        return str(dotenv_path)
+
+    monkeypatch.setattr(config_module, "find_dotenv", find_dotenv)
+    monkeypatch.setattr(config_module, "_dotenv_loaded", False)
+    monkeypatch.delenv("NEUROMOSAIC_TEST_DOTENV", raising=False)
+
+    monkeypatch.setenv("NEUROMOSAIC_SKIP_DOTENV", "1")
+    config_module.load_env_file()
+    assert calls == []
+
+    monkeypatch.delenv("NEUROMOSAIC_SKIP_DOTENV")
+    config_module.load_env_file()
+    config_module.load_env_file()
+    assert calls == [True]
+    assert os.environ["NEUROMOSAIC_TEST_DOTENV"] == "loaded"
+
+
+def test_arch_space_built_on_first_use():
+    """Test that a config from the environment defers building its ArchSpace."""
+    code = (
+        "import sys\n"
+        "from neuromosaic.utils.config import Config, validate_config\n"
+        "config = Config.from_env()\n"
+        "validate_config(config)\n"
+        "print('numpy' in sys.modules)\n"
+        "space = config.get_arch_space()\n"
+        "print(type(space).__name__, space.dimensions, config.get_arch_space() is space)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split("\n")[:2] == ["False", "ArchSpace 64 True"]
+
+
+def test_merge_configs():
+    """Test merging nested dicts without modifying either input."""
+    base = {"llm": {"model": "gpt-4", "retry": {"max": 3, "wait": 1}}, "debug": False}
+    override = {"llm": {"retry": {"max": 5}}, "debug": True, "extra": {"a": 1}}
+
+    merged = merge_configs(base, override)
+
+    assert merged == {
+        "llm": {"model": "gpt-4", "retry": {"max": 5, "wait": 1}},
+        "debug": True,
+        "extra": {"a": 1},
+    }
+    assert base["llm"]["retry"] == {"max": 3, "wait": 1}
+    assert override == {"llm": {"retry": {"max": 5}}, "debug": True, "extra": {"a": 1}}
+
+
+def test_sections_validate_on_construction():
+    """Test that invalid section values are rejected when built."""
+    with pytest.raises(ConfigurationError):
+        MonitoringConfig(log_level="VERBOSE")
+    with pytest.raises(ConfigurationError):
+        StorageConfig(cache_size="plenty")
+
+
+def test_validate_config_rechecks_reassigned_fields():
+    """Test that validate_config catches values changed after construction."""
+    config = Config.from_env({})
+    validate_config(config)
+
+    config.monitoring.log_level = "VERBOSE"
+    with pytest.raises(ConfigurationError):
+        validate_config(config)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+def test_config_sections_are_slotted():
+    """Test that configs store fields in slots rather than a __dict__."""
+    config = Config.from_env({})
+
+    assert not hasattr(config, "__dict__")
+    assert not hasattr(config.container, "__dict__")
+    with pytest.raises(AttributeError):
+        config.storage.unknown_option = True
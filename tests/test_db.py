@@ -2,10 +2,17 @@
 
 import pytest
 import json
+import sqlite3
+import threading
+import uuid
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, Any
+from unittest.mock import patch
 
-from neuromosaic.results_db.db import ResultsDB
+from sqlalchemy import event
+
+from neuromosaic.results_db.db import ResultsDB, close_db_instance, get_db_instance
 from neuromosaic.results_db.models import Base
 
 pytestmark = pytest.mark.asyncio  # Mark all tests in this module as async tests
@@ -72,6 +79,23 @@ async def test_update_experiment_status(db: ResultsDB, sample_experiment: str):
     assert details["end_time"] is not None
 
 
+async def test_experiment_lookups_are_cached(db: ResultsDB, sample_experiment: str):
+    """Test that repeat lookups skip the database until the row changes."""
+    statements = []
+    event.listen(
+        db.engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+
+    first = await db.get_experiment_details(sample_experiment)
+    first["config"]["name"] = "changed"
+    second = await db.get_experiment_details(sample_experiment)
+    assert len(statements) == 1
+    assert second["config"]["name"] == "Test Experiment"
+
+    await db.update_experiment_status(sample_experiment, "running")
+    assert (await db.get_experiment_details(sample_experiment))["status"] == "running"
+
+
 async def test_save_and_list_runs(db: ResultsDB, sample_experiment: str):
     """Test saving and listing runs."""
     # Create multiple runs
@@ -103,6 +127,91 @@ async def test_save_and_list_runs(db: ResultsDB, sample_experiment: str):
     assert len(future_runs) == 0
 
 
+async def test_save_run_info_batch(db: ResultsDB, sample_experiment: str):
+    """Test saving several runs in one transaction."""
+    run_infos = [
+        {
+            "id": f"run_{i}",
+            "architecture_id": f"arch_{i}",
+            "experiment_id": sample_experiment,
+            "metrics": {"accuracy": 0.8 + i * 0.05},
+            "arch_spec": {"layers": [32, 16]},
+        }
+        for i in range(3)
+    ]
+
+    run_ids = await db.save_run_info_batch(run_infos)
+
+    assert run_ids == ["run_0", "run_1", "run_2"]
+    runs = await db.list_all_runs(experiment_id=sample_experiment)
+    assert len(runs) == 3
+
+
+async def test_save_run_info_batch_default_ids(db: ResultsDB):
+    """Test bulk inserting runs without IDs that share an architecture."""
+    run_infos = [
+        {
+            "architecture_id": "arch_shared",
+            "metrics": {"accuracy": i / 50},
+            "arch_spec": {"layers": [32, 16]},
+        }
+        for i in range(50)
+    ]
+
+    run_ids = await db.save_run_info_batch(run_infos)
+
+    assert len(set(run_ids)) == 50
+    assert run_ids == sorted(run_ids)
+    assert all(uuid.UUID(run_id).version == 7 for run_id in run_ids)
+    assert len(await db.list_all_runs()) == 50
+    assert len(await db.list_architectures()) == 1
+
+
+async def test_iter_all_runs_streams_in_batches(db: ResultsDB):
+    """Test that streaming runs yields the same rows as listing them."""
+    await db.save_run_info_batch(
+        [{"architecture_id": f"arch_{i}", "metrics": {"step": i}} for i in range(7)]
+    )
+
+    streamed = [run async for run in db.iter_all_runs(batch_size=3)]
+
+    assert streamed == await db.list_all_runs()
+    assert [run async for run in db.iter_all_runs(architecture_id="arch_4")] == [
+        streamed[4]
+    ]
+
+
+async def test_save_run_info_numpy_metrics(db: ResultsDB):
+    """Test that numpy metric values are stored as plain JSON numbers."""
+    await db.save_run_info(
+        {
+            "architecture_id": "arch_np",
+            "metrics": {"accuracy": np.float32(0.5), "confusion": np.eye(2)},
+        }
+    )
+
+    (run,) = await db.list_all_runs()
+    assert run["metrics"] == {"accuracy": 0.5, "confusion": [[1.0, 0.0], [0.0, 1.0]]}
+
+
+async def test_decoded_json_is_not_shared(db: ResultsDB):
+    """Test that decoded dicts, nested values included, can be modified."""
+    metrics = {"loss": 0.5, "per_class": {"cat": 0.9}}
+    await db.save_run_info({"architecture_id": "arch_c", "metrics": metrics})
+
+    (first,) = await db.list_all_runs()
+    first["metrics"]["loss"] = 1.0
+    first["metrics"]["per_class"]["cat"] = 0.0
+    (second,) = await db.list_all_runs()
+
+    assert second["metrics"] == metrics
+
+    exp_id = await db.create_experiment("Nested", "", {"optimizer": {"lr": 0.1}})
+    (await db.get_experiment_details(exp_id))["config"]["optimizer"]["lr"] = 999
+    details = await db.get_experiment_details(exp_id)
+    assert details["config"]["optimizer"] == {"lr": 0.1}
+
+
 async def test_get_best_architectures(db: ResultsDB, sample_experiment: str):
     """Test getting best architectures based on metrics."""
     # Create runs with different metrics
@@ -126,6 +235,40 @@ async def test_get_best_architectures(db: ResultsDB, sample_experiment: str):
     assert best[0]["metrics"]["accuracy"] > best[1]["metrics"]["accuracy"]
 
 
+async def test_get_best_architectures_in_sql(db: ResultsDB):
+    """Test ranking in SQL skips non-numeric metrics and uses an index."""
+    for architecture_id, accuracy in [("a", 0.7), ("b", "n/a"), ("c", 0.9)]:
+        await db.save_run_info(
+            {"architecture_id": architecture_id, "metrics": {"accuracy": accuracy}}
+        )
+
+    best = await db.get_best_architectures("accuracy")
+    assert [b["architecture_id"] for b in best] == ["c", "a"]
+
+    with db.engine.connect() as conn:
+        indexes = conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        ).scalars()
+        assert "ix_runs_metric_accuracy" in set(indexes)
+
+    with pytest.raises(ValueError):
+        await db.get_best_architectures("accuracy') --")
+
+
+async def test_best_architectures_python_fallback_matches_sql(db: ResultsDB):
+    """Test that the non-SQLite ranking agrees with the SQL one."""
+    for i, accuracy in enumerate([0.7, "n/a", 0.9, True, 0.8]):
+        await db.save_run_info(
+            {"architecture_id": f"arch_{i}", "metrics": {"accuracy": accuracy}}
+        )
+
+    in_sql = await db.get_best_architectures("accuracy", limit=2)
+    in_python = db._best_architectures_in_python("accuracy", limit=2)
+
+    assert in_python == in_sql
+    assert [b["architecture_id"] for b in in_python] == ["arch_2", "arch_4"]
+
+
 async def test_delete_experiment(db: ResultsDB, sample_experiment: str):
     """Test deleting an experiment."""
     # First verify it exists
@@ -139,6 +282,18 @@ async def test_delete_experiment(db: ResultsDB, sample_experiment: str):
     assert await db.get_experiment_details(sample_experiment) is None
 
 
+async def test_delete_experiment_detaches_runs(db: ResultsDB, sample_experiment: str):
+    """Test that deleting an experiment keeps its runs, unassigned."""
+    await db.save_run_info(
+        {"architecture_id": "arch_d", "experiment_id": sample_experiment, "metrics": {}}
+    )
+
+    assert await db.delete_experiment(sample_experiment) is True
+
+    (run,) = await db.list_all_runs()
+    assert run["experiment_id"] is None
+
+
 async def test_get_architecture(db: ResultsDB, sample_architecture: str):
     """Test getting architecture details."""
     arch = await db.get_architecture(sample_architecture)
@@ -215,3 +370,171 @@ async def test_error_handling(db: ResultsDB):
     # Test invalid metric name
     best = await db.get_best_architectures("non_existent_metric")
     assert len(best) == 0
+
+
+async def test_sqlite_connections_use_wal(temp_dir):
+    """Test that SQLite connections are opened in WAL mode."""
+    db = ResultsDB({"database": {"db_url": f"sqlite:///{temp_dir / 'wal.db'}"}})
+    with db.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+    db.close()
+
+
+def test_engine_options_batch_postgres_executemany():
+    """Test that psycopg2 engines batch executemany writes."""
+    options = ResultsDB._engine_options("postgresql+psycopg2://u:p@localhost/db")
+    assert options == {"executemany_mode": "values_plus_batch"}
+    assert ResultsDB._engine_options("postgresql+psycopg://u:p@localhost/db") == {}
+
+
+async def test_sqlite_connection_reused_across_calls(temp_dir):
+    """Test that repeated calls share one pooled SQLite connection."""
+    db = ResultsDB({"database": {"db_url": f"sqlite:///{temp_dir / 'pool.db'}"}})
+    connects = []
+    event.listen(db.engine, "connect", lambda *args: connects.append(args))
+
+    for i in range(3):
+        await db.save_run_info({"architecture_id": f"arch_{i}", "metrics": {}})
+    assert len(await db.list_all_runs()) == 3
+    assert len(connects) <= 1
+    db.close()
+
+
+async def test_queries_run_off_the_event_loop(db: ResultsDB):
+    """Test that blocking driver calls execute on the executor threads."""
+    threads = set()
+    event.listen(
+        db.engine,
+        "before_cursor_execute",
+        lambda *args: threads.add(threading.current_thread().name),
+    )
+
+    await db.save_run_info({"architecture_id": "arch_t", "metrics": {}})
+    await db.list_all_runs()
+    [run async for run in db.iter_all_runs()]
+
+    assert threads and all(name.startswith("results-db") for name in threads)
+
+
+async def test_indexes_added_to_existing_database(temp_dir):
+    """Test that reopening a database creates indexes it is missing."""
+    db_url = f"sqlite:///{temp_dir / 'indexes.db'}"
+    db = ResultsDB({"database": {"db_url": db_url}})
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_runs_exp_ts")
+    db.close()
+
+    db = ResultsDB({"database": {"db_url": db_url}})
+    with db.engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT * FROM runs "
+            "WHERE experiment_id = 'exp' ORDER BY timestamp DESC"
+        ).all()
+    assert "ix_runs_exp_ts" in str(plan)
+    db.close()
+
+
+async def test_date_bounded_run_listing_uses_index(db: ResultsDB):
+    """Test that filtering runs by date alone is served by an index."""
+    with db.engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT * FROM runs "
+            "WHERE timestamp >= '2024-01-01' AND timestamp <= '2024-12-31'"
+        ).all()
+    assert "ix_runs_timestamp" in str(plan)
+
+
+async def test_gp_state_roundtrip(temp_dir):
+    """Test persisting and memory-mapping a GP posterior."""
+    db = ResultsDB(
+        {
+            "database": {
+                "db_url": f"sqlite:///{temp_dir / 'gp.db'}",
+                "gp_state_dir": str(temp_dir / "gp_state"),
+            }
+        }
+    )
+    assert await db.load_gp_state("exp_1") is None
+
+    L = np.tril(np.ones((3, 3)))
+    hypers = {"kernel": "matern", "length_scale": 1.0, "noise": 1e-6}
+    await db.save_gp_state(
+        "exp_1", L, np.arange(3.0), np.eye(3), hypers, np.array([0.1, 0.2, 0.3])
+    )
+
+    state = await db.load_gp_state("exp_1")
+    assert isinstance(state["L"], np.memmap)
+    np.testing.assert_array_equal(state["L"], L)
+    np.testing.assert_array_equal(state["y_train"], [0.1, 0.2, 0.3])
+    assert state["hypers"] == hypers
+
+    # A second save switches generations; the first mapping stays readable
+    L2 = np.tril(np.ones((4, 4)))
+    await db.save_gp_state("exp_1", L2, np.arange(4.0), np.eye(4), hypers, np.ones(4))
+    np.testing.assert_array_equal(state["L"], L)
+    assert (await db.load_gp_state("exp_1"))["L"].shape == (4, 4)
+    await db.save_gp_state("exp_1", L, np.arange(3.0), np.eye(3), hypers, np.ones(3))
+    generations = [p for p in (temp_dir / "gp_state" / "exp_1").iterdir() if p.is_dir()]
+    assert len(generations) == 2
+
+    with pytest.raises(ValueError, match="experiment ID"):
+        await db.load_gp_state("../exp_1")
+    db.close()
+
+
+async def test_gp_state_rejects_inconsistent_arrays(temp_dir):
+    """Test that a state whose arrays disagree on n is not loaded."""
+    db = ResultsDB(
+        {
+            "database": {
+                "db_url": f"sqlite:///{temp_dir / 'gp.db'}",
+                "gp_state_dir": str(temp_dir / "gp_state"),
+            }
+        }
+    )
+    hypers = {"kernel": "matern", "length_scale": 1.0, "noise": 1e-6}
+    await db.save_gp_state(
+        "exp_1", np.eye(3), np.zeros(3), np.eye(3), hypers, np.zeros(2)
+    )
+
+    assert await db.load_gp_state("exp_1") is None
+    db.close()
+
+
+def test_gp_state_dir_is_anchored(temp_dir, monkeypatch):
+    """Test that a relative GP state dir does not depend on the CWD."""
+    db_path = temp_dir / "runs" / "results.db"
+    db_path.parent.mkdir()
+    db = ResultsDB({"database": {"db_url": f"sqlite:///{db_path}"}})
+    assert db.gp_state_dir == db_path.parent.resolve() / "gp_state"
+    db.close()
+
+    monkeypatch.chdir(temp_dir)
+    db = ResultsDB(
+        {
+            "database": {"db_url": "sqlite://", "gp_state_dir": "state"},
+            "storage": {"root": "data"},
+        }
+    )
+    assert db.gp_state_dir == temp_dir.resolve() / "data" / "state"
+    db.close()
+
+
+async def test_close_db_instance(db_config: Dict[str, Any]):
+    """Test that closing the shared instance lets a fresh one be created."""
+    first = get_db_instance(db_config)
+    close_db_instance()
+    second = get_db_instance(db_config)
+
+    assert second is not first
+    close_db_instance()
+
+
+def test_close_refreshes_planner_statistics(temp_dir):
+    """Test that closing runs the shared PRAGMA optimize helper."""
+    db = ResultsDB({"database": {"db_url": f"sqlite:///{temp_dir / 'close.db'}"}})
+    with patch("neuromosaic.utils.sqlite.optimize") as optimize:
+        db.close()
+    optimize.assert_called_once()
+    assert isinstance(optimize.call_args.args[0], sqlite3.Connection)
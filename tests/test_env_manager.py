@@ -0,0 +1,87 @@
+"""
+Tests for the Docker container manager.
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from neuromosaic.env_manager.providers import DockerContainerManager
+
+
+def _blocking(result=None, delay: float = 0.2):
+    """Build a Docker SDK stand-in that blocks its thread like a real call."""
+
+    def call(*args, **kwargs):
+        time.sleep(delay)
+        return result
+
+    return call
+
+
+@pytest.fixture
+def docker_client() -> Mock:
+    """Create a mock Docker client whose container calls block."""
+    container = Mock(id="c" * 64, status="running")
+    container.attrs = {"State": {"Health": {"Status": "healthy"}}}
+    container.exec_run = Mock(side_effect=_blocking((0, (b"done", None))))
+    container.stats = Mock(
+        return_value={
+            "cpu_stats": {"cpu_usage": {"total_usage": 30}, "system_cpu_usage": 200},
+            "precpu_stats": {"cpu_usage": {"total_usage": 10}, "system_cpu_usage": 100},
+            "memory_stats": {"usage": 1024},
+            "blkio_stats": {},
+        }
+    )
+    client = Mock()
+    client.containers.run = Mock(side_effect=_blocking(container))
+    client.containers.get = Mock(return_value=container)
+    return client
+
+
+@pytest.fixture
+def manager(docker_client: Mock) -> DockerContainerManager:
+    """Create a container manager backed by the mock client."""
+    with patch(
+        "neuromosaic.env_manager.providers.docker.from_env",
+        return_value=docker_client,
+    ):
+        return DockerContainerManager({"base_image": "python:3.11"})
+
+
+async def _ticks_during(coro) -> int:
+    """Count event loop ticks of 10 ms while a coroutine runs."""
+    task = asyncio.ensure_future(coro)
+    ticks = 0
+    while not task.done():
+        await asyncio.sleep(0.01)
+        ticks += 1
+    await task
+    return ticks
+
+
+@pytest.mark.asyncio
+async def test_container_setup_does_not_block_the_loop(
+    manager: DockerContainerManager,
+):
+    """Test that creating and resetting containers leave the loop free."""
+    assert await _ticks_during(manager.create_container({"code": "print(1)"})) > 5
+    assert await _ticks_during(manager.reset_workspace("c1", {"code": "x = 1"})) > 5
+
+
+@pytest.mark.asyncio
+async def test_run_container_does_not_block_the_loop(
+    manager: DockerContainerManager,
+):
+    """Test that training runs in a worker thread and is monitored."""
+    task = asyncio.ensure_future(
+        asyncio.wait_for(manager.run_container("c1"), timeout=5)
+    )
+    assert await _ticks_during(task) > 5
+
+    result = task.result()
+    assert result["status"] == "success"
+    assert result["output"] == "done"
+    assert result["metrics"]["cpu_percent_avg"] == 20.0
+    assert result["metrics"]["memory_usage_max"] == 1024
@@ -0,0 +1,33 @@
+"""Tests for the logging utilities."""
+
+import logging
+from pathlib import Path
+
+from neuromosaic.utils.logging import setup_logger
+
+
+def test_setup_logger_does_not_duplicate_handlers(temp_dir: Path):
+    """Test that repeated setup keeps one set of handlers per logger."""
+    log_file = str(temp_dir / "run.log")
+    logger = setup_logger("neuromosaic.tests.repeat", log_file)
+    handlers = list(logger.handlers)
+
+    assert setup_logger("neuromosaic.tests.repeat", log_file) is logger
+    assert logger.handlers == handlers
+
+    logger.warning("written once")
+    for handler in handlers:
+        handler.flush()
+    assert Path(log_file).read_text().count("written once") == 1
+
+
+def test_setup_logger_shares_file_handlers(temp_dir: Path):
+    """Test that loggers writing to the same file share one handler."""
+    log_file = str(temp_dir / "shared.log")
+    first = setup_logger("neuromosaic.tests.first", log_file)
+    second = setup_logger("neuromosaic.tests.second", log_file, level=logging.DEBUG)
+
+    first_files = [h for h in first.handlers if isinstance(h, logging.FileHandler)]
+    second_files = [h for h in second.handlers if isinstance(h, logging.FileHandler)]
+    assert first_files == second_files
+    assert len(first_files) == 1
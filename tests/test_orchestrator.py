@@ -2,17 +2,31 @@
 Tests for the orchestrator module.
 """
 
+import asyncio
 import pytest
+import numpy as np
 from unittest.mock import Mock, AsyncMock, patch, PropertyMock
 from typing import Dict, Any
 from dataclasses import dataclass
 from pathlib import Path
+from datetime import datetime, timedelta, timezone
 
 from neuromosaic.orchestrator import Orchestrator
+from neuromosaic.orchestrator.orchestrator import (
+    CycleResult,
+    get_orchestrator_instance,
+)
+from neuromosaic.orchestrator.code_cache import SemanticCodeCache
 from neuromosaic.arch_space.vector_representation import ArchitectureVector, ArchSpace
 from neuromosaic.llm_code_gen import CodeGenerator
 from neuromosaic.env_manager import ContainerManager
+from neuromosaic.utils.exceptions import ContainerDaemonError
 from neuromosaic.orchestrator.strategies import RandomSearch, BayesianOptimization
+from neuromosaic.orchestrator.strategies.bayesopt_strategy import (
+    GaussianProcess,
+    _log_h,
+)
+from neuromosaic.orchestrator.strategies.random_strategy import SearchSpaceExhausted
 from neuromosaic.utils.config import (
     Config,
     LLMConfig,
@@ -73,6 +87,7 @@ def mock_results_db() -> Mock:
     """Create a mock results database."""
     db = Mock()
     db.save_run_info = AsyncMock()
+    db.save_run_info_batch = AsyncMock()
     return db
 
 
@@ -97,6 +112,9 @@ def mock_search_strategy(mock_arch_vector: Mock) -> Mock:
     """Create a mock search strategy."""
     strategy = Mock()
     strategy.suggest_architecture = AsyncMock(return_value=mock_arch_vector)
+    strategy.suggest_architectures = AsyncMock(
+        side_effect=lambda n, **kwargs: [mock_arch_vector] * n
+    )
     strategy.update_with_results = AsyncMock()
     # Add history property that supports len()
     type(strategy).history = PropertyMock(return_value=[])
@@ -116,6 +134,7 @@ def mock_code_generator() -> Mock:
 def mock_container_manager() -> Mock:
     """Create a mock container manager."""
     manager = Mock(spec=ContainerManager)
+    manager.prepare_base_image = AsyncMock()
     manager.create_container = AsyncMock(return_value="container-123")
     manager.run_container = AsyncMock(
         return_value={
@@ -161,6 +180,158 @@ def mock_training_results() -> Dict[str, float]:
     return {"accuracy": 0.85, "latency": 45.6, "loss": 0.32, "memory_usage": 1024.0}
 
 
+def test_components_created_on_first_access(config: Config, mock_code_generator: Mock):
+    """Test that providers are only constructed when first used."""
+    with patch(
+        "neuromosaic.orchestrator.orchestrator._llm_provider_cls"
+    ) as mock_provider_cls:
+        mock_provider_cls.return_value.return_value = mock_code_generator
+        orchestrator = Orchestrator(config)
+        mock_provider_cls.assert_not_called()
+
+        assert orchestrator.code_generator is mock_code_generator
+        assert orchestrator.code_generator is mock_code_generator
+        mock_provider_cls.assert_called_once_with("llama")
+
+
+def test_strategy_return_type_validated_at_setup(config: Config):
+    """Test that strategies must declare ArchitectureVector suggestions."""
+
+    class UntypedSearch(RandomSearch):
+        async def suggest_architecture(self) -> Dict[str, Any]:
+            return {}
+
+    config.search_strategy = UntypedSearch(
+        {"type": "random", "dimensions": 64, "num_trials": 10}
+    )
+    with pytest.raises(ValueError, match="must return an ArchitectureVector"):
+        Orchestrator(config)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_instance_per_context(config: Config):
+    """Test that concurrent tasks each get their own orchestrator."""
+
+    async def instance_pair():
+        first = get_orchestrator_instance(config)
+        await asyncio.sleep(0)
+        return first, get_orchestrator_instance(config)
+
+    (a1, a2), (b1, b2) = await asyncio.gather(instance_pair(), instance_pair())
+
+    assert a1 is a2 and b1 is b2
+    assert a1 is not b1
+
+
+@pytest.mark.asyncio
+async def test_get_experiment_logs_since(config: Config):
+    """Test filtering experiment logs by start time."""
+    orchestrator = Orchestrator(config)
+    orchestrator.run_cycle = AsyncMock(return_value={})
+
+    orchestrator.schedule_experiment("exp-1")
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    logs = orchestrator.get_experiment_logs("exp-1")
+    assert logs == [
+        "Experiment scheduled",
+        "Experiment started",
+        "Experiment completed",
+    ]
+    future = datetime.now(timezone.utc) + timedelta(minutes=1)
+    assert orchestrator.get_experiment_logs("exp-1", future.isoformat()) == []
+    past = datetime.utcnow() - timedelta(minutes=1)
+    assert orchestrator.get_experiment_logs("exp-1", past.isoformat()) == logs
+
+
+@pytest.mark.asyncio
+async def test_stop_experiment_cancels_task(config: Config):
+    """Test that stopping an experiment cancels its running cycle."""
+    orchestrator = Orchestrator(config)
+    cycle_started = asyncio.Event()
+
+    async def slow_cycle():
+        cycle_started.set()
+        await asyncio.sleep(60)
+
+    orchestrator.run_cycle = slow_cycle
+    orchestrator.schedule_experiment("exp-1")
+    await cycle_started.wait()
+    assert orchestrator.get_experiment_status("exp-1")["status"] == "running"
+
+    orchestrator.stop_experiment("exp-1")
+    assert orchestrator.get_experiment_status("exp-1")["status"] == "stopping"
+    task = orchestrator._running_experiments["exp-1"].task
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    status = orchestrator.get_experiment_status("exp-1")
+    assert status["status"] == "stopped"
+    assert status["logs"][-1] == "Experiment stopped"
+
+
+def test_get_or_decode_memoizes_specs(config: Config):
+    """Test that identical vectors are decoded once and specs are copies."""
+    orchestrator = Orchestrator(config)
+    space = ArchSpace(dimensions=64)
+    first, second = space.create_vector(), space.create_vector()
+    first.vector = np.random.uniform(size=64)
+    second.vector = first.vector.copy()
+
+    with patch.object(
+        ArchitectureVector,
+        "decode",
+        autospec=True,
+        side_effect=ArchitectureVector.decode,
+    ) as decode:
+        spec = orchestrator._get_or_decode(first)
+        spec["num_layers"] = -1
+        assert orchestrator._get_or_decode(second) == first.decode()
+    assert decode.call_count == 2  # one miss plus the reference decode
+
+
+def test_cycle_result_is_slotted_mapping():
+    """Test that cycle results read like dicts without a per-instance dict."""
+    result = CycleResult(
+        architecture_id="arch_1",
+        metrics={"accuracy": 0.9},
+        code_version="abc123",
+        arch_spec={"num_layers": 2},
+    )
+
+    assert not hasattr(result, "__dict__")
+    assert result["metrics"] == {"accuracy": 0.9}
+    assert result.get("status") is None
+    assert dict(result) == {
+        "architecture_id": "arch_1",
+        "metrics": {"accuracy": 0.9},
+        "code_version": "abc123",
+        "arch_spec": {"num_layers": 2},
+    }
+    with pytest.raises(KeyError):
+        result["status"]
+
+
+@pytest.mark.asyncio
+async def test_aclose_flushes_and_releases_clients(
+    config: Config, mock_code_generator: Mock, mock_results_db: Mock
+):
+    """Test that aclose writes pending results and closes the generator."""
+    orchestrator = Orchestrator(config)
+    orchestrator.code_generator = mock_code_generator
+    orchestrator._results_db = mock_results_db
+    orchestrator._search_strategy = Mock(update_with_results=AsyncMock())
+
+    await orchestrator.submit_results({"architecture_id": "arch_1", "metrics": {}})
+    writer = orchestrator._db_writer_task
+    await orchestrator.aclose()
+
+    mock_results_db.save_run_info_batch.assert_awaited_once()
+    mock_code_generator.aclose.assert_awaited_once()
+    assert writer.cancelled()
+
+
 @pytest.mark.asyncio
 async def test_run_cycle(
     config: Config,
@@ -198,14 +369,17 @@ async def test_run_cycle(
 
         # Run cycle
         result = await orchestrator.run_cycle()
+        repeat = await orchestrator.run_cycle()
+        await orchestrator.flush_results()
 
     # Verify interactions
     assert mock_code_generator.generate_code.called
+    assert mock_container_manager.prepare_base_image.called
     assert mock_container_manager.create_container.called
     assert mock_container_manager.run_container.called
     assert mock_container_manager.cleanup_container.called
     assert mock_version_control.commit_code.called
-    assert mock_results_db.save_run_info.called
+    assert mock_results_db.save_run_info_batch.called
 
     # Check result structure
     assert "architecture_id" in result
@@ -213,6 +387,10 @@ async def test_run_cycle(
     assert "code_version" in result
     assert result["metrics"] == mock_training_results
 
+    # Architecture IDs are derived from the spec, not from the code commit
+    assert len(result["architecture_id"]) == len("arch_") + 32
+    assert repeat["architecture_id"] == result["architecture_id"]
+
 
 @pytest.mark.asyncio
 async def test_get_next_architecture(
@@ -239,7 +417,7 @@ async def test_get_next_architecture(
 
     assert isinstance(arch, dict)
     assert "vector" in arch
-    assert mock_search_strategy.suggest_architecture.called
+    mock_search_strategy.suggest_architectures.assert_called_once_with(1)
     assert isinstance(arch["metadata"], dict)
     assert "strategy" in arch["metadata"]
     assert "iteration" in arch["metadata"]
@@ -252,6 +430,7 @@ async def test_submit_results(
     mock_container_manager: Mock,
     mock_results_db: Mock,
     mock_search_strategy: Mock,
+    mock_arch_vector: Mock,
 ):
     """Test submitting results from an experiment."""
     with patch(
@@ -274,11 +453,26 @@ async def test_submit_results(
             "code_version": "abc123",
         }
 
-        await orchestrator.submit_results(results)
+        await orchestrator.submit_results(results, mock_arch_vector)
+        await orchestrator.flush_results()
 
         # Verify results were stored and strategy updated
-        mock_results_db.save_run_info.assert_called_once_with(results)
-        mock_search_strategy.update_with_results.assert_called_once_with(results)
+        mock_results_db.save_run_info_batch.assert_called_once_with([results])
+        mock_search_strategy.update_with_results.assert_called_once_with(
+            mock_arch_vector, results["metrics"]
+        )
+
+        # Without the vector the results are only recorded
+        await orchestrator.submit_results(results)
+        await orchestrator.flush_results()
+        assert mock_search_strategy.update_with_results.call_count == 1
+
+        with pytest.raises(ValueError, match="metrics"):
+            await orchestrator.submit_results({"architecture_id": "test-456"})
+        with pytest.raises(ValueError, match="dictionary"):
+            await orchestrator.submit_results(
+                {"architecture_id": "test-456", "metrics": 0.9}
+            )
 
 
 @pytest.mark.asyncio
@@ -306,15 +500,548 @@ async def test_run_batch_parallel(
         orchestrator._results_db = mock_results_db
         orchestrator._search_strategy = mock_search_strategy
 
+        # Distinct specs so every cycle needs its own generated code
+        mock_search_strategy.suggest_architectures.side_effect = None
+        mock_search_strategy.suggest_architectures.return_value = [
+            Mock(spec=ArchitectureVector, decode=Mock(return_value={"num_layers": n}))
+            for n in range(3)
+        ]
+
         results = await orchestrator.run_batch(batch_size=3, parallel=True)
 
     assert len(results) == 3
-    assert all(isinstance(r, dict) for r in results)
+    assert all(isinstance(r, CycleResult) for r in results)
+    mock_search_strategy.suggest_architectures.assert_called_once()
+    assert mock_search_strategy.update_with_results.call_count == 3
     assert mock_code_generator.generate_code.call_count == 3
     assert mock_container_manager.create_container.call_count == 3
     assert mock_container_manager.cleanup_container.call_count == 3
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "strategy_factory",
+    [
+        lambda: RandomSearch({"dimensions": 4, "num_trials": 10}),
+        lambda: BayesianOptimization({"dimensions": 4, "num_candidates": 64}),
+    ],
+    ids=["random", "bayesopt"],
+)
+async def test_run_batch_updates_real_strategy(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    strategy_factory,
+):
+    """Test that batch results reach a real strategy's history."""
+    mock_container_manager.run_container.return_value = {
+        "status": "success",
+        "results": {"objective": 0.5, "accuracy": 0.9},
+    }
+    with patch(
+        "neuromosaic.llm_code_gen.providers.OpenAICodeGenerator"
+    ) as mock_gen_cls, patch(
+        "neuromosaic.env_manager.providers.DockerContainerManager"
+    ) as mock_container_cls:
+        mock_gen_cls.return_value = mock_code_generator
+        mock_container_cls.return_value = mock_container_manager
+
+        orchestrator = Orchestrator(config)
+        orchestrator.code_generator = mock_code_generator
+        orchestrator.container_manager = mock_container_manager
+        orchestrator._version_control = mock_version_control
+        orchestrator._results_db = mock_results_db
+        strategy = orchestrator._search_strategy = strategy_factory()
+
+        # The second batch is suggested by the GP for Bayesian optimization
+        results = await orchestrator.run_batch(batch_size=4, parallel=True)
+        results += await orchestrator.run_batch(batch_size=2, parallel=False)
+        # The sequential batch left a prefetched suggestion pending
+        assert len(strategy.pending) == 1
+        await orchestrator.aclose()
+
+    assert all(isinstance(r, CycleResult) for r in results)
+    assert len(strategy.history) == 6
+    assert not strategy.pending
+    assert all(h["results"]["objective"] == 0.5 for h in strategy.history)
+
+
+@pytest.mark.asyncio
+async def test_run_batch_persists_gp_state_after_each_result(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+):
+    """Test that the persisted GP posterior includes the latest observation."""
+    mock_container_manager.run_container.return_value = {
+        "status": "success",
+        "results": {"objective": 0.5},
+    }
+    mock_results_db.load_gp_state = AsyncMock(return_value=None)
+    mock_results_db.save_gp_state = AsyncMock()
+    orchestrator = Orchestrator(config, experiment_id="exp_1")
+    orchestrator.code_generator = mock_code_generator
+    orchestrator.container_manager = mock_container_manager
+    orchestrator._version_control = mock_version_control
+    orchestrator._results_db = mock_results_db
+    orchestrator._search_strategy = BayesianOptimization({"dimensions": 4})
+
+    await orchestrator.run_batch(batch_size=3, parallel=True)
+
+    saved = [call.args[5] for call in mock_results_db.save_gp_state.call_args_list]
+    assert [len(y_train) for y_train in saved] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_reports_exhausted_search_space(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_results_db: Mock,
+):
+    """Test that a failed batch suggestion yields per-index failures."""
+    orchestrator = Orchestrator(config)
+    orchestrator.code_generator = mock_code_generator
+    orchestrator.container_manager = mock_container_manager
+    orchestrator._results_db = mock_results_db
+    orchestrator._search_strategy = RandomSearch({"dimensions": 4, "num_samples": 2})
+
+    results = await orchestrator.run_batch(batch_size=3, parallel=True)
+
+    assert [r["status"] for r in results] == ["failed"] * 3
+    assert "maximum samples" in results[0]["error"]
+    mock_container_manager.create_container.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_yields_in_completion_order(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+):
+    """Test that batch results are streamed as their cycles finish."""
+
+    async def generate_code(arch_spec):
+        return f"code-{arch_spec['num_layers']}"
+
+    async def create_container(spec):
+        return spec["code"]
+
+    async def run_container(container_id):
+        # Later cycles finish first
+        await asyncio.sleep(0.01 * (3 - int(container_id[-1])))
+        return {"status": "success", "results": {"accuracy": 0.9}}
+
+    mock_code_generator.generate_code.side_effect = generate_code
+    mock_container_manager.create_container.side_effect = create_container
+    mock_container_manager.run_container.side_effect = run_container
+    mock_search_strategy.suggest_architectures.side_effect = None
+    mock_search_strategy.suggest_architectures.return_value = [
+        Mock(spec=ArchitectureVector, decode=Mock(return_value={"num_layers": n}))
+        for n in range(3)
+    ]
+    with patch(
+        "neuromosaic.llm_code_gen.providers.OpenAICodeGenerator"
+    ) as mock_gen_cls, patch(
+        "neuromosaic.env_manager.providers.DockerContainerManager"
+    ) as mock_container_cls:
+        mock_gen_cls.return_value = mock_code_generator
+        mock_container_cls.return_value = mock_container_manager
+
+        orchestrator = Orchestrator(config)
+        orchestrator.code_generator = mock_code_generator
+        orchestrator.container_manager = mock_container_manager
+        orchestrator._version_control = mock_version_control
+        orchestrator._results_db = mock_results_db
+        orchestrator._search_strategy = mock_search_strategy
+
+        streamed = [i async for i, result in orchestrator.iter_batch(3)]
+
+    assert streamed == [2, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_coalesces_identical_codegen(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+):
+    """Test that concurrent cycles for one spec share a single LLM call."""
+
+    async def generate_code(arch_spec):
+        await asyncio.sleep(0.01)
+        return "mock code"
+
+    mock_code_generator.generate_code.side_effect = generate_code
+    with patch(
+        "neuromosaic.llm_code_gen.providers.OpenAICodeGenerator"
+    ) as mock_gen_cls, patch(
+        "neuromosaic.env_manager.providers.DockerContainerManager"
+    ) as mock_container_cls:
+        mock_gen_cls.return_value = mock_code_generator
+        mock_container_cls.return_value = mock_container_manager
+
+        orchestrator = Orchestrator(config)
+        orchestrator.code_generator = mock_code_generator
+        orchestrator.container_manager = mock_container_manager
+        orchestrator._version_control = mock_version_control
+        orchestrator._results_db = mock_results_db
+        orchestrator._search_strategy = mock_search_strategy
+
+        results = await orchestrator.run_batch(batch_size=3, parallel=True)
+
+    assert all("metrics" in r for r in results)
+    assert mock_code_generator.generate_code.call_count == 1
+    assert not orchestrator._inflight_codegen
+
+
+@pytest.mark.asyncio
+async def test_run_batch_bounds_concurrency(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+):
+    """Test that no more than max_parallel cycles run at once."""
+    config.orchestrator["max_parallel"] = 2
+    in_flight = peak = 0
+
+    async def run_container(container_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"status": "success", "results": {"accuracy": 0.9}}
+
+    mock_container_manager.run_container.side_effect = run_container
+    with patch(
+        "neuromosaic.llm_code_gen.providers.OpenAICodeGenerator"
+    ) as mock_gen_cls, patch(
+        "neuromosaic.env_manager.providers.DockerContainerManager"
+    ) as mock_container_cls:
+        mock_gen_cls.return_value = mock_code_generator
+        mock_container_cls.return_value = mock_container_manager
+
+        orchestrator = Orchestrator(config)
+        orchestrator.code_generator = mock_code_generator
+        orchestrator.container_manager = mock_container_manager
+        orchestrator._version_control = mock_version_control
+        orchestrator._results_db = mock_results_db
+        orchestrator._search_strategy = mock_search_strategy
+
+        results = await orchestrator.run_batch(batch_size=5, parallel=True)
+
+    assert all("metrics" in r for r in results)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_run_cycle_reuses_code_for_identical_spec(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+):
+    """Test that an identical spec skips code generation and commit."""
+    with patch(
+        "neuromosaic.llm_code_gen.providers.OpenAICodeGenerator"
+    ) as mock_gen_cls, patch(
+        "neuromosaic.env_manager.providers.DockerContainerManager"
+    ) as mock_container_cls:
+        mock_gen_cls.return_value = mock_code_generator
+        mock_container_cls.return_value = mock_container_manager
+
+        orchestrator = Orchestrator(config)
+        orchestrator.code_generator = mock_code_generator
+        orchestrator.container_manager = mock_container_manager
+        orchestrator._version_control = mock_version_control
+        orchestrator._results_db = mock_results_db
+        orchestrator._search_strategy = mock_search_strategy
+
+        first = await orchestrator.run_cycle()
+        second = await orchestrator.run_cycle()
+
+    assert mock_code_generator.generate_code.call_count == 1
+    assert mock_version_control.commit_code.call_count == 1
+    assert mock_container_manager.create_container.call_count == 2
+    assert first["code_version"] == second["code_version"]
+
+
+@pytest.mark.asyncio
+async def test_code_cache_persists_across_orchestrators(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+    tmp_path: Path,
+):
+    """Test that generated code written to disk is reused after a restart."""
+    config.llm.cache["path"] = str(tmp_path / "codegen_cache.db")
+    mock_code_generator.template_version = "v1"
+
+    async def run_fresh_orchestrator():
+        orchestrator = Orchestrator(config)
+        orchestrator.code_generator = mock_code_generator
+        orchestrator.container_manager = mock_container_manager
+        orchestrator._version_control = mock_version_control
+        orchestrator._results_db = mock_results_db
+        orchestrator._search_strategy = mock_search_strategy
+        result = await orchestrator.run_cycle()
+        orchestrator._code_store.close()
+        return result
+
+    with patch(
+        "neuromosaic.llm_code_gen.providers.OpenAICodeGenerator"
+    ) as mock_gen_cls, patch(
+        "neuromosaic.env_manager.providers.DockerContainerManager"
+    ) as mock_container_cls:
+        mock_gen_cls.return_value = mock_code_generator
+        mock_container_cls.return_value = mock_container_manager
+
+        first = await run_fresh_orchestrator()
+        second = await run_fresh_orchestrator()
+
+    assert mock_code_generator.generate_code.call_count == 1
+    assert mock_version_control.commit_code.call_count == 1
+    assert first["code_version"] == second["code_version"]
+
+
+@pytest.mark.asyncio
+async def test_run_cycle_reuses_pooled_container(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+):
+    """Test that keep_alive reuse resets a warm container instead of recreating."""
+    config.container.reuse_strategy = "keep_alive"
+    mock_container_manager.reset_workspace = AsyncMock()
+    with patch(
+        "neuromosaic.llm_code_gen.providers.OpenAICodeGenerator"
+    ) as mock_gen_cls, patch(
+        "neuromosaic.env_manager.providers.DockerContainerManager"
+    ) as mock_container_cls:
+        mock_gen_cls.return_value = mock_code_generator
+        mock_container_cls.return_value = mock_container_manager
+
+        orchestrator = Orchestrator(config)
+        orchestrator.code_generator = mock_code_generator
+        orchestrator.container_manager = mock_container_manager
+        orchestrator._version_control = mock_version_control
+        orchestrator._results_db = mock_results_db
+        orchestrator._search_strategy = mock_search_strategy
+
+        await orchestrator.run_cycle()
+        await orchestrator.run_cycle()
+
+        # Created empty during code generation, then loaded on each cycle
+        mock_container_manager.create_container.assert_awaited_once_with({"code": ""})
+        assert (
+            mock_container_manager.reset_workspace.await_args_list
+            == [(("container-123", {"code": "mock code"}),)] * 2
+        )
+        mock_container_manager.cleanup_container.assert_not_called()
+
+        await orchestrator.close_container_pool()
+        mock_container_manager.cleanup_container.assert_awaited_once_with(
+            "container-123"
+        )
+
+
+@pytest.mark.asyncio
+async def test_next_architecture_prefetched_during_run(
+    config: Config,
+    mock_arch_vector: Mock,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+):
+    """Test that the next suggestion is made while the container trains."""
+    suggestions = 0
+    prefetched = asyncio.Event()
+
+    async def suggest_architectures(num_architectures):
+        nonlocal suggestions
+        suggestions += 1
+        if suggestions == 2:
+            prefetched.set()
+        return [mock_arch_vector]
+
+    async def run_container(container_id):
+        # Only finishes once the next suggestion has been made
+        await prefetched.wait()
+        return {"status": "success", "results": {"accuracy": 0.9}}
+
+    mock_search_strategy.suggest_architectures.side_effect = suggest_architectures
+    mock_container_manager.run_container.side_effect = run_container
+
+    orchestrator = Orchestrator(config)
+    orchestrator.code_generator = mock_code_generator
+    orchestrator.container_manager = mock_container_manager
+    orchestrator._version_control = mock_version_control
+    orchestrator._results_db = mock_results_db
+    orchestrator._search_strategy = mock_search_strategy
+
+    await asyncio.wait_for(orchestrator.run_cycle(), timeout=5)
+    assert suggestions == 2
+
+    # The next cycle uses the prefetched suggestion and prefetches again
+    await orchestrator.run_cycle()
+    await orchestrator._next_arch_task
+    assert suggestions == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetched_suggestion_differs_from_in_flight(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+):
+    """Test that BO does not re-suggest the architecture still training."""
+    strategy = BayesianOptimization({"dimensions": 3, "num_candidates": 256})
+    rng = np.random.default_rng(4)
+    for _ in range(6):
+        vector = ArchitectureVector(3)
+        vector.vector = rng.uniform(size=3)
+        objective = float(np.sin(3 * vector.vector).sum())
+        await strategy.update_with_results(vector, {"objective": objective})
+
+    async def run_container(container_id):
+        # Training yields to the loop, so the next suggestion overlaps it
+        await asyncio.sleep(0.05)
+        return {"status": "success", "results": {"objective": 0.5}}
+
+    mock_container_manager.run_container.side_effect = run_container
+
+    orchestrator = Orchestrator(config)
+    orchestrator.code_generator = mock_code_generator
+    orchestrator.container_manager = mock_container_manager
+    orchestrator._version_control = mock_version_control
+    orchestrator._results_db = mock_results_db
+    orchestrator._search_strategy = strategy
+
+    np.random.seed(0)
+    await orchestrator.run_batch(batch_size=3, parallel=False)
+    await orchestrator.aclose()
+
+    evaluated = np.stack([h["architecture"].vector for h in strategy.history[6:]])
+    gaps = np.linalg.norm(np.diff(evaluated, axis=0), axis=1)
+    assert np.all(gaps > 1e-3)
+    assert not strategy.pending
+
+
+@pytest.mark.asyncio
+async def test_container_acquired_during_code_generation(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+):
+    """Test that a reusable container is readied while the LLM is busy."""
+    config.container.reuse_strategy = "keep_alive"
+    mock_container_manager.reset_workspace = AsyncMock()
+    container_created = asyncio.Event()
+
+    async def create_container(spec):
+        container_created.set()
+        return "container-123"
+
+    async def generate_code(arch_spec):
+        # Only returns once the container exists, so the two must overlap
+        await container_created.wait()
+        return "mock code"
+
+    mock_container_manager.create_container.side_effect = create_container
+    mock_code_generator.generate_code.side_effect = generate_code
+
+    orchestrator = Orchestrator(config)
+    orchestrator.code_generator = mock_code_generator
+    orchestrator.container_manager = mock_container_manager
+    orchestrator._version_control = mock_version_control
+    orchestrator._results_db = mock_results_db
+    orchestrator._search_strategy = mock_search_strategy
+
+    await asyncio.wait_for(orchestrator.run_cycle(), timeout=5)
+    mock_container_manager.reset_workspace.assert_awaited_once_with(
+        "container-123", {"code": "mock code"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_batch_aborts_when_daemon_down(
+    config: Config,
+    mock_code_generator: Mock,
+    mock_container_manager: Mock,
+    mock_version_control: Mock,
+    mock_results_db: Mock,
+    mock_search_strategy: Mock,
+):
+    """Test that a dead container daemon cancels the rest of the batch."""
+    calls = 0
+
+    async def create_container(spec):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ContainerDaemonError("daemon down")
+        await asyncio.sleep(60)
+
+    mock_container_manager.create_container.side_effect = create_container
+    mock_search_strategy.suggest_architectures.side_effect = None
+    mock_search_strategy.suggest_architectures.return_value = [
+        Mock(spec=ArchitectureVector, decode=Mock(return_value={"num_layers": n}))
+        for n in range(3)
+    ]
+
+    with patch(
+        "neuromosaic.llm_code_gen.providers.OpenAICodeGenerator"
+    ) as mock_gen_cls, patch(
+        "neuromosaic.env_manager.providers.DockerContainerManager"
+    ) as mock_container_cls:
+        mock_gen_cls.return_value = mock_code_generator
+        mock_container_cls.return_value = mock_container_manager
+
+        orchestrator = Orchestrator(config)
+        orchestrator.code_generator = mock_code_generator
+        orchestrator.container_manager = mock_container_manager
+        orchestrator._version_control = mock_version_control
+        orchestrator._results_db = mock_results_db
+        orchestrator._search_strategy = mock_search_strategy
+
+        results = await asyncio.wait_for(
+            orchestrator.run_batch(batch_size=3, parallel=True), timeout=5
+        )
+
+    statuses = sorted(r["status"] for r in results)
+    assert statuses == ["cancelled", "cancelled", "failed"]
+    assert mock_search_strategy.discard_pending.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_error_handling(
     config: Config,
@@ -356,3 +1083,218 @@ async def test_error_handling(
 
         # Verify cleanup is called even on failure
         assert mock_container_manager.cleanup_container.called
+
+
+@pytest.mark.asyncio
+async def test_random_search_samples_within_bounds():
+    """Test that random suggestions cover the configured bounds."""
+    strategy = RandomSearch({"dimensions": 8})
+    vectors = [await strategy.suggest_architecture() for _ in range(20)]
+    values = np.stack([v.vector for v in vectors])
+    assert values.min() >= 0.0 and values.max() <= 1.0
+    assert np.unique(values).size == values.size
+
+    bounded = RandomSearch(
+        {"dimensions": 3, "bounds": {"a": (2.0, 3.0), "b": (-1.0, 0.0)}}
+    )
+    vector = (await bounded.suggest_architecture()).vector
+    assert 2.0 <= vector[0] <= 3.0
+    assert -1.0 <= vector[1] <= 0.0
+    assert vector[2] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_random_search_batch_is_drawn_at_once():
+    """Test batch suggestions from one block draw, capped by num_samples."""
+    strategy = RandomSearch({"dimensions": 4, "num_samples": 6})
+
+    vectors = await strategy.suggest_architectures(5)
+
+    values = np.stack([v.vector for v in vectors])
+    assert values.shape == (5, 4)
+    assert np.unique(values).size == values.size
+    assert len(strategy.pending) == 5
+    assert strategy.current_sample == 5
+    with pytest.raises(SearchSpaceExhausted):
+        await strategy.suggest_architectures(2)
+    assert len(strategy.pending) == 5
+
+
+@pytest.mark.asyncio
+async def test_suggest_architectures_fantasizes_pending():
+    """Test that batch suggestions are tracked as pending until told."""
+    strategy = RandomSearch({"dimensions": 8})
+    first = ArchitectureVector(8)
+    await strategy.update_with_results(first, {"objective": 0.2})
+
+    vectors = await strategy.suggest_architectures(3, pending_fantasy="mean")
+
+    assert len(vectors) == 3
+    assert len(strategy.pending) == 3
+    assert all(p["results"]["objective"] == 0.2 for p in strategy.pending)
+
+    strategy._real_register(vectors[0], {"objective": 0.9})
+    strategy.discard_pending(vectors[1])
+
+    assert [p["architecture"] for p in strategy.pending] == [vectors[2]]
+    assert len(strategy.history) == 2
+
+
+@pytest.mark.asyncio
+async def test_bayesopt_batch_fits_gp_once():
+    """Test that a BO batch does one full fit and believes the GP mean."""
+    from neuromosaic.orchestrator.strategies import bayesopt_strategy
+
+    strategy = BayesianOptimization({"dimensions": 4})
+    rng = np.random.default_rng(1)
+    for _ in range(6):
+        vector = ArchitectureVector(4)
+        vector.vector = rng.uniform(size=4)
+        await strategy.update_with_results(vector, {"objective": rng.uniform()})
+
+    with patch.object(
+        bayesopt_strategy, "cholesky", wraps=bayesopt_strategy.cholesky
+    ) as spy:
+        vectors = await strategy.suggest_architectures(3)
+
+    assert [call.args[0].shape for call in spy.call_args_list] == [
+        (6, 6),
+        (1, 1),
+        (1, 1),
+    ]
+    for vector, pending in zip(vectors, strategy.pending):
+        mean, _ = strategy.gp.predict(vector.vector.reshape(1, -1))
+        assert pending["results"]["objective"] == pytest.approx(mean[0], abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_bayesopt_refines_best_screened_candidates():
+    """Test that L-BFGS-B only starts from the top screened candidates."""
+    from neuromosaic.orchestrator.strategies import bayesopt_strategy
+
+    strategy = BayesianOptimization(
+        {"dimensions": 2, "num_candidates": 64, "num_restarts": 3}
+    )
+    rng = np.random.default_rng(2)
+    for _ in range(4):
+        vector = ArchitectureVector(2)
+        vector.vector = rng.uniform(size=2)
+        await strategy.update_with_results(vector, {"objective": rng.uniform()})
+
+    with patch.object(
+        bayesopt_strategy, "minimize", wraps=bayesopt_strategy.minimize
+    ) as spy:
+        vector = await strategy.suggest_architecture()
+
+    assert spy.call_count == 3
+    starts = np.stack([call.args[1] for call in spy.call_args_list])
+    start_scores = strategy._acquisition_batch(starts)
+    assert strategy._acquisition(vector.vector) >= start_scores.max()
+    np.testing.assert_allclose(
+        start_scores, [strategy._acquisition(x) for x in starts], rtol=1e-9
+    )
+
+
+@pytest.mark.asyncio
+async def test_bayesopt_refine_improves_every_start():
+    """Test that L-BFGS-B makes progress, which FP32 gradients prevented."""
+    from neuromosaic.orchestrator.strategies import bayesopt_strategy
+
+    strategy = BayesianOptimization(
+        {"dimensions": 4, "num_candidates": 256, "num_restarts": 5}
+    )
+    rng = np.random.default_rng(3)
+    for _ in range(12):
+        vector = ArchitectureVector(4)
+        vector.vector = rng.uniform(size=4)
+        objective = float(np.sin(3 * vector.vector).sum())
+        await strategy.update_with_results(vector, {"objective": objective})
+
+    runs = []
+
+    def recording_minimize(fun, x0, **kwargs):
+        res = minimize(fun, x0, **kwargs)
+        runs.append((x0, res.x))
+        return res
+
+    minimize = bayesopt_strategy.minimize
+    np.random.seed(0)
+    with patch.object(bayesopt_strategy, "minimize", recording_minimize):
+        vector = await strategy.suggest_architecture()
+
+    starts, refined = map(np.stack, zip(*runs))
+    start_scores = strategy._log_acquisition_batch(starts)
+    refined_scores = strategy._log_acquisition_batch(refined)
+    assert np.all(refined_scores > start_scores + 1e-3)
+    best = strategy._log_acquisition_batch(vector.vector.reshape(1, -1))[0]
+    assert best == pytest.approx(refined_scores.max(), rel=1e-9)
+
+
+def test_log_h_is_stable():
+    """Test log-space EI against the direct form and far into the tail."""
+    from scipy.stats import norm
+
+    z = np.linspace(-8, 5, 200)
+    np.testing.assert_allclose(
+        _log_h(z), np.log(z * norm.cdf(z) + norm.pdf(z)), rtol=1e-9
+    )
+
+    tail = -np.logspace(1.5, 9, 50)
+    log_h = _log_h(tail)
+    assert np.all(np.isfinite(log_h))
+    assert np.all(np.diff(log_h) < 0)
+
+
+def test_gaussian_process_reuses_cholesky_prefix():
+    """Test that refitting on extended data matches a from-scratch fit."""
+    rng = np.random.default_rng(0)
+    X = rng.uniform(size=(12, 4))
+    y = rng.uniform(size=12)
+
+    incremental = GaussianProcess(kernel="matern")
+    incremental.fit(X[:8], y[:8])
+    incremental.fit(X, y)
+
+    scratch = GaussianProcess(kernel="matern")
+    scratch.fit(X, y)
+
+    np.testing.assert_allclose(incremental.L, scratch.L, atol=1e-8)
+    mean, variance = incremental.predict(X[:2])
+    np.testing.assert_allclose(mean, y[:2], atol=1e-3)
+    assert np.all(variance >= 0)
+
+    # FP32 cross-covariance stays close to the FP64 reference
+    X_query = rng.uniform(size=(5, 4))
+    reference_mean = scratch._kernel(X_query, X) @ scratch.alpha
+    np.testing.assert_allclose(scratch.predict(X_query)[0], reference_mean, rtol=1e-9)
+    np.testing.assert_allclose(
+        scratch.predict(X_query, fp32=True)[0], reference_mean, atol=1e-3
+    )
+
+
+def test_gaussian_process_rejects_inconsistent_state():
+    """Test that restoring arrays of mismatched sizes fails loudly."""
+    gp = GaussianProcess()
+    gp.fit(np.eye(3), np.zeros(3))
+    state = dict(gp.get_state(), y_train=np.zeros(2))
+
+    with pytest.raises(ValueError, match="Inconsistent GP state"):
+        GaussianProcess().set_state(state)
+
+
+def test_semantic_code_cache():
+    """Test exact, near-duplicate and evicted lookups in the code cache."""
+    cache = SemanticCodeCache(max_size=2, threshold=0.98)
+    base = np.array([0.2, 0.5, 0.9, 0.1])
+
+    cache.put(b"a", "code-a", base, namespace="v1")
+    assert cache.get(b"a") is None  # different namespace
+    assert cache.get(b"a", namespace="v1") == "code-a"
+    assert cache.get(b"near", base + 0.01, namespace="v1") == "code-a"
+    assert cache.get(b"far", base[::-1], namespace="v1") is None
+
+    cache.put(b"b", "code-b", base[::-1], namespace="v1")
+    cache.put(b"c", "code-c", namespace="v1")
+    assert len(cache) == 2
+    assert cache.get(b"a", namespace="v1") is None
+    assert cache.get(b"near", base + 0.01, namespace="v1") is None
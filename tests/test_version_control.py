@@ -0,0 +1,69 @@
+"""Tests for the version control utilities."""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from neuromosaic.utils.version_control import VersionControl
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create an empty git repository and make it the working directory."""
+    monkeypatch.chdir(tmp_path)
+    subprocess.run(["git", "init", "-q"], check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], check=True)
+    subprocess.run(["git", "config", "user.name", "Test"], check=True)
+    subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", "init"], check=True)
+    return tmp_path
+
+
+def _commit_count() -> int:
+    result = subprocess.run(
+        ["git", "rev-list", "--count", "HEAD"], capture_output=True, text=True
+    )
+    return int(result.stdout)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commits_are_grouped(git_repo: Path):
+    """Test that code committed concurrently lands in few shared commits."""
+    vc = VersionControl()
+
+    hashes = await asyncio.gather(*(vc.commit_code(f"model = {i}\n") for i in range(8)))
+
+    assert len(set(hashes)) == 1
+    assert _commit_count() == 2
+    assert len(list((git_repo / "generated_code").glob("model_*.py"))) == 8
+    status = subprocess.run(
+        ["git", "status", "--porcelain"], capture_output=True, text=True
+    )
+    assert status.stdout == ""
+
+
+@pytest.mark.asyncio
+async def test_stage_then_commit_staged(git_repo: Path):
+    """Test staging code and committing it explicitly."""
+    vc = VersionControl()
+
+    first = vc.stage_code("a = 1\n")
+    assert vc.stage_code("a = 1\n") == first
+    vc.stage_code("b = 2\n")
+    commit = vc.commit_staged()
+
+    assert commit == VersionControl.get_current_commit()
+    assert _commit_count() == 2
+
+
+@pytest.mark.parametrize("pack_refs", [False, True])
+def test_get_current_commit_matches_git(git_repo: Path, pack_refs: bool):
+    """Test that HEAD read from the repository files matches git."""
+    if pack_refs:
+        subprocess.run(["git", "pack-refs", "--all"], check=True)
+    expected = subprocess.run(
+        ["git", "rev-parse", "HEAD"], capture_output=True, text=True
+    ).stdout.strip()
+
+    assert VersionControl.get_current_commit() == expected